@@ -0,0 +1,76 @@
+"""
+[병렬 실행기 확장성 벤치마크]
+
+ParallelBatchRunner의 워커 수별 처리량(records/sec)과 단일 프로세스 대비 속도 향상(Speedup)을 측정합니다.
+결과는 표 형태로 출력되며, --output 지정 시 JSON으로도 저장됩니다.
+
+Usage:
+    # 위치: experiments\Rule-based_BodyAnalysis\
+    python benchmarks/bench_parallel.py --records 200000 --workers 1 2 4 8 16 32
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from synthetic import SyntheticRecordGenerator  # noqa: E402
+from body_analysis.parallel import ParallelBatchRunner  # noqa: E402
+
+
+def default_worker_counts():
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=100000)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    parser.add_argument("--chunk-size", type=int, default=ParallelBatchRunner.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    records = SyntheticRecordGenerator().records(args.records)
+    rows = []
+    baseline = None
+    for workers in args.workers or default_worker_counts():
+        runner = ParallelBatchRunner(workers=workers, chunk_size=args.chunk_size)
+        start = time.perf_counter()
+        result = runner.run(records)
+        elapsed = time.perf_counter() - start
+        assert len(result.results) == len(records)
+        throughput = len(records) / elapsed
+        baseline = baseline or throughput
+        rows.append({
+            "workers": workers,
+            "seconds": round(elapsed, 4),
+            "records_per_sec": round(throughput, 1),
+            "speedup": round(throughput / baseline, 2),
+            "efficiency": round(throughput / baseline / workers, 2),
+        })
+        print(f"workers={workers:>3}  {elapsed:8.2f}s  {throughput:12,.0f} rec/s  "
+              f"speedup x{rows[-1]['speedup']:.2f}  efficiency {rows[-1]['efficiency']:.0%}")
+
+    if args.output:
+        report = {
+            "benchmark": "parallel_scaling",
+            "records": args.records,
+            "chunk_size": args.chunk_size,
+            "cpu_count": os.cpu_count(),
+            "results": rows,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
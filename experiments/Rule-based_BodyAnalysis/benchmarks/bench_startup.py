@@ -0,0 +1,123 @@
+"""
+[패키지 시작(Cold Start) 벤치마크]
+
+새 Python 프로세스에서 body_analysis의 import 시간과 첫 분석 호출 지연 시간을 측정합니다.
+스칼라 분석 경로가 NumPy, json, logging 등 무거운 모듈을 로드하지 않는지도 함께 검사하여,
+위반 시(또는 --budget-ms 초과 시) 종료 코드 1을 반환합니다.
+
+Usage:
+    # 위치: experiments\Rule-based_BodyAnalysis\
+    python benchmarks/bench_startup.py --runs 20 --output startup.json
+    python benchmarks/bench_startup.py --budget-ms 50
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+# 스칼라 경로(import + analyze_full_pipeline)에서 로드되면 안 되는 모듈
+FORBIDDEN_MODULES = (
+    "numpy", "json", "logging", "traceback", "concurrent.futures", "multiprocessing",
+    "body_analysis.batch", "body_analysis.cache", "body_analysis.parallel", "body_analysis.stream",
+)
+
+# 자식 프로세스에서 실행할 측정 코드 (json도 로드 금지 대상이므로 결과는 stdout에 dict 리터럴 한 줄)
+_PROBE = r"""
+import sys, time
+t0 = time.perf_counter()
+import body_analysis
+t1 = time.perf_counter()
+from body_analysis import BodyCompositionAnalyzer
+t2 = time.perf_counter()
+analyzer = BodyCompositionAnalyzer(fast_path=FAST_PATH)
+record = {
+    "sex": "남성", "age": 25, "height_cm": 175, "weight_kg": 70,
+    "bmi": 23.1, "fat_rate": 15.2, "smm": 25.4,
+    "muscle_seg": {"왼팔": 2.1, "오른팔": 2.2, "몸통": 10.3, "왼다리": 12.4, "오른다리": 12.5},
+    "fat_seg": {"왼팔": 1.1, "오른팔": 1.2, "몸통": 4.3, "왼다리": 6.4, "오른다리": 6.5},
+}
+analyzer.analyze_full_pipeline(record)
+t3 = time.perf_counter()
+analyzer.analyze_full_pipeline(record)
+t4 = time.perf_counter()
+loaded = [m for m in FORBIDDEN if m in sys.modules]
+print(repr({
+    "package_import_ms": (t1 - t0) * 1e3,
+    "analyzer_import_ms": (t2 - t1) * 1e3,
+    "first_call_ms": (t3 - t2) * 1e3,
+    "second_call_ms": (t4 - t3) * 1e3,
+    "total_ms": (t3 - t0) * 1e3,
+    "forbidden_loaded": loaded,
+}))
+"""
+
+METRICS = ("package_import_ms", "analyzer_import_ms", "first_call_ms", "second_call_ms", "total_ms")
+
+
+def run_once(fast_path):
+    code = _PROBE.replace("FAST_PATH", repr(fast_path)).replace("FORBIDDEN", repr(FORBIDDEN_MODULES))
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=PACKAGE_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return eval(out.strip().splitlines()[-1], {})  # noqa: S307 - 자식 프로세스가 출력한 dict 리터럴
+
+
+def measure(name, runs, fast_path):
+    samples = [run_once(fast_path) for _ in range(runs)]
+    result = {"name": name, "runs": runs}
+    for metric in METRICS:
+        result[metric] = round(statistics.median(s[metric] for s in samples), 3)
+    result["forbidden_loaded"] = sorted({m for s in samples for m in s["forbidden_loaded"]})
+    print(
+        f"{name:<12} import {result['package_import_ms']:6.2f} ms + analyzer {result['analyzer_import_ms']:6.2f} ms"
+        f" + first call {result['first_call_ms']:6.3f} ms = {result['total_ms']:6.2f} ms"
+        f"  (second call {result['second_call_ms'] * 1e3:.1f} us)"
+    )
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="body_analysis 시작 비용 벤치마크")
+    parser.add_argument("--runs", type=int, default=15, help="측정할 프로세스 수 (중앙값 사용)")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="import + 첫 호출 합계(중앙값)의 허용 상한 (ms)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    results = [
+        measure("staged", args.runs, fast_path=False),
+        measure("fast_path", args.runs, fast_path=True),
+    ]
+
+    failures = []
+    for r in results:
+        if r["forbidden_loaded"]:
+            failures.append(f"{r['name']}: 스칼라 경로에서 로드된 모듈 {r['forbidden_loaded']}")
+        if args.budget_ms is not None and r["total_ms"] > args.budget_ms:
+            failures.append(f"{r['name']}: {r['total_ms']:.2f} ms > 예산 {args.budget_ms} ms")
+    for failure in failures:
+        print(f"[FAIL] {failure}")
+
+    if args.output:
+        report = {
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                # 바이트코드 캐시를 쓰지 않는 환경에서는 import 시간에 컴파일 시간이 포함됩니다.
+                "dont_write_bytecode": sys.flags.dont_write_bytecode,
+            },
+            "results": results,
+            "failures": failures,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,677 @@
+"""
+[body_analysis 벤치마크 스위트]
+
+합성 레코드(synthetic.py)로 스칼라 파이프라인, 부위별 정규화, 엔드투엔드(JSONL) 처리량과
+배치 분석 성능을 측정하고, 결과를 JSON으로 저장하여 커밋 간 성능 회귀를 비교할 수 있게 합니다.
+측정 전에 배치/결정 테이블 경로가 스칼라 경로와 같은 결과를 내는지 일관성 검증을 함께 수행합니다.
+
+Usage:
+    # 위치: experiments\Rule-based_BodyAnalysis\
+    python benchmarks/run_benchmarks.py --records 20000 --output bench_results.json
+    python benchmarks/run_benchmarks.py --compare bench_results.json   # 이전 결과 대비 회귀 확인
+"""
+
+import argparse
+import io
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from synthetic import SyntheticRecordGenerator  # noqa: E402
+from body_analysis import constants as Constants  # noqa: E402
+from body_analysis.pipeline import BodyCompositionAnalyzer  # noqa: E402
+from body_analysis.segmental import DataNormalizer, SegmentalAnalyzer  # noqa: E402
+from body_analysis.models import BodyCompositionData  # noqa: E402
+from body_analysis.metrics import BMIClassifier, BodyFatClassifier, MuscleClassifier  # noqa: E402
+from body_analysis.stages import (  # noqa: E402
+    BODY_TYPE_LABELS, Stage12DecisionTable, Stage1BodyTypeClassifier, Stage2MuscleAdjuster,
+)
+from body_analysis.stream import JsonlStreamAnalyzer  # noqa: E402
+
+MARGIN = Constants.ValidationLimits.DEFAULT_MARGIN
+
+
+# ----------------------------------------------------------------------
+# 일관성 검증
+# ----------------------------------------------------------------------
+
+def check_decision_table():
+    """결정 테이블이 Stage 1/2 규칙 함수와 전 조합에서 일치하는지 확인"""
+    mismatches = 0
+    for (b, bmi_cat), (f, fat_cat), (m, muscle_level) in itertools.product(
+        enumerate(BMIClassifier.LABELS),
+        enumerate(BodyFatClassifier.LABELS),
+        enumerate(MuscleClassifier.LABELS),
+    ):
+        stage1_type = Stage1BodyTypeClassifier.classify(bmi_cat, fat_cat, muscle_level)
+        stage2_type = Stage2MuscleAdjuster.adjust(stage1_type, muscle_level)
+        stage1_code, stage2_code = Stage12DecisionTable.lookup(b, f, m)
+        if (BODY_TYPE_LABELS[stage1_code], BODY_TYPE_LABELS[stage2_code]) != (stage1_type, stage2_type):
+            mismatches += 1
+    return mismatches
+
+
+def check_batch(records, analyzer):
+    """
+    배치 분석 결과가 레코드별 analyze_full_pipeline과 일치하는지 확인 (수치형 레코드)
+    (딕셔너리가 아닌 레코드가 섞인 배치도 함께 확인)
+    """
+    from body_analysis.batch import BatchAnalyzer
+
+    expected = [analyzer.analyze_full_pipeline(r) for r in records]
+    got = analyzer.analyze_batch(**BatchAnalyzer.records_to_columns(records))
+    return check_batch_malformed(records[:4], analyzer) + sum(
+        1 for i, e in enumerate(expected)
+        if e["stage2"] != got["stage2"][i] or e["stage3"] != got["stage3"][i]
+    )
+
+
+def check_batch_malformed(records, analyzer):
+    """
+    딕셔너리가 아닌 레코드(None 등)가 섞여도 배치가 끝까지 실행되고, 나머지 행은 스칼라 결과와 같으며
+    해당 행은 Stage 2가 '알 수 없음'이고 검증기가 MALFORMED로 격리하는지 확인 (불일치 건수)
+    """
+    from body_analysis.batch import BatchAnalyzer
+    from body_analysis.validation import RecordValidator, ValidationReason
+
+    malformed = [None, "oops", 3, ["x"]]
+    records = [r for pair in zip(records, malformed) for r in pair]
+    try:
+        got = analyzer.analyze_batch(**BatchAnalyzer.records_to_columns(records))
+    except TypeError:
+        return len(records)
+    codes = RecordValidator().validate_records(records)
+    mismatches = 0
+    for i, r in enumerate(records):
+        expected = analyzer.analyze_full_pipeline(r)
+        if isinstance(r, dict):
+            mismatches += expected["stage2"] != got["stage2"][i] or expected["stage3"] != got["stage3"][i]
+        else:
+            mismatches += expected["stage2"] != got["stage2"][i] or not codes[i] & ValidationReason.MALFORMED
+    return mismatches
+
+
+def check_batch_overflow(records, analyzer):
+    """float로 변환할 수 없는 부위 값(10**400)이 섞여도 배치가 끝까지 실행되고, 나머지 행은 스칼라 결과와 같은지 확인"""
+    from body_analysis.batch import BatchAnalyzer
+    from body_analysis.validation import RecordValidator
+
+    records = list(records)
+    bad = dict(records[0], muscle_seg=dict(records[0]["muscle_seg"], **{Constants.BodyPartKeys.LEFT_ARM: 10 ** 400}))
+    records[0] = bad
+    try:
+        got = analyzer.analyze_batch(**BatchAnalyzer.records_to_columns(records))
+    except OverflowError:
+        return len(records)
+    mismatches = check_batch(records[1:], analyzer) + int(RecordValidator().validate_records([bad])[0] == 0)
+    return mismatches + int(len(got["stage2"]) != len(records))
+
+
+def check_segmental_batch(numeric_records):
+    """부위별 배치 정규화 결과가 레코드별 DataNormalizer 결과와 일치하는지 확인 (부위 단위 불일치 수)"""
+    from body_analysis.batch import BatchAnalyzer
+
+    columns = BatchAnalyzer.records_to_columns(numeric_records)
+    labels = DataNormalizer.grade_labels(
+        DataNormalizer.normalize_muscle_segment_batch(columns["muscle_seg"], columns["smm"], MARGIN)
+    )
+    mismatches = 0
+    for i, record in enumerate(numeric_records):
+        data = BodyCompositionData.from_dict(record)
+        expected = DataNormalizer.normalize_muscle_segment(data.muscle_seg, data.smm, MARGIN)
+        mismatches += sum(
+            expected[key] != labels[i, col] for col, key in enumerate(Constants.BodyPartKeys.ORDER)
+        )
+    return mismatches
+
+
+def check_compact(records):
+    """
+    CompactBodyCompositionData가 BodyCompositionData와 같은 상세 결과를 내는지 확인 (불일치 건수)
+    (Decimal / 추가 키 / 일부 부위만 있는 등급 / double 범위를 넘는 정수 / bool 부위 값 포함)
+    """
+    from decimal import Decimal
+    from body_analysis.models import CompactBodyCompositionData
+
+    keys = Constants.BodyPartKeys.ORDER
+    numeric = {k: 1.0 + i for i, k in enumerate(keys)}
+    segments = [
+        {k: Decimal(str(v)) for k, v in numeric.items()},
+        dict(numeric, note="x"),
+        {keys[0]: "표준이상"},
+        dict(numeric, **{keys[0]: 10 ** 400}),
+        dict(numeric, **{keys[0]: 2 ** 53 + 1}),
+        dict(numeric, **{keys[0]: True}),
+        {k: numeric[k] for k in keys[1:]},
+    ]
+    records = [r for r in records if isinstance(r, dict)]
+    records += [
+        dict(record, muscle_seg=seg, fat_seg=seg) for record in records[:20] for seg in segments
+    ]
+    analyzer = BodyCompositionAnalyzer(margin=MARGIN)
+    # NaN BMI 등은 nan != nan이므로 JSON 문자열로 비교합니다.
+    return sum(
+        json.dumps(analyzer.analyze_report(BodyCompositionData.from_dict(r)), ensure_ascii=False, default=str)
+        != json.dumps(analyzer.analyze_report(CompactBodyCompositionData.from_dict(r)), ensure_ascii=False, default=str)
+        for r in records
+    )
+
+
+def check_fast_path(seed, n):
+    """단일 패스 경로(fast_path=True)가 단계별 경로와 일치하는지 확인 (비정상 입력 50% 포함)"""
+    records = SyntheticRecordGenerator(seed=seed).corrupted_records(n)
+    mismatches = 0
+    for margin in (MARGIN, 0.0, float("nan"), "x"):
+        staged = BodyCompositionAnalyzer(margin=margin)
+        fused = BodyCompositionAnalyzer(margin=margin, fast_path=True)
+        mismatches += sum(
+            staged.analyze_full_pipeline(r) != fused.analyze_full_pipeline(r) for r in records
+        )
+    return mismatches
+
+
+def edge_records(records):
+    """
+    분류 경계값 바로 위/아래 값과 타입만 다른 값(문자열, Decimal)을 가진 레코드 생성
+    (반올림하면 같아지는 값이 서로 다른 라벨을 받는 경우를 만들기 위한 입력)
+    """
+    from decimal import Decimal
+
+    edge_values = {
+        "bmi": [getattr(Constants.BMIThreshold, name) for name in ("UNDERWEIGHT", "NORMAL", "OVERWEIGHT", "OBESE_1", "OBESE_2")],
+        "fat_rate": [Constants.BodyFatThreshold.LOW, Constants.BodyFatThreshold.NORMAL, Constants.BodyFatThreshold.OVERWEIGHT],
+    }
+    ratios = [Constants.MuscleRatioThreshold.NORMAL, Constants.MuscleRatioThreshold.SUFFICIENT,
+              Constants.MuscleRatioThreshold.HIGH, Constants.MuscleRatioThreshold.VERY_HIGH]
+    result = []
+    for record in records:
+        for delta in (-0.04, -0.01, 0.0, 0.01, 0.04):
+            for field, edges in edge_values.items():
+                result.extend(dict(record, **{field: round(edge + delta, 2)}) for edge in edges)
+            if isinstance(record.get("weight_kg"), (int, float)):
+                result.extend(dict(record, smm=round(record["weight_kg"] * ratio + delta, 2)) for ratio in ratios)
+        result.append(dict(record, weight_kg=str(record.get("weight_kg"))))
+        if SegmentalAnalyzer.is_numeric_data(record.get("muscle_seg")):
+            muscle_seg = record["muscle_seg"]
+            result.append(dict(record, muscle_seg={k: Decimal(str(v)) for k, v in muscle_seg.items()}))
+            result.extend(
+                dict(record, muscle_seg=dict(muscle_seg, **{key: round(muscle_seg[key] * (1 + d), 2)}))
+                for key in Constants.BodyPartKeys.ORDER[:2] for d in (-MARGIN - 0.004, -MARGIN, MARGIN, MARGIN + 0.004)
+            )
+    return result
+
+
+def check_cache(records):
+    """
+    캐시를 켜도 결과가 캐시 미사용 시와 같고(경계값 근처 / 타입만 다른 입력 포함),
+    규칙 상수를 바꾸면 캐시가 무효화되는지 확인 (불일치 건수)
+    """
+    records = records + edge_records(records[:50])
+    staged = BodyCompositionAnalyzer(margin=MARGIN)
+    cached = BodyCompositionAnalyzer(margin=MARGIN, cache_size=len(records))
+    small = BodyCompositionAnalyzer(margin=MARGIN, cache_size=64, fast_path=True)
+    original = Constants.BMIThreshold.NORMAL
+    mismatches = 0
+    try:
+        for bmi_normal in (original, 23.5, original):
+            Constants.BMIThreshold.NORMAL = bmi_normal
+            for _ in range(2):  # 두 번째 반복은 캐시 적중
+                for r in records:
+                    expected = staged.analyze_full_pipeline(r)
+                    mismatches += cached.analyze_full_pipeline(r) != expected
+                    mismatches += small.analyze_full_pipeline(r) != expected
+    finally:
+        Constants.BMIThreshold.NORMAL = original
+    return mismatches
+
+
+def check_failure_isolation():
+    """실패 결과를 수정해도 다음 실패 결과(다른 분석기, 캐시/상세 결과 포함)에 영향이 없는지 확인 (오염된 결과 수)"""
+    expected = dict(BodyCompositionAnalyzer().analyze_full_pipeline("oops"))
+    expected_report = dict(BodyCompositionAnalyzer().analyze_report("oops"))
+    for result in (
+        BodyCompositionAnalyzer().analyze_full_pipeline("oops"),
+        BodyCompositionAnalyzer().analyze_report("oops"),
+    ):
+        for key in result:
+            result[key] = "HACKED"
+    return sum(
+        result != reference
+        for result, reference in (
+            (BodyCompositionAnalyzer().analyze_full_pipeline("oops"), expected),
+            (BodyCompositionAnalyzer(cache_size=4).analyze_full_pipeline("oops"), expected),
+            (BodyCompositionAnalyzer(fast_path=True).analyze_full_pipeline("oops"), expected),
+            (BodyCompositionAnalyzer().analyze_report("oops"), expected_report),
+        )
+    )
+
+
+def check_validation():
+    """main_test.py 샘플(정상 결과지)이 기본 / 부위별 합계 검사 설정 모두에서 격리되지 않는지 확인 (격리 건수)"""
+    from main_test import get_test_input_from_inbody
+    from body_analysis.validation import RecordValidator
+
+    sample = get_test_input_from_inbody()
+    return sum(
+        int(RecordValidator(segment_sums=segment_sums).validate_records([sample])[0] != 0)
+        for segment_sums in (False, True)
+    )
+
+
+def check_sweep(numeric_records):
+    """임계값 스윕 결과가 constants.py를 해당 값으로 바꾼 뒤의 배치 분석 결과와 일치하는지 확인"""
+    from body_analysis.batch import BatchAnalyzer
+    from body_analysis.sweep import ThresholdSet, ThresholdSweep
+
+    columns = BatchAnalyzer.records_to_columns(numeric_records)
+    sweep = ThresholdSweep(**columns)
+    candidates = [
+        ThresholdSet(),
+        ThresholdSet({"BMIThreshold.NORMAL": 24.0, "BodyFatThreshold.NORMAL": 18.0}),
+        ThresholdSet({"MuscleRatioThreshold.HIGH": 0.48, "ValidationLimits.DEFAULT_MARGIN": 0.05}),
+    ]
+    mismatches = 0
+    for thresholds in candidates:
+        got = sweep.labels(thresholds)
+        original = ThresholdSet.current_values()
+        try:
+            for key, value in thresholds.values.items():
+                cls, attr = key.split(".")
+                setattr(getattr(Constants, cls), attr, value)
+            expected = BatchAnalyzer.analyze(**columns, margin=thresholds.margin)
+        finally:
+            for key, value in original.items():
+                cls, attr = key.split(".")
+                setattr(getattr(Constants, cls), attr, value)
+        mismatches += int((got["stage2"] != expected["stage2"]).sum() + (got["stage3"] != expected["stage3"]).sum())
+    return mismatches
+
+
+def check_store(numeric_records):
+    """컬럼 저장소에 기록 후 메모리 매핑으로 읽은 컬럼이 records_to_columns() 결과와 같은지 확인 (불일치 컬럼 수)"""
+    import tempfile
+    import numpy as np
+    from body_analysis.batch import BatchAnalyzer
+    from body_analysis.store import ColumnStore, write_records
+
+    expected = BatchAnalyzer.records_to_columns(numeric_records)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "records.bacols"
+        write_records(path, numeric_records, chunk_size=max(1, len(numeric_records) // 3))
+        store = ColumnStore(path)
+        return sum(
+            not np.array_equal(store.column(name), values, equal_nan=True)
+            for name, values in expected.items()
+        )
+
+
+def check_stratified(records, numeric_records):
+    """성별/연령대별 임계값 표 사용 시 단계별 / 단일 패스 / 캐시 / 배치 경로의 결과가 같은지 확인 (불일치 건수)"""
+    from body_analysis.batch import BatchAnalyzer
+    from body_analysis.thresholds import ThresholdTable
+
+    table = ThresholdTable.stratified()
+    staged = BodyCompositionAnalyzer(margin=MARGIN, thresholds=table)
+    fused = BodyCompositionAnalyzer(margin=MARGIN, thresholds=table, fast_path=True)
+    cached = BodyCompositionAnalyzer(margin=MARGIN, thresholds=table, cache_size=len(records))
+    mismatches = 0
+    for r in records:
+        expected = staged.analyze_full_pipeline(r)
+        mismatches += fused.analyze_full_pipeline(r) != expected
+        mismatches += cached.analyze_full_pipeline(r) != expected
+
+    expected = [staged.analyze_full_pipeline(r) for r in numeric_records]
+    result = staged.analyze_batch(**BatchAnalyzer.records_to_columns(numeric_records, basic_info=True))
+    mismatches += sum(
+        e["stage2"] != s2 or e["stage3"] != s3
+        for e, s2, s3 in zip(expected, result["stage2"], result["stage3"])
+    )
+    return int(mismatches)
+
+
+def check_reindex(numeric_records):
+    """임계값/margin 변경 후 증분 재분석 결과가 전체 재분석 결과와 같은지 확인 (불일치 라벨 수)"""
+    from body_analysis.batch import BatchAnalyzer
+    from body_analysis.reindex import IncrementalAnalyzer
+
+    columns = BatchAnalyzer.records_to_columns(numeric_records)
+    incremental = IncrementalAnalyzer(**columns, margin=MARGIN)
+    original = (Constants.BMIThreshold.NORMAL, Constants.BodyFatThreshold.NORMAL)
+    mismatches = 0
+    try:
+        for bmi_normal, fat_normal, margin in ((23.5, 20.0, MARGIN), (23.5, 18.0, 0.05), original + (MARGIN,)):
+            Constants.BMIThreshold.NORMAL, Constants.BodyFatThreshold.NORMAL = bmi_normal, fat_normal
+            incremental.refresh(margin)
+            expected = BatchAnalyzer.analyze(**columns, margin=margin)
+            mismatches += int(
+                (incremental.results["stage2"] != expected["stage2"]).sum()
+                + (incremental.results["stage3"] != expected["stage3"]).sum()
+                + incremental.stale().sum()
+            )
+    finally:
+        Constants.BMIThreshold.NORMAL, Constants.BodyFatThreshold.NORMAL = original
+    return mismatches
+
+
+def check_encoding(records, analyzer):
+    """
+    analyze_report() 결과를 이진 인코딩 -> 바이트 -> 디코딩했을 때 원래 결과와 같은지 확인 (불일치 건수)
+    (정규화에 실패해 원본 부위별 데이터가 그대로 전달된 결과도 포함합니다)
+    """
+    from body_analysis.encoding import ResultCodec
+
+    results = [analyzer.analyze_report(r) for r in records]
+    raw = {"왼팔": None, "오른팔": "표준", "몸통": "표준", "왼다리": "표준", "오른다리": "표준"}
+    results.append(dict(results[0], muscle_seg=raw, fat_seg=[1.0, 2.0]))
+    codec = ResultCodec()
+    decoded_codec, encoded = ResultCodec.from_bytes(codec.to_bytes(codec.encode(results)))
+    decoded = decoded_codec.decode(encoded, [r["basic_info"] for r in results])
+    # NaN BMI 등은 nan != nan이므로 JSON 문자열로 비교합니다.
+    return sum(
+        json.dumps(a, ensure_ascii=False) != json.dumps(b, ensure_ascii=False)
+        for a, b in zip(results, decoded)
+    )
+
+
+def run_checks(numeric_records, seed=0):
+    analyzer = BodyCompositionAnalyzer(margin=MARGIN)
+    return {
+        "fast_path_mismatches": check_fast_path(seed, len(numeric_records)),
+        "decision_table_mismatches": check_decision_table(),
+        "batch_mismatches": check_batch(numeric_records, analyzer),
+        "compact_mismatches": check_compact(SyntheticRecordGenerator(seed=seed).corrupted_records(2000)),
+        "batch_overflow_mismatches": check_batch_overflow(numeric_records[:1000], analyzer),
+        "segmental_batch_mismatches": check_segmental_batch(numeric_records),
+        "cache_mismatches": check_cache(SyntheticRecordGenerator(seed=seed).records(2000)),
+        "failure_result_leaks": check_failure_isolation(),
+        "validation_sample_quarantined": check_validation(),
+        "sweep_mismatches": check_sweep(numeric_records),
+        "store_mismatches": check_store(numeric_records),
+        "stratified_mismatches": check_stratified(
+            SyntheticRecordGenerator(seed=seed).records(2000), numeric_records
+        ),
+        "reindex_mismatches": check_reindex(numeric_records),
+        "encoding_mismatches": check_encoding(
+            SyntheticRecordGenerator(seed=seed).records(2000)
+            + SyntheticRecordGenerator(seed=seed).corrupted_records(2000), analyzer,
+        ),
+    }
+
+
+# ----------------------------------------------------------------------
+# 측정
+# ----------------------------------------------------------------------
+
+def measure(name, n, fn, repeat):
+    """fn()을 repeat회 실행하여 최소/중앙값 시간 기록 (n = 1회 실행당 처리 레코드 수)"""
+    fn()  # warm-up
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    result = {
+        "name": name,
+        "records": n,
+        "best_s": round(best, 6),
+        "median_s": round(statistics.median(times), 6),
+        "per_record_us": round(best / n * 1e6, 3),
+        "records_per_sec": round(n / best, 1),
+    }
+    print(f"{name:<28} {result['per_record_us']:>10.2f} us/rec {result['records_per_sec']:>14,.0f} rec/s")
+    return result
+
+
+def run_benchmarks(records, numeric_records, repeat):
+    analyzer = BodyCompositionAnalyzer(margin=MARGIN)
+    n = len(records)
+    results = []
+
+    results.append(measure(
+        "scalar_pipeline", n,
+        lambda: [analyzer.analyze_full_pipeline(r) for r in records], repeat,
+    ))
+    fast = BodyCompositionAnalyzer(margin=MARGIN, fast_path=True)
+    results.append(measure(
+        "scalar_fast_path", n,
+        lambda: [fast.analyze_full_pipeline(r) for r in records], repeat,
+    ))
+    # 같은 결과지를 반복 분석하는 경우 (warm-up 이후 전부 캐시 적중, scalar_pipeline보다 빨라야 합니다)
+    cached = BodyCompositionAnalyzer(margin=MARGIN, cache_size=n)
+    results.append(measure(
+        "scalar_cache_hit", n,
+        lambda: [cached.analyze_full_pipeline(r) for r in records], repeat,
+    ))
+    # 성별/연령대별 임계값 표 (단일 기준 대비 속도 저하가 없어야 합니다)
+    from body_analysis.thresholds import ThresholdTable
+
+    table = ThresholdTable.stratified()
+    stratified = BodyCompositionAnalyzer(margin=MARGIN, thresholds=table)
+    results.append(measure(
+        "scalar_stratified", n,
+        lambda: [stratified.analyze_full_pipeline(r) for r in records], repeat,
+    ))
+    stratified_fast = BodyCompositionAnalyzer(margin=MARGIN, fast_path=True, thresholds=table)
+    results.append(measure(
+        "scalar_fast_path_stratified", n,
+        lambda: [stratified_fast.analyze_full_pipeline(r) for r in records], repeat,
+    ))
+    results.append(measure(
+        "scalar_report", n,
+        lambda: [analyzer.analyze_report(r) for r in records], repeat,
+    ))
+
+    # OCR 오인식처럼 분석에 실패하는 입력(딕셔너리가 아닌 레코드)이 섞여도 처리량이 유지되는지 확인합니다.
+    # (필드 값 수준의 오류는 각 분류기가 '알 수 없음'으로 처리하므로 예외 경로를 타지 않습니다.)
+    malformed = [r if i % 2 else ("BMI 23,1 체지방 l5.0", None, [r["bmi"]])[i % 3] for i, r in enumerate(records)]
+    results.append(measure(
+        "scalar_malformed_50pct", n,
+        lambda: [analyzer.analyze_full_pipeline(r) for r in malformed], repeat,
+    ))
+
+    data = [BodyCompositionData.from_dict(r) for r in records]
+    numeric = [d for d in data if SegmentalAnalyzer.is_numeric_data(d.muscle_seg)]
+    graded = [d for d in data if not SegmentalAnalyzer.is_numeric_data(d.muscle_seg)]
+
+    def normalize(items):
+        for d in items:
+            DataNormalizer.normalize_muscle_segment(d.muscle_seg, d.smm, MARGIN)
+            if d.fat_seg is not None:
+                DataNormalizer.normalize_fat_segment(d.fat_seg, d.get_total_fat(), MARGIN)
+
+    results.append(measure(
+        "segmental_numeric", len(numeric), lambda: normalize(numeric), repeat,
+    ))
+    if graded:
+        results.append(measure(
+            "segmental_graded", len(graded), lambda: normalize(graded), repeat,
+        ))
+
+    from body_analysis.batch import BatchAnalyzer
+
+    columns = BatchAnalyzer.records_to_columns(numeric_records)
+    results.append(measure(
+        "segmental_batch", len(numeric_records),
+        lambda: DataNormalizer.normalize_muscle_segment_batch(
+            columns["muscle_seg"], columns["smm"], MARGIN
+        ), repeat,
+    ))
+
+    lines = [json.dumps(r, ensure_ascii=False) for r in records]
+    stream = JsonlStreamAnalyzer(analyzer)
+    results.append(measure(
+        "end_to_end_jsonl", n,
+        lambda: stream.run(iter(lines), io.StringIO()), repeat,
+    ))
+
+    results.append(measure(
+        "batch_columns", len(numeric_records),
+        lambda: analyzer.analyze_batch(**columns), repeat,
+    ))
+    # 성별은 적재 시 한 번 성별 번호로 변환해 둔 컬럼을 사용합니다. (store.ColumnStore의 사전 코드와 같은 방식)
+    basic = BatchAnalyzer.records_to_columns(numeric_records, basic_info=True)
+    sex_codes = table.sex_code_array(basic["sex"])
+    results.append(measure(
+        "batch_columns_stratified", len(numeric_records),
+        lambda: stratified.analyze_batch(**columns, sex=sex_codes, age=basic["age"]), repeat,
+    ))
+
+    # 컬럼 저장소: JSON 파싱 + 컬럼 변환 대비 메모리 매핑 + 배치 분석
+    import tempfile
+    from body_analysis.store import ColumnStore, write_records
+
+    results.append(measure(
+        "batch_from_records", len(numeric_records),
+        lambda: analyzer.analyze_batch(**BatchAnalyzer.records_to_columns(numeric_records)), repeat,
+    ))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store_path = Path(tmpdir) / "records.bacols"
+        write_records(store_path, numeric_records)
+        results.append(measure(
+            "batch_from_store", len(numeric_records),
+            lambda: analyzer.analyze_batch(**ColumnStore(store_path).columns()), repeat,
+        ))
+
+    from body_analysis.validation import RecordValidator
+
+    validator = RecordValidator()
+    results.append(measure(
+        "validation_records", n, lambda: validator.validate_records(records), repeat,
+    ))
+    results.append(measure(
+        "validation_columns", len(numeric_records),
+        lambda: validator.validate_columns(**columns), repeat,
+    ))
+
+    # 결과 이진 인코딩: analyze_report() 결과 리스트 <-> 고정 폭 레코드
+    from body_analysis.encoding import ResultCodec
+
+    codec = ResultCodec()
+    reports = [analyzer.analyze_report(r) for r in records]
+    encoded = codec.encode(reports)
+    basic_info = [r["basic_info"] for r in reports]
+    results.append(measure(
+        "result_encode", n, lambda: codec.encode(reports), repeat,
+    ))
+    results.append(measure(
+        "result_decode", n, lambda: codec.decode(encoded, basic_info), repeat,
+    ))
+
+    # 증분 재분석: BMI 경계값 하나를 23.0 <-> 23.2로 바꿀 때마다 refresh() (records = 전체 레코드 수)
+    from body_analysis.reindex import IncrementalAnalyzer
+
+    incremental = IncrementalAnalyzer(**columns, margin=MARGIN)
+    original_normal = Constants.BMIThreshold.NORMAL
+
+    def refresh():
+        Constants.BMIThreshold.NORMAL = 23.2 if Constants.BMIThreshold.NORMAL == original_normal else original_normal
+        incremental.refresh()
+
+    try:
+        results.append(measure("incremental_refresh", len(numeric_records), refresh, repeat))
+    finally:
+        Constants.BMIThreshold.NORMAL = original_normal
+
+    # 임계값 스윕: 후보 100개 (records = 레코드 수 × 후보 수, 미리 계산 포함)
+    from body_analysis.sweep import ThresholdSet, ThresholdSweep
+
+    grid = ThresholdSet.grid({
+        "BMIThreshold.NORMAL": [22.0, 22.5, 23.0, 23.5, 24.0],
+        "BodyFatThreshold.NORMAL": [18.0, 20.0],
+        "MuscleRatioThreshold.SUFFICIENT": [0.44, 0.45],
+        "ValidationLimits.DEFAULT_MARGIN": [0.05, 0.08, 0.10, 0.12, 0.15],
+    })
+    results.append(measure(
+        "threshold_sweep", len(numeric_records) * len(grid),
+        lambda: ThresholdSweep(**columns).run(grid), repeat,
+    ))
+    return results
+
+
+# ----------------------------------------------------------------------
+# 결과 저장 / 비교
+# ----------------------------------------------------------------------
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=Path(__file__).resolve().parent, check=False,
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def compare(results, baseline_path, tolerance):
+    """이전 결과 대비 per_record_us가 tolerance 비율 이상 느려진 항목 목록 반환"""
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    previous = {r["name"]: r for r in baseline["results"]}
+    regressions = []
+    print(f"\n[compare] baseline commit={baseline['environment'].get('commit')}")
+    for r in results:
+        old = previous.get(r["name"])
+        if old is None:
+            continue
+        change = r["per_record_us"] / old["per_record_us"] - 1.0
+        flag = "REGRESSION" if change > tolerance else ""
+        print(f"{r['name']:<28} {old['per_record_us']:>10.2f} -> {r['per_record_us']:>10.2f} us/rec "
+              f"({change:+.1%}) {flag}")
+        if flag:
+            regressions.append(r["name"])
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="body_analysis 벤치마크 스위트")
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="회귀로 판단할 속도 저하 비율 (기본값: %(default)s)")
+    parser.add_argument("--skip-checks", action="store_true", help="일관성 검증 생략")
+    args = parser.parse_args(argv)
+
+    records = SyntheticRecordGenerator(seed=args.seed).records(args.records)
+    numeric_records = SyntheticRecordGenerator(seed=args.seed).records(args.records, numeric_only=True)
+
+    checks = None
+    if not args.skip_checks:
+        checks = run_checks(numeric_records, args.seed)
+        print(f"[checks] {checks}")
+
+    results = run_benchmarks(records, numeric_records, args.repeat)
+    report = {
+        "environment": environment(),
+        "config": {"records": args.records, "repeat": args.repeat, "seed": args.seed, "margin": MARGIN},
+        "checks": checks,
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    failed = bool(checks) and any(checks.values())
+    if args.compare:
+        failed = bool(compare(results, args.compare, args.tolerance)) or failed
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
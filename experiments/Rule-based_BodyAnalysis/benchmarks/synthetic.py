@@ -0,0 +1,155 @@
+"""
+[합성 레코드 생성기 (Synthetic Records)]
+
+벤치마크와 일관성 검증에 사용할 InBody 형태의 레코드를 재현 가능하게(seed 고정) 생성합니다.
+
+Coverage:
+    - BMI(7) × 체지방(5) × 근육 레벨(6) 카테고리 전 조합을 순환하며 생성합니다. ('알 수 없음' 포함)
+    - 부위별 데이터는 수치형(kg)과 이미 등급(텍스트)으로 주어진 형태를 graded_ratio 비율로 섞습니다.
+    - edge_ratio 비율만큼은 구간 경계값에 정확히 걸친 값을 사용하여 경계 처리 차이를 드러냅니다.
+    - corrupted_records()는 NaN/inf/문자열/누락 필드/딕셔너리가 아닌 레코드 등 비정상 입력을 섞어
+      서로 다른 분석 경로의 동등성 검증에 사용합니다.
+"""
+
+import math
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from body_analysis import constants as Constants  # noqa: E402
+from body_analysis.metrics import BMIClassifier, BodyFatClassifier, MuscleClassifier  # noqa: E402
+
+PARTS = Constants.BodyPartKeys.ORDER
+GRADES = (
+    Constants.BodyPartLevel.ABOVE,
+    Constants.BodyPartLevel.NORMAL,
+    Constants.BodyPartLevel.BELOW,
+)
+
+BMI_RANGE = (12.0, 45.0)
+FAT_RANGE = (3.0, 45.0)
+MUSCLE_RATIO_RANGE = (0.25, 0.65)
+
+# 비정상 입력 값 (OCR 오인식, 단위 누락, 직렬화 오류 등)
+CORRUPT_VALUES = (
+    None, 0, 0.0, -0.0, -3.0, math.nan, math.inf, -math.inf, 1e-310, 1e308,
+    "23.4", "abc", "", True, [1.0], {"value": 1.0}, 10 ** 400,
+)
+CORRUPT_RECORDS = ("OCR 인식 실패", None, [1, 2, 3], 42)
+
+# 근육/체지방 부위별 대략적인 구성비 (왼팔, 오른팔, 몸통, 왼다리, 오른다리)
+MUSCLE_SHARES = (0.055, 0.055, 0.45, 0.22, 0.22)
+FAT_SHARES = (0.07, 0.07, 0.5, 0.18, 0.18)
+
+
+class SyntheticRecordGenerator:
+    """
+    [합성 레코드 생성기]
+
+    Args:
+        seed (int): 난수 시드
+        graded_ratio (float): 부위별 데이터를 텍스트 등급으로 생성할 비율
+        fat_seg_ratio (float): 부위별 체지방 데이터를 포함할 비율
+        edge_ratio (float): 수치를 구간 경계값에 맞출 비율
+    """
+
+    def __init__(self, seed=0, graded_ratio=0.2, fat_seg_ratio=0.8, edge_ratio=0.05):
+        self.rng = random.Random(seed)
+        self.graded_ratio = graded_ratio
+        self.fat_seg_ratio = fat_seg_ratio
+        self.edge_ratio = edge_ratio
+        self.combos = [
+            (b, f, m)
+            for b in range(len(BMIClassifier.LABELS))
+            for f in range(len(BodyFatClassifier.LABELS))
+            for m in range(len(MuscleClassifier.LABELS))
+        ]
+
+    def records(self, n, numeric_only=False):
+        """레코드 n개 생성 (numeric_only=True이면 부위별 데이터를 모두 수치형으로 생성)"""
+        return [self.record(i, numeric_only) for i in range(n)]
+
+    def record(self, i, numeric_only=False):
+        """i번째 레코드 생성 (카테고리 조합은 i에 따라 순환)"""
+        rng = self.rng
+        bmi_code, fat_code, muscle_code = self.combos[i % len(self.combos)]
+
+        weight = round(rng.uniform(40.0, 120.0), 1)
+        bmi = self._value_in(bmi_code, BMIClassifier.edges(), BMI_RANGE, 1)
+        fat_rate = self._value_in(fat_code, BodyFatClassifier.edges(), FAT_RANGE, 1)
+        ratio = self._value_in(muscle_code, MuscleClassifier.edges(), MUSCLE_RATIO_RANGE, 3)
+        smm = None if ratio is None else round(weight * ratio, 1)
+        height = (
+            round(math.sqrt(weight / bmi) * 100, 1) if bmi else round(rng.uniform(150, 195), 1)
+        )
+
+        record = {
+            "sex": rng.choice(("남성", "여성")),
+            "age": rng.randint(18, 80),
+            "height_cm": height,
+            "weight_kg": weight,
+            "bmi": bmi,
+            "fat_rate": fat_rate,
+            "smm": smm,
+        }
+        graded = not numeric_only and rng.random() < self.graded_ratio
+        record["muscle_seg"] = self._segment(smm or weight * 0.4, MUSCLE_SHARES, graded)
+        if rng.random() < self.fat_seg_ratio:
+            total_fat = weight * (fat_rate or 20.0) / 100.0
+            record["fat_seg"] = self._segment(total_fat, FAT_SHARES, graded)
+        return record
+
+    def _value_in(self, code, edges, value_range, digits):
+        """카테고리 코드에 해당하는 구간에서 값 샘플링 (마지막 코드 = '알 수 없음' -> None)"""
+        if code == len(edges) + 1:
+            return None
+        lower = edges[code - 1] if code > 0 else value_range[0]
+        upper = edges[code] if code < len(edges) else value_range[1]
+        if code > 0 and self.rng.random() < self.edge_ratio:
+            return lower
+        value = round(self.rng.uniform(lower, upper), digits)
+        # 반올림으로 상한 경계에 닿으면 다음 구간이 되므로 구간 안으로 되돌립니다.
+        return value if value < upper else round(lower + (upper - lower) / 2, digits)
+
+    def _segment(self, total, shares, graded):
+        rng = self.rng
+        if graded:
+            return {part: rng.choice(GRADES) for part in PARTS}
+        # 좌/우 또는 상/하체 불균형을 섞어 '표준이상'/'표준미만'이 고르게 나오도록 합니다.
+        return {
+            part: round(total * share * rng.uniform(0.8, 1.2), 2)
+            for part, share in zip(PARTS, shares)
+        }
+
+    def corrupted_records(self, n, ratio=0.5):
+        """레코드 n개 중 ratio 비율을 비정상 입력으로 변형하여 생성"""
+        return [
+            self.corrupt(self.record(i)) if self.rng.random() < ratio else self.record(i)
+            for i in range(n)
+        ]
+
+    def corrupt(self, record):
+        """레코드 하나를 변형 (필드 값 치환, 부위 값 치환, 필드 누락, 레코드 자체 치환 중 일부)"""
+        rng = self.rng
+        if rng.random() < 0.02:
+            return rng.choice(CORRUPT_RECORDS)
+        for key in ("weight_kg", "bmi", "fat_rate", "smm"):
+            if rng.random() < 0.25:
+                record[key] = rng.choice(CORRUPT_VALUES)
+        for key in ("muscle_seg", "fat_seg"):
+            seg = record.get(key)
+            if rng.random() < 0.05:
+                record[key] = rng.choice(("표준", [1.0, 2.0], {}, None))
+            elif isinstance(seg, dict):
+                for part in PARTS:
+                    roll = rng.random()
+                    if roll < 0.05:
+                        seg.pop(part, None)
+                    elif roll < 0.15:
+                        seg[part] = rng.choice(CORRUPT_VALUES)
+        for key in ("sex", "height_cm", "bmi", "muscle_seg", "fat_seg"):
+            if rng.random() < 0.03:
+                record.pop(key, None)
+        return record
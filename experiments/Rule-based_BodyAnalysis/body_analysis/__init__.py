@@ -1 +1,40 @@
-from .pipeline import BodyCompositionAnalyzer
+"""
+[body_analysis 패키지]
+
+서버리스 워커처럼 요청마다 새 프로세스로 시작하는 환경을 위해, 패키지 import 시점에는 아무 하위 모듈도
+로드하지 않습니다. `body_analysis.BodyCompositionAnalyzer` 등 속성에 처음 접근할 때 해당 모듈을 로드하며,
+NumPy(batch), multiprocessing(parallel), json(stream) 등 무거운 의존성은 그 기능을 사용할 때만 로드됩니다.
+"""
+
+import importlib
+
+# 공개 이름 -> 정의된 하위 모듈
+_LAZY_ATTRS = {
+    "BodyCompositionAnalyzer": ".pipeline",
+    "BodyCompositionData": ".models",
+    "CompactBodyCompositionData": ".models",
+}
+
+_SUBMODULES = (
+    "batch", "cache", "constants", "encoding", "errors", "fused", "instrumentation", "metrics",
+    "models", "parallel", "pipeline", "reindex", "segmental", "stages", "store", "stream", "sweep",
+    "thresholds", "validation",
+)
+
+__all__ = list(_LAZY_ATTRS) + list(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # 이후 접근은 모듈 속성으로 바로 처리되도록 캐시합니다.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,101 @@
+"""
+[명령행 진입점 (CLI)]
+
+JSON Lines 형식의 InBody 레코드를 스트리밍 분석합니다.
+
+Usage:
+    python -m body_analysis records.jsonl -o results.jsonl
+    cat records.jsonl | python -m body_analysis > results.jsonl
+    python -m body_analysis records.jsonl -o results.jsonl --quarantine quarantine.jsonl
+"""
+
+import argparse
+import logging
+import sys
+from . import constants
+from .errors import ErrorReporter
+from .pipeline import BodyCompositionAnalyzer
+from .stream import JsonlStreamAnalyzer
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m body_analysis",
+        description="JSONL 체성분 레코드를 스트리밍 분석하여 JSONL 결과를 출력합니다.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="입력 JSONL 파일 (기본값: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="출력 JSONL 파일 (기본값: stdout)")
+    parser.add_argument(
+        "--margin", type=float, default=constants.ValidationLimits.DEFAULT_MARGIN,
+        help="부위별 '표준' 구간 허용 오차 비율 (기본값: %(default)s)",
+    )
+    parser.add_argument(
+        "--stratified", action="store_true",
+        help="체지방률/근육 비율을 성별/연령대별 임계값(constants.StratifiedThreshold)으로 분류",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=JsonlStreamAnalyzer.DEFAULT_CHUNK_SIZE,
+        help="한 번에 처리할 레코드 수 (기본값: %(default)s)",
+    )
+    parser.add_argument(
+        "--validate", action="store_true",
+        help="constants.ValidationLimits 기준으로 청크 단위 검증 후 실패 레코드는 분석하지 않고 격리",
+    )
+    parser.add_argument(
+        "--check-segment-sums", action="store_true",
+        help="--validate 시 부위별 합계 vs 골격근량/총 체지방량 교차 검사도 수행 (기본값: 검사 안 함)",
+    )
+    parser.add_argument(
+        "--quarantine", default=None,
+        help="격리 레코드를 따로 기록할 JSONL 파일 (--validate 포함, 미지정 시 결과에 함께 기록)",
+    )
+    parser.add_argument(
+        "--traceback", action="store_true",
+        help="분석 실패 시 Traceback을 stderr에 기록 (분당 최대 10건)",
+    )
+    return parser
+
+
+def _open_text(path, mode):
+    if path == "-":
+        stream = sys.stdin if "r" in mode else sys.stdout
+        stream.reconfigure(encoding="utf-8")
+        return stream
+    return open(path, mode, encoding="utf-8", newline="\n")
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(format="[%(levelname)s] %(message)s", stream=sys.stderr)
+    thresholds = None
+    if args.stratified:
+        from .thresholds import ThresholdTable
+        thresholds = ThresholdTable.stratified()
+    analyzer = BodyCompositionAnalyzer(
+        margin=args.margin, error_reporter=ErrorReporter(capture_traceback=args.traceback),
+        thresholds=thresholds,
+    )
+    validator = None
+    if args.validate or args.quarantine:
+        # 검증을 사용할 때만 NumPy를 로드합니다.
+        from .validation import RecordValidator
+        validator = RecordValidator(segment_sums=args.check_segment_sums)
+    runner = JsonlStreamAnalyzer(analyzer, chunk_size=args.chunk_size, validator=validator)
+    infile = _open_text(args.input, "r")
+    outfile = _open_text(args.output, "w")
+    quarantine = open(args.quarantine, "w", encoding="utf-8", newline="\n") if args.quarantine else None
+    try:
+        stats = runner.run(infile, outfile, quarantine)
+    finally:
+        if args.input != "-":
+            infile.close()
+        if args.output != "-":
+            outfile.close()
+        if quarantine is not None:
+            quarantine.close()
+    print(stats.summary(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
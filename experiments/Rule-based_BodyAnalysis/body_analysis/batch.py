@@ -0,0 +1,206 @@
+"""
+[컬럼 단위 배치 분석 (Columnar Batch Analysis)]
+
+대량의 체성분 레코드를 레코드(Dictionary) 단위가 아닌 컬럼(NumPy 배열) 단위로 분석하는 모듈입니다.
+레코드마다 반복되던 from_dict 변환, float() 형변환, try/except 분기를 배열 연산으로 대체하며,
+모든 분류 규칙은 스칼라 경로(pipeline.analyze_full_pipeline)와 동일한 결과를 내도록 구현되어 있습니다.
+
+Input Convention:
+    - 수치 컬럼(bmi, fat_rate, smm, weight): 길이 N의 1차원 배열 (결측값은 NaN)
+    - 부위별 컬럼(muscle_seg, fat_seg): N×5 행렬, 열 순서는 Constants.BodyPartKeys.ORDER
+    - 부위 데이터가 없는 레코드는 해당 행을 NaN으로 채웁니다.
+      (스칼라 경로의 None 입력과 마찬가지로 모든 부위가 '표준'으로 처리됩니다)
+"""
+
+import math
+import numpy as np
+from . import constants as Constants
+from .metrics import BMIClassifier, BodyFatClassifier, MuscleClassifier
+from .stages import BODY_TYPE_LABELS, Stage12DecisionTable
+from .segmental import GRADE_ABOVE, DataNormalizer
+
+DIST_BALANCED, DIST_UPPER, DIST_LOWER = 0, 1, 2
+STAGE3_LABELS = ("표준형", "상체발달형", "하체발달형", "상체비만형", "하체비만형")
+
+SEGMENT_COUNT = len(Constants.BodyPartKeys.ORDER)
+
+
+class BatchAnalyzer:
+    """
+    [배치 분석기]
+    컬럼형 입력(bmi, fat_rate, smm, weight, 부위별 N×5 행렬)을 받아 Stage 2 / Stage 3 라벨 배열을 반환합니다.
+    BodyCompositionAnalyzer.analyze_batch()를 통해 사용하는 것을 권장합니다.
+    """
+
+    @staticmethod
+    def analyze(bmi, fat_rate, smm, weight, muscle_seg, fat_seg=None,
+                margin=Constants.ValidationLimits.DEFAULT_MARGIN, thresholds=None, sex=None, age=None):
+        """
+        [배치 파이프라인 실행]
+
+        Args:
+            bmi, fat_rate, smm, weight: 길이 N의 수치 배열
+            muscle_seg: N×5 부위별 근육량 행렬
+            fat_seg: N×5 부위별 체지방량 행렬 (None이면 전체 레코드에 체지방 부위 데이터 없음)
+            margin (float): 부위별 '표준' 구간 허용 오차 비율
+            thresholds: 성별/연령대별 임계값 표 (thresholds.ThresholdTable, None이면 constants.py의 단일 기준)
+            sex, age: 길이 N의 성별 값(또는 ThresholdTable.sex_code_array() 결과)과 나이 배열
+                (thresholds가 있을 때만 사용, None이면 모든 레코드가 단일 기준 층)
+
+        Returns:
+            dict: {"stage2": N 라벨 배열, "stage3": N 라벨 배열}
+        """
+        bmi = BatchAnalyzer._as_column(bmi, "bmi")
+        n = bmi.shape[0]
+        fat_rate = BatchAnalyzer._as_column(fat_rate, "fat_rate", n)
+        smm = BatchAnalyzer._as_column(smm, "smm", n)
+        weight = BatchAnalyzer._as_column(weight, "weight", n)
+        muscle_seg = BatchAnalyzer._as_segment_matrix(muscle_seg, "muscle_seg", n)
+        if fat_seg is None:
+            fat_seg = np.full((n, SEGMENT_COUNT), np.nan)
+        else:
+            fat_seg = BatchAnalyzer._as_segment_matrix(fat_seg, "fat_seg", n)
+
+        # 1. 신체 정보 분류 (카테고리 코드, 임계값 표가 있으면 레코드별 층의 경계값 행렬 사용)
+        fat_edges = muscle_edges = strata = None
+        if thresholds is not None:
+            if sex is None or age is None:
+                strata = np.full(n, thresholds.unknown)
+            else:
+                strata = thresholds.stratum_array(sex, BatchAnalyzer._as_column(age, "age", n))
+            fat_edges = thresholds.fat_edges_array()
+            muscle_edges = thresholds.muscle_edges_array()
+        bmi_codes = BMIClassifier.classify_array(bmi)
+        fat_codes = BodyFatClassifier.classify_array(fat_rate, fat_edges, strata)
+        _, muscle_codes = MuscleClassifier.classify_array(smm, weight, muscle_edges, strata)
+
+        # 2. 체형 분류 및 보정 (Stage 1 & 2)
+        _, stage2 = Stage12DecisionTable.lookup_array(bmi_codes, fat_codes, muscle_codes)
+
+        # 3. 부위별 정규화 및 균형 분석 (Stage 3)
+        muscle_grades = DataNormalizer.normalize_muscle_segment_batch(muscle_seg, smm, margin)
+        fat_grades = DataNormalizer.normalize_fat_segment_batch(
+            fat_seg, BatchAnalyzer.total_fat_array(weight, fat_rate), margin
+        )
+        stage3 = BatchAnalyzer.stage3_codes(muscle_grades, fat_grades)
+
+        return {
+            "stage2": np.array(BODY_TYPE_LABELS, dtype=object)[stage2],
+            "stage3": np.array(STAGE3_LABELS, dtype=object)[stage3],
+        }
+
+    @staticmethod
+    def records_to_columns(records, basic_info=False):
+        """
+        [레코드 → 컬럼 변환]
+        BodyCompositionData.from_dict()가 받는 형태의 딕셔너리 목록을 analyze()의 입력 컬럼으로 변환합니다.
+        from_dict()와 동일하게 필드 그룹 단위로 값을 채우며, 누락/변환 불가 값은 NaN이 됩니다.
+        딕셔너리가 아닌 레코드(None 등)는 배치 전체를 중단하지 않도록 모든 값이 NaN인 행이 되며,
+        이런 행은 validation.RecordValidator가 MALFORMED로 격리합니다. (스칼라 경로는 invalid_input 실패 결과)
+        basic_info=True이면 성별/연령대별 임계값 표에 사용하는 "sex"(값 배열, 결측은 None)와 "age" 컬럼을 추가합니다.
+
+        Raises:
+            ValueError: 부위별 데이터가 이미 등급(텍스트)으로 주어진 레코드가 있는 경우
+        """
+        n = len(records)
+        columns = {
+            "bmi": np.full(n, np.nan),
+            "fat_rate": np.full(n, np.nan),
+            "smm": np.full(n, np.nan),
+            "weight": np.full(n, np.nan),
+            "muscle_seg": np.full((n, SEGMENT_COUNT), np.nan),
+            "fat_seg": np.full((n, SEGMENT_COUNT), np.nan),
+        }
+        if basic_info:
+            columns["sex"] = np.full(n, None, dtype=object)
+            columns["age"] = np.full(n, np.nan)
+        for i, record in enumerate(records):
+            if not isinstance(record, dict):
+                continue
+            if all(k in record for k in ("sex", "age", "height_cm", "weight_kg")):
+                columns["weight"][i] = BatchAnalyzer._to_float(record["weight_kg"])
+                if basic_info:
+                    columns["sex"][i] = record["sex"]
+                    columns["age"][i] = BatchAnalyzer._to_float(record["age"])
+            if all(k in record for k in ("bmi", "fat_rate", "smm")):
+                columns["bmi"][i] = BatchAnalyzer._to_float(record["bmi"])
+                columns["fat_rate"][i] = BatchAnalyzer._to_float(record["fat_rate"])
+                columns["smm"][i] = BatchAnalyzer._to_float(record["smm"])
+            if "muscle_seg" in record:
+                BatchAnalyzer._fill_segment_row(columns["muscle_seg"], i, record["muscle_seg"])
+                BatchAnalyzer._fill_segment_row(columns["fat_seg"], i, record.get("fat_seg"))
+        return columns
+
+    @staticmethod
+    def _to_float(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError, OverflowError):
+            return math.nan
+
+    @staticmethod
+    def _fill_segment_row(matrix, row, seg_data):
+        """
+        부위별 딕셔너리 한 건을 행렬의 한 행으로 기록 (누락 부위는 0 → 스칼라 경로의 dev.get(key, 0)과 동일)
+        float로 변환할 수 없는 값(예: 10**400)은 배치 전체를 중단하지 않도록 NaN으로 기록하며,
+        이런 행은 validation.RecordValidator가 SEGMENT_RANGE로 격리합니다. (스칼라 경로는 arithmetic_error 실패 결과)
+        """
+        if seg_data is None:
+            return
+        if not isinstance(seg_data, dict) or not all(
+            isinstance(v, (int, float)) for v in seg_data.values()
+        ):
+            raise ValueError(f"records[{row}]: 수치형이 아닌 부위별 데이터는 배치 분석할 수 없습니다.")
+        to_float = BatchAnalyzer._to_float
+        for col, key in enumerate(Constants.BodyPartKeys.ORDER):
+            matrix[row, col] = to_float(seg_data.get(key, 0))
+
+    @staticmethod
+    def _as_column(values, name, n=None):
+        column = np.asarray(values, dtype=np.float64)
+        if column.ndim != 1:
+            raise ValueError(f"{name}: 1차원 배열이어야 합니다. (shape={column.shape})")
+        if n is not None and column.shape[0] != n:
+            raise ValueError(f"{name}: 길이가 {n}이어야 합니다. (len={column.shape[0]})")
+        return column
+
+    @staticmethod
+    def _as_segment_matrix(values, name, n):
+        matrix = np.asarray(values, dtype=np.float64)
+        if matrix.shape != (n, SEGMENT_COUNT):
+            raise ValueError(f"{name}: ({n}, {SEGMENT_COUNT}) 형태여야 합니다. (shape={matrix.shape})")
+        return matrix
+
+    # ------------------------------------------------------------------
+    # 1. 부위별 정규화 (등급 계산은 segmental.DataNormalizer의 배치 메서드 사용)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def total_fat_array(weight, fat_rate):
+        """BodyCompositionData.get_total_fat()의 배열 버전"""
+        with np.errstate(invalid="ignore", over="ignore"):
+            total_fat = weight * fat_rate / 100.0
+        return np.where(np.isfinite(total_fat) & (total_fat >= 0), total_fat, 0.0)
+
+    # ------------------------------------------------------------------
+    # 2. Stage 3
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _distribution(grades):
+        """Stage3BalanceAnalyzer.analyze_distribution()의 배열 버전"""
+        high = grades == GRADE_ABOVE
+        arm_high = high[:, 0].astype(np.int8) + high[:, 1]
+        leg_high = high[:, 3].astype(np.int8) + high[:, 4]
+        dist = np.full(grades.shape[0], DIST_BALANCED, dtype=np.int8)
+        dist[(leg_high >= 2) & (arm_high < 2)] = DIST_LOWER
+        dist[(arm_high >= 2) & (leg_high < 2)] = DIST_UPPER
+        return dist
+
+    @staticmethod
+    def stage3_codes(muscle_grades, fat_grades):
+        """N×5 근육/체지방 등급 코드 행렬 → Stage 3 코드 배열 (STAGE3_LABELS 인덱스)"""
+        muscle_dist = BatchAnalyzer._distribution(muscle_grades)
+        fat_dist = BatchAnalyzer._distribution(fat_grades)
+        # 체지방 분포가 한쪽으로 치우치면 '비만형'(3, 4)이 우선, 아니면 근육 분포(0~2)를 따릅니다.
+        return np.where(fat_dist != DIST_BALANCED, fat_dist + 2, muscle_dist)
@@ -0,0 +1,129 @@
+"""
+[분석 결과 캐시 (Result Cache)]
+
+동일한 InBody 결과지를 반복 업로드하는 경우 재분석하지 않도록
+분석 결과를 메모리에 보관하는 LRU(Least Recently Used) 캐시 모듈입니다.
+
+Key Design:
+    - 캐시는 분석 결과를 바꾸지 않습니다. 캐시 미스(Miss) 시에는 항상 원본 입력을 그대로 분석합니다.
+    - 캐시 키는 분석에 사용되는 입력 필드의 원본 값과 타입으로 만든 튜플(완전 일치 키)입니다.
+      (23.14와 23.1, 70과 "70", 1.0과 Decimal("1.0")은 서로 다른 키)
+      값을 반올림해 키를 공유하면 경계값 근처의 입력이 다른 입력의 결과를 받게 되므로 양자화하지 않습니다.
+    - 규칙 상수(constants.rules_fingerprint)나 margin이 바뀌면 캐시 전체가 무효화됩니다.
+      조회마다 지문을 다시 만들지 않도록, 상수 변경 횟수(constants.rules_revision)가 바뀐 경우에만 지문을 비교합니다.
+    - 성별/나이도 키에 포함되므로 성별/연령대별 임계값 표(thresholds.ThresholdTable)를 사용하는 분석기도 같은 키를 사용합니다.
+"""
+
+from collections import OrderedDict
+from . import constants as Constants
+
+
+class AnalysisCache:
+    """
+    [LRU 결과 캐시]
+    hit / miss / eviction / invalidation 카운터와 최대 크기(maxsize)를 가진 결과 캐시입니다.
+    """
+
+    DEFAULT_MAXSIZE = 10000
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = max(1, int(maxsize))
+        self._entries = OrderedDict()
+        self._rules = Constants.rules_fingerprint()
+        self._revision = Constants.rules_revision()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        """캐시 조회 (규칙 상수가 바뀌었으면 먼저 전체 무효화)"""
+        if Constants.RuleConstants.revision != self._revision:
+            self._check_rules()
+        try:
+            result = self._entries.get(key)
+        except TypeError:  # 해시할 수 없는 값(리스트 등)이 포함된 키: 캐시하지 않음
+            result = None
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def _check_rules(self):
+        self._revision = Constants.rules_revision()
+        rules = Constants.rules_fingerprint()
+        if rules != self._rules:
+            self._rules = rules
+            self.invalidate()
+
+    def put(self, key, result):
+        """결과 저장 (최대 크기 초과 시 가장 오래 사용되지 않은 항목 제거, 해시할 수 없는 키는 저장하지 않음)"""
+        try:
+            self._entries[key] = result
+        except TypeError:
+            return
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self):
+        """캐시 전체 무효화"""
+        if self._entries:
+            self._entries.clear()
+        self.invalidations += 1
+
+    def stats(self):
+        """캐시 통계 스냅샷"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    # ------------------------------------------------------------------
+    # 키 생성
+    # ------------------------------------------------------------------
+
+    def make_key(self, raw_input):
+        """
+        [캐시 키 생성]
+        입력 딕셔너리(또는 BodyCompositionData 호환 객체)에서 BodyCompositionData.from_dict가 읽는 필드의
+        원본 값과 타입으로 완전 일치 키를 만듭니다. (객체 변환 없이 만들 수 있음)
+        딕셔너리에 없는 필드는 None과 구분되는 별도 값으로 표시합니다. (from_dict는 필드 묶음 단위로 값을 읽음)
+
+        Returns:
+            tuple: 캐시 키 (캐시할 수 없는 입력이면 None, 해시할 수 없는 값이 있을 수 있음)
+        """
+        if type(raw_input) is dict:
+            get = raw_input.get
+            values = (
+                get("sex", _MISSING), get("age", _MISSING), get("height_cm", _MISSING), get("weight_kg", _MISSING),
+                get("bmi", _MISSING), get("fat_rate", _MISSING), get("smm", _MISSING),
+            )
+            muscle_seg, fat_seg = get("muscle_seg", _MISSING), get("fat_seg", _MISSING)
+        else:
+            try:
+                values = (
+                    raw_input.sex, raw_input.age, raw_input.height_cm, raw_input.weight_kg,
+                    raw_input.bmi, raw_input.fat_rate, raw_input.smm,
+                )
+                muscle_seg, fat_seg = raw_input.muscle_seg, raw_input.fat_seg
+            except AttributeError:
+                return None
+        return (*values, *map(type, values), _segment_key(muscle_seg), _segment_key(fat_seg))
+
+
+_MISSING = object()
+
+
+def _segment_key(seg_data):
+    """make_key()의 부위별 데이터 부분 ((부위 키, 값) 쌍과 값의 타입)"""
+    if type(seg_data) is not dict:
+        return seg_data, type(seg_data)
+    return (*seg_data.items(), *map(type, seg_data.values()))
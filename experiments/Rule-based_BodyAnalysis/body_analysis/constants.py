@@ -5,7 +5,25 @@
 비즈니스 규칙 변경 시 이곳의 값만 수정하면 시스템 전반에 반영되도록 설계되었습니다.
 """
 
-class BMIThreshold:
+class RuleConstants(type):
+    """
+    [규칙 상수 메타클래스]
+    분류 규칙 상수 클래스의 속성을 다시 대입할 때마다 RuleConstants.revision을 1 증가시킵니다.
+    rules_fingerprint()를 매번 새로 만들지 않고도 '상수가 바뀌었을 수 있는지'를 정수 비교로 확인할 수 있습니다.
+    (리스트/딕셔너리 값의 내부를 직접 수정하는 경우는 감지하지 못하므로, 값 전체를 다시 대입해야 합니다)
+    """
+    revision = 0
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        RuleConstants.revision += 1
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        RuleConstants.revision += 1
+
+
+class BMIThreshold(metaclass=RuleConstants):
     """
     [BMI 분류 임계값]
     BMI(체질량지수) 구간별 분류 기준입니다. 
@@ -23,11 +41,12 @@ class BMIThreshold:
     OBESE_2 = 34.9
 
 
-class BodyFatThreshold:
+class BodyFatThreshold(metaclass=RuleConstants):
     """
     [체지방률 분류 임계값]
     체지방률(Fat Percentage)에 따른 비만도 분류 기준입니다.
     성별/연령별 기준을 일반화하여 시스템에서 사용하는 표준 임계값을 정의합니다.
+    (성별/연령대별 기준은 StratifiedThreshold 참고)
     
     Usage:
         - value < LOW: 표준미만
@@ -40,11 +59,12 @@ class BodyFatThreshold:
     OVERWEIGHT = 24.0
 
 
-class MuscleRatioThreshold:
+class MuscleRatioThreshold(metaclass=RuleConstants):
     """
     [골격근량 비율 임계값]
     체중 대비 골격근량(SMM) 비율을 기준으로 근육 발달 수준을 5단계로 분류하기 위한 임계값입니다.
     단순 절대량이 아닌 체중 대비 비율(Relative Ratio)을 사용하여 체격에 따른 편차를 보정합니다.
+    (성별/연령대별 기준은 StratifiedThreshold 참고)
     
     Calculation:
         Ratio = 골격근량(SMM) / 체중(Weight)
@@ -60,11 +80,51 @@ class MuscleRatioThreshold:
     NORMAL = 0.40
 
 
+class StratifiedThreshold(metaclass=RuleConstants):
+    """
+    [성별/연령대별 임계값 표]
+    BodyFatThreshold / MuscleRatioThreshold를 성별과 연령대로 나눈 기준표입니다. #fixme (참고치, 기준 검토 필요)
+    thresholds.ThresholdTable.stratified()가 이 표를 층(성별 × 연령대)별 경계값 배열로 컴파일하며,
+    분석기 인스턴스마다 선택해 사용합니다. (기본 분석기는 위의 단일 기준을 그대로 사용합니다)
+
+    Structure:
+        - SEX_ALIASES: 입력 성별 값 -> 성별 키
+        - AGE_BANDS: 연령대 경계 (오름차순, age < 30 -> 0번 연령대, 30 <= age < 50 -> 1번, ...)
+        - BODY_FAT[성별 키][연령대]: (LOW, NORMAL, OVERWEIGHT)
+        - MUSCLE_RATIO[성별 키][연령대]: (NORMAL, SUFFICIENT, HIGH, VERY_HIGH)
+        - 성별이나 나이를 알 수 없는 레코드는 BodyFatThreshold / MuscleRatioThreshold를 사용합니다.
+    """
+    SEX_ALIASES = {
+        "남성": "male", "남자": "male", "남": "male", "M": "male",
+        "여성": "female", "여자": "female", "여": "female", "F": "female",
+    }
+    AGE_BANDS = (30, 50, 65)
+
+    BODY_FAT = {
+        "male": ((10.0, 20.0, 24.0), (11.0, 21.0, 25.0), (12.0, 22.0, 26.0), (13.0, 23.0, 27.0)),
+        "female": ((18.0, 28.0, 32.0), (19.0, 29.0, 33.0), (20.0, 30.0, 34.0), (21.0, 31.0, 35.0)),
+    }
+    MUSCLE_RATIO = {
+        "male": ((0.40, 0.45, 0.50, 0.55), (0.39, 0.44, 0.49, 0.54), (0.37, 0.42, 0.47, 0.52), (0.35, 0.40, 0.45, 0.50)),
+        "female": ((0.33, 0.38, 0.43, 0.48), (0.32, 0.37, 0.42, 0.47), (0.31, 0.36, 0.41, 0.46), (0.29, 0.34, 0.39, 0.44)),
+    }
+
+
 class ValidationLimits:
     """
     [데이터 유효성 검증 범위]
     입력 데이터의 무결성을 보장하기 위한 유효 범위(Valid Range) 정의입니다.
     비정상적인 이상치(Outlier)나 오입력 데이터를 필터링하는 데 사용됩니다.
+    (validation.RecordValidator가 범위 검사와 필드 간 교차 검증에 사용합니다.)
+
+    Cross-field:
+        - BMI_TOLERANCE: 입력 BMI와 체중/키로 계산한 BMI의 허용 상대 오차
+        - SEGMENT_MUSCLE_RATIO: 부위별 근육량 합계 / 골격근량(SMM) 허용 범위
+          (부위별 값은 제지방(Lean) 기준이라 SMM보다 큰 것이 정상입니다)
+        - SEGMENT_FAT_RATIO: 부위별 체지방량 합계 / 총 체지방량 허용 범위
+          (결과지마다 부위별 체지방 산출 기준이 달라 합계가 총 체지방량보다 큰 경우가 흔합니다.
+           예: main_test.py 샘플은 19.5 / 10.64 ≈ 1.83이므로 근육과 같은 상한을 사용합니다)
+        - 부위별 합계 검사는 RecordValidator(segment_sums=True)일 때만 수행합니다.
     """
     MIN_WEIGHT = 1.0
     MAX_WEIGHT = 500.0
@@ -75,8 +135,12 @@ class ValidationLimits:
     MIN_MUSCLE = 0.0
     DEFAULT_MARGIN = 0.10
 
+    BMI_TOLERANCE = 0.05
+    SEGMENT_MUSCLE_RATIO = (0.5, 2.5)
+    SEGMENT_FAT_RATIO = (0.5, 2.5)
+
 
-class BodyPartLevel:
+class BodyPartLevel(metaclass=RuleConstants):
     """
     [부위별 발달 등급 열거형]
     부위별 분석 결과(Segmental Analysis)의 표준화된 등급을 정의하는 상수 집합입니다.
@@ -91,7 +155,7 @@ class BodyPartLevel:
     BELOW = "표준미만"
 
 
-class BodyPartKeys:
+class BodyPartKeys(metaclass=RuleConstants):
     """
     [부위 식별 키]
     데이터 딕셔너리 접근 시 Key Error를 방지하고 일관된 Key 네이밍을 보장하기 위한 상수입니다.
@@ -101,9 +165,54 @@ class BodyPartKeys:
         - LEFT_ARM, RIGHT_ARM -> 상체 그룹
         - LEFT_LEG, RIGHT_LEG -> 하체 그룹
         - TRUNK -> 몸통 (코어)
+
+    ORDER:
+        - 배치(Columnar) 분석에서 N×5 부위 행렬의 열(Column) 순서입니다.
     """
     LEFT_ARM = "왼팔"
     RIGHT_ARM = "오른팔"
     TRUNK = "몸통"
     LEFT_LEG = "왼다리"
     RIGHT_LEG = "오른다리"
+
+    ORDER = (LEFT_ARM, RIGHT_ARM, TRUNK, LEFT_LEG, RIGHT_LEG)
+
+
+def rules_fingerprint():
+    """
+    [규칙 식별자]
+    분석 결과에 영향을 주는 임계값/라벨 상수의 현재 값을 튜플로 반환합니다.
+    캐시 무효화 등에서 '규칙이 바뀌었는지'를 판단하는 데 사용하며,
+    분류에 쓰이는 상수를 추가할 때는 이 목록에도 함께 추가해야 합니다.
+    """
+    return (
+        BMIThreshold.UNDERWEIGHT, BMIThreshold.NORMAL, BMIThreshold.OVERWEIGHT,
+        BMIThreshold.OBESE_1, BMIThreshold.OBESE_2,
+        BodyFatThreshold.LOW, BodyFatThreshold.NORMAL, BodyFatThreshold.OVERWEIGHT,
+        MuscleRatioThreshold.VERY_HIGH, MuscleRatioThreshold.HIGH,
+        MuscleRatioThreshold.SUFFICIENT, MuscleRatioThreshold.NORMAL,
+        BodyPartLevel.ABOVE, BodyPartLevel.NORMAL, BodyPartLevel.BELOW,
+        BodyPartKeys.ORDER,
+        tuple(sorted(StratifiedThreshold.SEX_ALIASES.items())), StratifiedThreshold.AGE_BANDS,
+        tuple(sorted(StratifiedThreshold.BODY_FAT.items())), tuple(sorted(StratifiedThreshold.MUSCLE_RATIO.items())),
+    )
+
+
+def rules_revision():
+    """
+    [규칙 상수 변경 횟수]
+    규칙 상수 클래스(RuleConstants)의 속성이 다시 대입될 때마다 증가하는 정수입니다.
+    값이 이전과 같으면 규칙도 같으므로, 캐시 등은 이 값이 바뀐 경우에만 rules_fingerprint()를 다시 비교합니다.
+    """
+    return RuleConstants.revision
+
+
+def rules_version(margin=ValidationLimits.DEFAULT_MARGIN):
+    """
+    [규칙 버전]
+    rules_fingerprint()와 부위별 허용 오차 비율(margin)로 만든 32비트 정수(CRC32)입니다.
+    분석 결과에 함께 저장해 두면, 현재 버전과 다른 행을 '이전 규칙으로 분석된 결과'로 찾을 수 있습니다.
+    """
+    import zlib
+
+    return zlib.crc32(repr((rules_fingerprint(), float(margin))).encode("utf-8"))
@@ -0,0 +1,351 @@
+"""
+[분석 결과 이진 인코딩 (Compact Result Encoding)]
+
+analyze_report() 결과는 체형/등급 라벨 문자열("마른비만형", "표준이상" 등)을 결과마다 반복해서 담고 있어
+저장 공간과 전송량의 대부분을 라벨이 차지합니다. 이 모듈은 결과 1건을 고정 크기(RECORD_DTYPE.itemsize 바이트)의
+카테고리 코드 레코드로 바꾸고, 부위별 등급 10개는 2비트씩 하나의 정수에 묶어(bit-pack) 저장합니다.
+
+Code Table:
+    - 코드 → 라벨 표는 metrics.py의 LABELS, stages.BODY_TYPE_LABELS, batch.STAGE3_LABELS,
+      constants.BodyPartLevel(segmental.GRADE_LABELS), errors의 오류 코드/단계에서 생성합니다.
+    - 표의 내용으로 버전(CRC32)을 계산하므로, 라벨이 바뀌면 버전도 바뀝니다.
+      to_bytes()는 표를 함께 기록하므로 이전 버전으로 저장된 결과도 from_bytes()로 그대로 복원됩니다.
+
+Round-trip:
+    decode(encode(results))는 원래 결과와 같습니다. (basic_info는 입력 값을 그대로 옮긴 것이므로
+    레코드에 담지 않으며, decode(..., basic_info=[...])로 다시 채웁니다. 예: store.ColumnStore의 sex/age/weight)
+
+Extras:
+    정규화에 실패해 원본 그대로 전달된 부위별 데이터(예: {"왼팔": None, ...}, 리스트, 문자열)는 2비트 등급으로 담을 수 없으므로,
+    레코드에는 FLAG_MUSCLE_RAW / FLAG_FAT_RAW만 표시하고 원본 값은 EncodedResults.extras({결과 번호: {키: 원본}})에 따로 보관합니다.
+    to_bytes()는 extras를 헤더 JSON에 함께 기록합니다. (JSON으로 그대로 복원되지 않는 값이면 ValueError)
+"""
+
+import json
+import struct
+import zlib
+import numpy as np
+from . import constants as Constants
+from .batch import STAGE3_LABELS
+from .errors import STAGES, UNKNOWN, ErrorCode
+from .metrics import BMIClassifier, BodyFatClassifier, MuscleClassifier
+from .segmental import GRADE_LABELS
+from .stages import BODY_TYPE_LABELS
+
+LAYOUT = 2
+# 디코딩할 수 있는 레이아웃 (1: extras 없음)
+SUPPORTED_LAYOUTS = (1, 2)
+MAGIC = b"BARSLT\x00\x01"
+
+# 결과 1건 (리틀 엔디언, 패딩 없음)
+RECORD_DTYPE = np.dtype([
+    ("bmi", "<f8"),
+    ("smm_ratio", "<f8"),
+    ("segments", "<u4"),       # 근육 5부위(비트 0~9) + 체지방 5부위(비트 10~19), 부위당 2비트
+    ("bmi_category", "u1"),
+    ("fat_category", "u1"),
+    ("muscle_level", "u1"),
+    ("stage1", "u1"),
+    ("stage2", "u1"),
+    ("stage3", "u1"),
+    ("flags", "u1"),
+    ("error", "u1"),           # (오류 코드 인덱스 << 4) | 실패 단계 인덱스 (0 = 없음)
+])
+
+FLAG_STAGE12 = 1 << 0       # stage1_2가 있음 (없으면 None)
+FLAG_MUSCLE_SEG = 1 << 1    # muscle_seg가 있음
+FLAG_FAT_SEG = 1 << 2       # fat_seg가 있음
+FLAG_MUSCLE_RAW = 1 << 3    # muscle_seg가 등급이 아닌 원본 값 (extras에 보관)
+FLAG_FAT_RAW = 1 << 4       # fat_seg가 등급이 아닌 원본 값 (extras에 보관)
+
+_PART_BITS = 2
+_ABSENT = 3                 # 부위 키가 없는 경우 (등급 코드 0~2 다음 값)
+_SEGMENT_MASK = (1 << (_PART_BITS * len(Constants.BodyPartKeys.ORDER))) - 1
+_FAT_SHIFT = _PART_BITS * len(Constants.BodyPartKeys.ORDER)
+_HEADER_PREFIX = struct.Struct("<8sI")
+_JSON_SCALARS = (type(None), bool, int, float, str)
+_STAGE12_KEYS = ("bmi", "bmi_category", "fat_category", "smm_ratio", "muscle_level", "stage1_type", "stage2_type")
+
+
+def build_code_table():
+    """현재 상수/라벨 정의로 코드 표 생성 {"layout", 필드: [라벨, ...]}"""
+    return {
+        "layout": LAYOUT,
+        "bmi_category": list(BMIClassifier.LABELS),
+        "fat_category": list(BodyFatClassifier.LABELS),
+        "muscle_level": list(MuscleClassifier.LABELS),
+        "body_type": list(BODY_TYPE_LABELS),
+        "stage3": list(STAGE3_LABELS) + [UNKNOWN],
+        "grade": list(GRADE_LABELS),
+        "parts": list(Constants.BodyPartKeys.ORDER),
+        "error": [None] + list(ErrorCode.ALL),
+        "error_stage": [None] + list(STAGES),
+    }
+
+
+def table_version(table):
+    """코드 표 버전 (정규화 JSON의 CRC32)"""
+    canonical = json.dumps(table, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return zlib.crc32(canonical.encode("utf-8"))
+
+
+class EncodedResults:
+    """
+    [인코딩 결과]
+    고정 폭 레코드 배열과 레코드에 담지 못한 원본 부위별 데이터(extras)의 묶음입니다.
+
+    Attributes:
+        records: RECORD_DTYPE 구조화 배열
+        extras (dict): {결과 번호: {"muscle_seg" | "fat_seg": 원본 값}} (보통 비어 있음)
+    """
+
+    def __init__(self, records, extras=None):
+        self.records = records
+        self.extras = extras if extras is not None else {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        return f"EncodedResults(records={len(self.records)}, extras={len(self.extras)})"
+
+
+def _as_encoded(encoded):
+    """EncodedResults 또는 레코드 배열(extras 없음) -> EncodedResults"""
+    if isinstance(encoded, EncodedResults):
+        return encoded
+    return EncodedResults(encoded)
+
+
+def _is_json_exact(value):
+    """json.dumps -> json.loads 후에도 같은 타입/값으로 복원되는 값인지 (튜플, 문자열이 아닌 키 등은 False)"""
+    if type(value) in _JSON_SCALARS:
+        return True
+    if type(value) is list:
+        return all(_is_json_exact(v) for v in value)
+    if type(value) is dict:
+        return all(type(k) is str and _is_json_exact(v) for k, v in value.items())
+    return False
+
+
+class ResultCodec:
+    """
+    [결과 인코더/디코더]
+
+    Args:
+        table (dict): 코드 표 (None이면 build_code_table())
+
+    Usage:
+        codec = ResultCodec()
+        encoded = codec.encode(results)          # EncodedResults (records: RECORD_DTYPE 구조화 배열)
+        data = codec.to_bytes(encoded)           # 코드 표 + extras + 레코드 (저장/전송용)
+        codec, encoded = ResultCodec.from_bytes(data)
+        results = codec.decode(encoded, basic_info)
+    """
+
+    def __init__(self, table=None):
+        self.table = table if table is not None else build_code_table()
+        if self.table.get("layout") not in SUPPORTED_LAYOUTS:
+            raise ValueError(f"지원하지 않는 레코드 레이아웃입니다. (layout={self.table.get('layout')})")
+        self.version = table_version(self.table)
+
+        t = self.table
+        self._codes = {
+            field: {label: code for code, label in enumerate(t[field])}
+            for field in ("bmi_category", "fat_category", "muscle_level", "body_type", "stage3")
+        }
+        self._error_codes = {label: code for code, label in enumerate(t["error"])}
+        self._stage_codes = {label: code for code, label in enumerate(t["error_stage"])}
+
+        # 부위 5개 등급 조합(4^5) <-> 10비트 코드
+        parts = t["parts"]
+        labels = list(t["grade"]) + [None]
+        self._segment_pairs = []
+        self._segment_codes = {}
+        for code in range(1 << (_PART_BITS * len(parts))):
+            grades = [(code >> (_PART_BITS * i)) & _ABSENT for i in range(len(parts))]
+            key = tuple(labels[g] for g in grades)
+            self._segment_codes[key] = code
+            self._segment_pairs.append(tuple((p, l) for p, l in zip(parts, key) if l is not None))
+        self._parts = parts
+
+    # ------------------------------------------------------------------
+    # 인코딩
+    # ------------------------------------------------------------------
+
+    def encode(self, results):
+        """
+        analyze_report() 결과 목록 -> EncodedResults
+        (등급으로 담을 수 없는 원본 부위별 데이터는 extras에 보관)
+
+        Raises:
+            ValueError: 체형/단계/오류 라벨이 코드 표에 없는 등 analyze_report() 형태가 아닌 결과
+        """
+        records = np.zeros(len(results), dtype=RECORD_DTYPE)
+        extras = {}
+        rows = [self._encode_one(i, r, extras) for i, r in enumerate(results)]
+        if rows:
+            columns = list(zip(*rows))
+            for name, values in zip(RECORD_DTYPE.names, columns):
+                records[name] = values
+        return EncodedResults(records, extras)
+
+    def _encode_one(self, index, result, extras):
+        codes = self._codes
+        try:
+            flags = 0
+            bmi = smm_ratio = 0.0
+            bmi_cat = fat_cat = muscle = stage1 = stage2 = 0
+            stage12 = result["stage1_2"]
+            if stage12 is not None:
+                flags |= FLAG_STAGE12
+                bmi = stage12["bmi"]
+                smm_ratio = stage12["smm_ratio"]
+                bmi_cat = codes["bmi_category"][stage12["bmi_category"]]
+                fat_cat = codes["fat_category"][stage12["fat_category"]]
+                muscle = codes["muscle_level"][stage12["muscle_level"]]
+                stage1 = codes["body_type"][stage12["stage1_type"]]
+                stage2 = codes["body_type"][stage12["stage2_type"]]
+                if len(stage12) != len(_STAGE12_KEYS):
+                    raise KeyError(f"stage1_2 키 {sorted(set(stage12) - set(_STAGE12_KEYS))}")
+
+            segments = 0
+            for key, present, raw, shift in (
+                ("muscle_seg", FLAG_MUSCLE_SEG, FLAG_MUSCLE_RAW, 0),
+                ("fat_seg", FLAG_FAT_SEG, FLAG_FAT_RAW, _FAT_SHIFT),
+            ):
+                seg = result[key]
+                if seg is None:
+                    continue
+                code = self._encode_segment(seg)
+                if code is None:
+                    flags |= raw
+                    extras.setdefault(index, {})[key] = seg
+                else:
+                    flags |= present
+                    segments |= code << shift
+
+            error = 0
+            if "error" in result:
+                error = (self._error_codes[result["error"]] << 4) | self._stage_codes[result["error_stage"]]
+            stage3 = codes["stage3"][result["stage3"]]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"results[{index}]: 코드 표로 인코딩할 수 없는 결과입니다. ({e})") from e
+        return (bmi, smm_ratio, segments, bmi_cat, fat_cat, muscle, stage1, stage2, stage3, flags, error)
+
+    def _encode_segment(self, seg):
+        """부위별 등급 딕셔너리 -> 10비트 코드 (등급 코드로 담을 수 없으면 None)"""
+        if type(seg) is not dict:
+            return None
+        try:
+            key = tuple(seg.get(part) for part in self._parts)
+            code = self._segment_codes.get(key)
+        except TypeError:  # 해시할 수 없는 값
+            return None
+        if code is None or len(seg) != sum(label is not None for label in key):
+            return None
+        return code
+
+    # ------------------------------------------------------------------
+    # 디코딩
+    # ------------------------------------------------------------------
+
+    def decode(self, encoded, basic_info=None):
+        """
+        EncodedResults(또는 extras 없는 레코드 배열) -> analyze_report() 형태의 결과 목록
+
+        Args:
+            basic_info: 결과별 basic_info 목록 (None이면 정상 결과도 basic_info=None)
+        """
+        encoded = _as_encoded(encoded)
+        records, extras = encoded.records, encoded.extras
+        t = self.table
+        bmi_labels, fat_labels, muscle_labels = t["bmi_category"], t["fat_category"], t["muscle_level"]
+        body_types, stage3_labels = t["body_type"], t["stage3"]
+        errors, stages = t["error"], t["error_stage"]
+        pairs = self._segment_pairs
+        if basic_info is None:
+            basic_info = [None] * len(records)
+
+        results = []
+        for i, ((bmi, smm_ratio, segments, bmi_cat, fat_cat, muscle, stage1, stage2, stage3, flags, error), info) in enumerate(zip(
+            records.tolist(), basic_info
+        )):
+            result = {
+                "basic_info": info,
+                "stage1_2": {
+                    "bmi": bmi,
+                    "bmi_category": bmi_labels[bmi_cat],
+                    "fat_category": fat_labels[fat_cat],
+                    "smm_ratio": smm_ratio,
+                    "muscle_level": muscle_labels[muscle],
+                    "stage1_type": body_types[stage1],
+                    "stage2_type": body_types[stage2],
+                } if flags & FLAG_STAGE12 else None,
+                "muscle_seg": dict(pairs[segments & _SEGMENT_MASK]) if flags & FLAG_MUSCLE_SEG else None,
+                "fat_seg": dict(pairs[segments >> _FAT_SHIFT]) if flags & FLAG_FAT_SEG else None,
+                "stage3": stage3_labels[stage3],
+            }
+            if flags & (FLAG_MUSCLE_RAW | FLAG_FAT_RAW):
+                result.update(extras[i])
+            if error:
+                result["error"] = errors[error >> 4]
+                result["error_stage"] = stages[error & 0x0F]
+            results.append(result)
+        return results
+
+    def segment_grades(self, encoded):
+        """
+        부위별 등급 코드 행렬 (비트 해제만 수행, 결과 딕셔너리를 만들지 않음)
+
+        Returns:
+            tuple: (근육 N×5, 체지방 N×5) uint8 행렬 - 값은 grade 표 인덱스, 부위 없음(원본 값 포함)은 3
+        """
+        segments = _as_encoded(encoded).records["segments"]
+        shifts = np.arange(len(self._parts), dtype=np.uint32) * _PART_BITS
+        muscle = (segments[:, np.newaxis] >> shifts) & _ABSENT
+        fat = (segments[:, np.newaxis] >> (shifts + _FAT_SHIFT)) & _ABSENT
+        return muscle.astype(np.uint8), fat.astype(np.uint8)
+
+    # ------------------------------------------------------------------
+    # 직렬화
+    # ------------------------------------------------------------------
+
+    def to_bytes(self, encoded):
+        """
+        MAGIC + 헤더(JSON: 버전, 건수, 코드 표, extras) + 레코드 바이트
+
+        Raises:
+            ValueError: extras에 JSON으로 그대로 복원되지 않는 값(튜플, Decimal 등)이 있는 경우
+        """
+        encoded = _as_encoded(encoded)
+        records = encoded.records
+        for index, extra in encoded.extras.items():
+            if not _is_json_exact(extra):
+                raise ValueError(f"results[{index}]: JSON으로 손실 없이 저장할 수 없는 부위별 데이터입니다. ({extra})")
+        header = json.dumps({
+            "version": self.version, "count": len(records), "table": self.table,
+            "extras": [[index, extra] for index, extra in sorted(encoded.extras.items())],
+        }, ensure_ascii=False).encode("utf-8")
+        return _HEADER_PREFIX.pack(MAGIC, len(header)) + header + records.astype(RECORD_DTYPE, copy=False).tobytes()
+
+    @staticmethod
+    def from_bytes(data):
+        """
+        to_bytes() 결과 -> (기록 당시 코드 표의 ResultCodec, EncodedResults(레코드 배열 뷰))
+
+        Raises:
+            ValueError: 형식이 다르거나 코드 표 버전이 헤더와 맞지 않는 경우
+        """
+        if len(data) < _HEADER_PREFIX.size:
+            raise ValueError("결과 인코딩 데이터가 아닙니다. (크기 부족)")
+        magic, header_size = _HEADER_PREFIX.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"결과 인코딩 데이터가 아닙니다. (magic={magic!r})")
+        start = _HEADER_PREFIX.size
+        header = json.loads(bytes(data[start:start + header_size]).decode("utf-8"))
+        codec = ResultCodec(header["table"])
+        if codec.version != header["version"]:
+            raise ValueError(f"코드 표 버전이 맞지 않습니다. (header={header['version']}, table={codec.version})")
+        records = np.frombuffer(data, dtype=RECORD_DTYPE, count=header["count"], offset=start + header_size)
+        return codec, EncodedResults(records, {index: extra for index, extra in header.get("extras", ())})
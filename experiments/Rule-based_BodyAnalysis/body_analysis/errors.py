@@ -0,0 +1,176 @@
+"""
+[분석 오류 처리 (Structured Failure)]
+
+분석 파이프라인에서 발생한 예외를 '오류 코드 + 실패 단계'로 구조화하고,
+오류 로그(Traceback) 출력을 선택적(Opt-in)이며 빈도 제한(Rate-limit)된 방식으로 처리하는 모듈입니다.
+OCR 오인식 등으로 잘못된 입력이 대량으로 들어와도 정상 입력과 비슷한 처리량을 유지하는 것이 목적입니다.
+
+Failure Result:
+    - 실패 결과 딕셔너리는 (상세 여부, 실패 단계, 오류 코드) 조합별로 모듈 로드 시 미리 만들어 공유합니다.
+      (실패 1건당 결과 딕셔너리를 새로 만들지 않으므로, 호출자는 반환된 실패 결과를 수정하면 안 됩니다.)
+    - 기존 결과 키(stage2, stage3 등)는 그대로 '알 수 없음'/None이며, "error"와 "error_stage" 키가 추가됩니다.
+
+Logging:
+    logging 모듈은 로그를 실제로 남길 때만 로드합니다. (스칼라 분석만 하는 호출자의 시작 비용 절감)
+"""
+
+import sys
+from time import monotonic
+
+LOGGER_NAME = "body_analysis"
+
+UNKNOWN = "알 수 없음"
+
+# 파이프라인 단계 (instrumentation.PipelineInstrumentation.STAGES와 동일한 순서)
+STAGES = ("convert", "metrics", "stage12", "normalize", "stage3")
+
+
+class ErrorCode:
+    """
+    [오류 코드]
+    예외 종류를 결과에 기록할 짧은 코드로 분류합니다.
+
+    Mapping:
+        - INVALID_INPUT: TypeError / ValueError / KeyError / AttributeError / IndexError
+          (수치가 아닌 값, 누락된 필드, 딕셔너리가 아닌 입력 등)
+        - ARITHMETIC: ArithmeticError (0으로 나누기, Overflow 등)
+        - INTERNAL: 그 외 예외
+    """
+    INVALID_INPUT = "invalid_input"
+    ARITHMETIC = "arithmetic_error"
+    INTERNAL = "internal_error"
+
+    ALL = (INVALID_INPUT, ARITHMETIC, INTERNAL)
+
+    @staticmethod
+    def from_exception(error):
+        if isinstance(error, (TypeError, ValueError, KeyError, AttributeError, IndexError)):
+            return ErrorCode.INVALID_INPUT
+        if isinstance(error, ArithmeticError):
+            return ErrorCode.ARITHMETIC
+        return ErrorCode.INTERNAL
+
+
+class AnalysisError(Exception):
+    """
+    [분석 실패 예외]
+    파이프라인 내부 예외를 실패 단계(stage)와 오류 코드(code)와 함께 감쌉니다.
+    원래 예외는 __cause__로 연결됩니다.
+    """
+
+    def __init__(self, stage, cause):
+        super().__init__(stage, cause)
+        self.stage = stage
+        self.code = ErrorCode.from_exception(cause)
+        self.__cause__ = cause
+
+    def __str__(self):
+        return f"{self.code} at {self.stage}: {self.__cause__}"
+
+
+def _build_failure_results():
+    results = {}
+    for stage in STAGES:
+        for code in ErrorCode.ALL:
+            results[(False, stage, code)] = {
+                "stage2": UNKNOWN,
+                "stage3": UNKNOWN,
+                "error": code,
+                "error_stage": stage,
+            }
+            results[(True, stage, code)] = {
+                "basic_info": None,
+                "stage1_2": None,
+                "muscle_seg": None,
+                "fat_seg": None,
+                "stage3": UNKNOWN,
+                "error": code,
+                "error_stage": stage,
+            }
+    return results
+
+
+_FAILURE_RESULTS = _build_failure_results()
+
+
+def failure_result(error, detailed=False):
+    """
+    AnalysisError에 해당하는 실패 결과 반환
+    (미리 만들어 둔 템플릿의 복사본이므로 호출자가 수정해도 다른 실패 결과에 영향을 주지 않습니다)
+
+    Args:
+        error (AnalysisError): 분석 실패 예외 (그 외 예외는 단계를 알 수 없으므로 'convert'로 처리)
+        detailed (bool): True이면 analyze_report() 형태의 결과
+    """
+    if isinstance(error, AnalysisError):
+        return dict(_FAILURE_RESULTS[(detailed, error.stage, error.code)])
+    return dict(_FAILURE_RESULTS[(detailed, STAGES[0], ErrorCode.from_exception(error))])
+
+
+class ErrorReporter:
+    """
+    [오류 보고기]
+    분석 실패를 (단계, 오류 코드)별로 집계하고, 필요한 경우에만 로그를 남깁니다.
+
+    - 기본값(capture_traceback=False)에서는 DEBUG 레벨 한 줄 로그만 남기며,
+      DEBUG가 비활성화된 경우 메시지 포맷팅 비용도 들지 않습니다.
+    - capture_traceback=True이면 interval초마다 최대 max_per_interval건까지 Traceback을 포함해
+      ERROR 레벨로 기록하고, 초과분은 다음 구간 시작 시 생략 건수만 기록합니다.
+
+    Args:
+        capture_traceback (bool): Traceback 기록 여부
+        max_per_interval (int): 구간당 Traceback 기록 최대 건수
+        interval (float): 빈도 제한 구간 길이(초)
+        log: 사용할 logging.Logger (기본값: "body_analysis")
+    """
+
+    def __init__(self, capture_traceback=False, max_per_interval=10, interval=60.0, log=None):
+        self.capture_traceback = capture_traceback
+        self.max_per_interval = max_per_interval
+        self.interval = interval
+        self._log = log
+        self.counts = {}
+        self._window_start = monotonic()
+        self._emitted = 0
+        self._suppressed = 0
+
+    @property
+    def log(self):
+        """사용할 Logger (최초 사용 시 logging 로드)"""
+        if self._log is None:
+            import logging
+            self._log = logging.getLogger(LOGGER_NAME)
+        return self._log
+
+    def report(self, error):
+        """분석 실패 1건 보고 (error: AnalysisError 또는 일반 예외)"""
+        key = (getattr(error, "stage", STAGES[0]), getattr(error, "code", ErrorCode.INTERNAL))
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+        if not self.capture_traceback:
+            # 애플리케이션이 logging을 로드하지 않았다면 DEBUG 로그를 받을 설정도 없으므로 로드하지 않습니다.
+            if self._log is None and "logging" not in sys.modules:
+                return
+            import logging
+            log = self.log
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("분석 실패: %s", error)
+            return
+
+        now = monotonic()
+        if now - self._window_start >= self.interval:
+            if self._suppressed:
+                self.log.warning("분석 실패 로그 %d건 생략 (최근 %.0f초)", self._suppressed, self.interval)
+            self._window_start = now
+            self._emitted = 0
+            self._suppressed = 0
+
+        if self._emitted < self.max_per_interval:
+            self._emitted += 1
+            self.log.error("분석 파이프라인 실행 중 오류 발생: %s", error, exc_info=error)
+        else:
+            self._suppressed += 1
+
+    def stats(self):
+        """(단계, 오류 코드)별 실패 건수 {"stage:code": count}"""
+        return {f"{stage}:{code}": count for (stage, code), count in self.counts.items()}
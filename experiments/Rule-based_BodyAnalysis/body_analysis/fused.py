@@ -0,0 +1,256 @@
+"""
+[단일 패스 분석 (Fused Fast Path)]
+
+analyze_full_pipeline()의 결과(stage2, stage3)만 필요할 때 사용하는 단일 패스 분석 모듈입니다.
+BodyCompositionData 변환, stage12_result 딕셔너리, 부위별 비율/등급 딕셔너리를 만들지 않고
+입력 수치에서 바로 카테고리 코드와 상/하체 분포를 계산합니다.
+
+Equivalence:
+    - Stage 1/2는 같은 규칙으로 컴파일된 Stage12DecisionTable을 조회합니다.
+    - Stage 3는 팔/다리의 '표준이상' 개수만 사용하므로, 몸통 등급 계산은 생략하고
+      segmental.py와 같은 순서의 float 연산으로 팔/다리 등급만 판정합니다.
+    - 예외가 발생하는 입력은 이 모듈에서 처리하지 않습니다. (호출자가 단계별 경로로 다시 분석하여
+      실패 단계/오류 코드를 동일하게 보고합니다. BodyCompositionAnalyzer(fast_path=True) 참고)
+"""
+
+import bisect
+import math
+from . import constants as Constants
+from .metrics import BMIClassifier, BodyFatClassifier, MuscleClassifier
+from .stages import BODY_TYPE_LABELS, Stage12DecisionTable
+
+_LEFT_ARM = Constants.BodyPartKeys.LEFT_ARM
+_RIGHT_ARM = Constants.BodyPartKeys.RIGHT_ARM
+_LEFT_LEG = Constants.BodyPartKeys.LEFT_LEG
+_RIGHT_LEG = Constants.BodyPartKeys.RIGHT_LEG
+_ABOVE = Constants.BodyPartLevel.ABOVE
+
+_BALANCED, _UPPER, _LOWER = 0, 1, 2
+# (근육 분포, 체지방 분포) -> Stage 3 라벨 (Stage3BalanceAnalyzer.classify와 동일)
+_STAGE3 = {
+    (_BALANCED, _BALANCED): "표준형",
+    (_UPPER, _BALANCED): "상체발달형",
+    (_LOWER, _BALANCED): "하체발달형",
+}
+for _muscle_dist in (_BALANCED, _UPPER, _LOWER):
+    _STAGE3[(_muscle_dist, _UPPER)] = "상체비만형"
+    _STAGE3[(_muscle_dist, _LOWER)] = "하체비만형"
+
+
+class FusedPipeline:
+    """
+    [단일 패스 파이프라인]
+    원본 입력(딕셔너리 또는 BodyCompositionData 호환 객체)에서 (stage2 라벨, stage3 라벨)을 계산합니다.
+    """
+
+    @staticmethod
+    def analyze(raw_input, margin=Constants.ValidationLimits.DEFAULT_MARGIN, thresholds=None):
+        """
+        Args:
+            thresholds: 성별/연령대별 임계값 표 (thresholds.ThresholdTable, None이면 constants.py의 단일 기준)
+
+        Returns:
+            dict: {"stage2", "stage3"} (analyze_full_pipeline()과 동일)
+
+        Raises:
+            Exception: 단계별 경로에서도 실패하는 입력 (호출자가 단계별 경로로 재분석)
+        """
+        # 0. 입력 추출 (BodyCompositionData.from_dict와 같은 필드 그룹 규칙)
+        if isinstance(raw_input, dict):
+            d = raw_input
+            if "sex" in d and "age" in d and "height_cm" in d and "weight_kg" in d:
+                weight = d["weight_kg"]
+                sex = d["sex"]
+                age = d["age"]
+            else:
+                weight = sex = age = None
+            if "bmi" in d and "fat_rate" in d and "smm" in d:
+                bmi = d["bmi"]
+                fat_rate = d["fat_rate"]
+                smm = d["smm"]
+            else:
+                bmi = fat_rate = smm = None
+            if "muscle_seg" in d:
+                muscle_seg = d["muscle_seg"]
+                fat_seg = d.get("fat_seg")
+            else:
+                muscle_seg = fat_seg = None
+        else:
+            weight = raw_input.weight_kg
+            sex = raw_input.sex
+            age = raw_input.age
+            bmi = raw_input.bmi
+            fat_rate = raw_input.fat_rate
+            smm = raw_input.smm
+            muscle_seg = raw_input.muscle_seg
+            fat_seg = raw_input.fat_seg
+
+        # 1~2. 기초 지표 코드 -> Stage 1/2 결정 테이블
+        fat_edges = muscle_edges = None
+        if thresholds is not None:
+            fat_edges, muscle_edges = thresholds.lookup(sex, age)
+        stage2_code = Stage12DecisionTable.STAGE2[Stage12DecisionTable.index(
+            FusedPipeline._bmi_code(bmi),
+            FusedPipeline._fat_code(fat_rate, fat_edges),
+            FusedPipeline._muscle_code(smm, weight, muscle_edges),
+        )]
+
+        # 3. 상/하체 분포 (체지방 분포가 치우치면 체지방 기준, 아니면 근육 기준)
+        fat_dist = _BALANCED
+        if fat_seg is not None:
+            fat_dist = FusedPipeline._distribution(
+                fat_seg, FusedPipeline._total_fat(weight, fat_rate), margin
+            )
+        muscle_dist = FusedPipeline._distribution(muscle_seg, smm, margin)
+
+        return {
+            "stage2": BODY_TYPE_LABELS[stage2_code],
+            "stage3": _STAGE3[(muscle_dist, fat_dist)],
+        }
+
+    # ------------------------------------------------------------------
+    # 기초 지표 (metrics.py와 같은 비교, 문자열 대신 LABELS 인덱스 반환)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _bmi_code(bmi):
+        try:
+            bmi = float(bmi)
+        except (TypeError, ValueError):
+            return BMIClassifier.UNKNOWN_CODE
+        if not math.isfinite(bmi):
+            return BMIClassifier.UNKNOWN_CODE
+        t = Constants.BMIThreshold
+        if bmi < t.UNDERWEIGHT:
+            return 0
+        if bmi < t.NORMAL:
+            return 1
+        if bmi < t.OVERWEIGHT:
+            return 2
+        if bmi < t.OBESE_1:
+            return 3
+        if bmi < t.OBESE_2:
+            return 4
+        return 5
+
+    @staticmethod
+    def _fat_code(fat_rate, edges=None):
+        try:
+            fat_rate = float(fat_rate)
+        except (TypeError, ValueError):
+            return BodyFatClassifier.UNKNOWN_CODE
+        if not math.isfinite(fat_rate):
+            return BodyFatClassifier.UNKNOWN_CODE
+        if edges is not None:
+            return bisect.bisect_right(edges, fat_rate)
+        t = Constants.BodyFatThreshold
+        if fat_rate < t.LOW:
+            return 0
+        if fat_rate < t.NORMAL:
+            return 1
+        if fat_rate < t.OVERWEIGHT:
+            return 2
+        return 3
+
+    @staticmethod
+    def _muscle_code(smm, weight, edges=None):
+        try:
+            smm = float(smm)
+            weight = float(weight)
+        except (TypeError, ValueError):
+            return MuscleClassifier.UNKNOWN_CODE
+        if weight == 0 or not math.isfinite(smm) or not math.isfinite(weight):
+            return MuscleClassifier.UNKNOWN_CODE
+        ratio = smm / weight
+        if not math.isfinite(ratio):
+            return MuscleClassifier.UNKNOWN_CODE
+        if edges is not None:
+            return bisect.bisect_right(edges, ratio)
+        t = Constants.MuscleRatioThreshold
+        if ratio >= t.VERY_HIGH:
+            return 4
+        if ratio >= t.HIGH:
+            return 3
+        if ratio >= t.SUFFICIENT:
+            return 2
+        if ratio >= t.NORMAL:
+            return 1
+        return 0
+
+    @staticmethod
+    def _total_fat(weight, fat_rate):
+        """BodyCompositionData.get_total_fat()과 동일"""
+        try:
+            total_fat = weight * fat_rate / 100.0
+            if not math.isfinite(total_fat) or total_fat < 0:
+                return 0.0
+            return total_fat
+        except (TypeError, ZeroDivisionError):
+            return 0.0
+
+    # ------------------------------------------------------------------
+    # 부위별 분포 (segmental.py + Stage3BalanceAnalyzer.analyze_distribution)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _distribution(seg, total, margin):
+        """부위별 입력 -> 분포 코드 (_BALANCED / _UPPER / _LOWER)"""
+        if not isinstance(seg, dict):
+            return _BALANCED
+
+        oversized = False
+        for value in seg.values():
+            if value.__class__ is float:
+                continue
+            if not isinstance(value, (int, float)):
+                # 이미 등급(텍스트)으로 주어진 데이터는 그대로 사용합니다.
+                arm_high = (seg.get(_RIGHT_ARM) == _ABOVE) + (seg.get(_LEFT_ARM) == _ABOVE)
+                leg_high = (seg.get(_RIGHT_LEG) == _ABOVE) + (seg.get(_LEFT_LEG) == _ABOVE)
+                break
+            if isinstance(value, int):
+                try:
+                    float(value)
+                except OverflowError:
+                    oversized = True
+        else:
+            # 수치형: 기준 총량 또는 margin을 사용할 수 없으면 모든 부위가 '표준'입니다.
+            try:
+                total = float(total)
+            except (TypeError, ValueError):
+                return _BALANCED
+            if total == 0 or not math.isfinite(total):
+                return _BALANCED
+            if oversized:
+                # 단계별 경로는 기준 총량이 유효하면 모든 부위 값을 float으로 변환하므로 같은 예외를 냅니다.
+                raise OverflowError("int too large to convert to float")
+            try:
+                margin = float(margin)
+            except (TypeError, ValueError):
+                return _BALANCED
+            if not math.isfinite(margin):
+                return _BALANCED
+            arm_high = FusedPipeline._high_count(
+                seg.get(_LEFT_ARM, 0), seg.get(_RIGHT_ARM, 0), total, margin
+            )
+            leg_high = FusedPipeline._high_count(
+                seg.get(_LEFT_LEG, 0), seg.get(_RIGHT_LEG, 0), total, margin
+            )
+
+        if leg_high >= 2 and arm_high < 2:
+            return _LOWER
+        if arm_high >= 2 and leg_high < 2:
+            return _UPPER
+        return _BALANCED
+
+    @staticmethod
+    def _high_count(left, right, total, margin):
+        """좌/우 한 쌍 중 '표준이상'(비율 >= 좌우 평균 × (1 + margin))인 부위 수"""
+        left = float(left)
+        right = float(right)
+        left = left / total if math.isfinite(left) else 0.0
+        right = right / total if math.isfinite(right) else 0.0
+        ref = (left + right) / 2.0
+        if ref == 0 or not math.isfinite(ref):
+            return 0
+        upper = ref * (1 + margin)
+        return (math.isfinite(left) and left >= upper) + (math.isfinite(right) and right >= upper)
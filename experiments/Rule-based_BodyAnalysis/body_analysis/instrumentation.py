@@ -0,0 +1,158 @@
+"""
+[파이프라인 계측 (Instrumentation)]
+
+analyze_full_pipeline 내부의 단계별 소요 시간과 Fallback 발생 빈도를 수집하는 모듈입니다.
+지연 시간이 급증했을 때 어느 단계(입력 변환, 기초 지표, Stage 1/2, 정규화, Stage 3)가 원인인지,
+그리고 각 단계가 '알 수 없음'이나 기본 분류값으로 떨어지는 비율이 얼마인지 확인하는 용도입니다.
+
+Usage:
+    instrumentation = PipelineInstrumentation()
+    analyzer = BodyCompositionAnalyzer(instrumentation=instrumentation)
+    ...
+    instrumentation.snapshot()  # 수집(Scrape)용 딕셔너리
+
+Extension:
+    start / lap / observe / record_error 네 메서드를 구현한 객체라면 어떤 것이든 분석기에 연결할 수 있습니다.
+    (예: 외부 모니터링 시스템으로 바로 전송하는 구현체)
+    계측기가 연결되지 않은 경우(None) 분석기는 단계마다 None 비교 한 번 외의 비용을 들이지 않습니다.
+"""
+
+import math
+from time import perf_counter_ns
+from .segmental import SegmentalAnalyzer
+
+UNKNOWN = "알 수 없음"
+
+
+class PipelineInstrumentation:
+    """
+    [기본 계측기]
+    단계별 호출 수/누적 시간(ns)과 Fallback 카운터를 메모리에 누적합니다.
+
+    Stages:
+        - convert: 입력 딕셔너리 → BodyCompositionData 변환
+        - metrics: BMI / 체지방 / 근육 기초 지표 분류
+        - stage12: Stage 1 체형 분류 + Stage 2 근육 보정
+        - normalize: 부위별 근육/체지방 정규화 (DataNormalizer)
+        - stage3: 상하체 밸런스 분석
+
+    Fallbacks:
+        - bmi_category / fat_category / muscle_level / stage1_type / stage2_type: '알 수 없음' 반환 횟수
+        - muscle_seg_default / fat_seg_default: 수치형 부위 데이터가 있으나 기준 총량(SMM, 체지방량)을
+          사용할 수 없어 모든 부위가 기본값('표준')으로 분류된 횟수
+        - muscle_seg_missing: 부위별 근육 데이터가 없어 밸런스 분석이 기본값으로 처리된 횟수
+    """
+
+    STAGES = ("convert", "metrics", "stage12", "normalize", "stage3")
+    FALLBACKS = (
+        "bmi_category", "fat_category", "muscle_level", "stage1_type", "stage2_type",
+        "muscle_seg_default", "fat_seg_default", "muscle_seg_missing",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """모든 카운터 초기화"""
+        self.calls = 0
+        self.errors = 0
+        self.error_stages = dict.fromkeys(self.STAGES, 0)
+        self.stage_counts = dict.fromkeys(self.STAGES, 0)
+        self.stage_ns = dict.fromkeys(self.STAGES, 0)
+        self.fallbacks = dict.fromkeys(self.FALLBACKS, 0)
+
+    # ------------------------------------------------------------------
+    # 분석기 Hook
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """분석 1건 시작 (반환값은 다음 lap()에 전달할 기준 시각)"""
+        self.calls += 1
+        return perf_counter_ns()
+
+    def lap(self, stage, mark):
+        """직전 기준 시각(mark)부터 현재까지를 stage 소요 시간으로 누적하고 현재 시각 반환"""
+        now = perf_counter_ns()
+        self.stage_ns[stage] += now - mark
+        self.stage_counts[stage] += 1
+        return now
+
+    def observe(self, data, stage12_result, muscle_seg_raw, fat_seg_raw, muscle_seg):
+        """
+        분석 결과를 검사하여 Fallback 카운터 갱신
+
+        Args:
+            data: 분석한 BodyCompositionData
+            stage12_result (dict): Stage 1/2 결과
+            muscle_seg_raw, fat_seg_raw: 정규화 전 부위별 입력
+            muscle_seg: 정규화된 부위별 근육 결과
+        """
+        fallbacks = self.fallbacks
+        for name in ("bmi_category", "fat_category", "muscle_level", "stage1_type", "stage2_type"):
+            if stage12_result[name] == UNKNOWN:
+                fallbacks[name] += 1
+
+        if not isinstance(muscle_seg, dict):
+            fallbacks["muscle_seg_missing"] += 1
+        elif not _usable_total(data.smm) and SegmentalAnalyzer.is_numeric_data(muscle_seg_raw):
+            fallbacks["muscle_seg_default"] += 1
+
+        if (
+            fat_seg_raw is not None
+            and not _usable_total(data.get_total_fat())
+            and SegmentalAnalyzer.is_numeric_data(fat_seg_raw)
+        ):
+            fallbacks["fat_seg_default"] += 1
+
+    def record_error(self, error):
+        """파이프라인 예외 발생 기록 (errors.AnalysisError이면 실패 단계별로도 집계)"""
+        self.errors += 1
+        stage = getattr(error, "stage", None)
+        if stage in self.error_stages:
+            self.error_stages[stage] += 1
+
+    # ------------------------------------------------------------------
+    # 수집(Export)
+    # ------------------------------------------------------------------
+
+    def snapshot(self):
+        """
+        현재 카운터를 딕셔너리로 반환
+
+        Returns:
+            dict: {
+                "calls", "errors", "error_stages": {stage: count},
+                "stages": {stage: {"count", "total_ms", "mean_us"}},
+                "fallbacks": {name: count},
+                "fallback_rates": {name: count / calls}
+            }
+        """
+        stages = {}
+        for stage in self.STAGES:
+            count = self.stage_counts[stage]
+            total_ns = self.stage_ns[stage]
+            stages[stage] = {
+                "count": count,
+                "total_ms": total_ns / 1e6,
+                "mean_us": total_ns / count / 1e3 if count else 0.0,
+            }
+        calls = self.calls
+        return {
+            "calls": calls,
+            "errors": self.errors,
+            "error_stages": dict(self.error_stages),
+            "stages": stages,
+            "fallbacks": dict(self.fallbacks),
+            "fallback_rates": {
+                name: count / calls if calls else 0.0 for name, count in self.fallbacks.items()
+            },
+        }
+
+
+def _usable_total(total):
+    """부위별 비율 계산의 기준 총량으로 사용할 수 있는 값인지 (segmental.calculate_development_ratio 기준)"""
+    try:
+        total = float(total)
+    except (TypeError, ValueError):
+        return False
+    return total != 0 and math.isfinite(total)
@@ -4,11 +4,43 @@
 단일 측정 항목(Metric)에 대한 기본적인 등급 분류 로직을 담당하는 모듈입니다.
 각 클래스는 Stateless하게 설계되어 있으며, 입력된 수치 데이터를
 도메인 상수(constants.py)에 정의된 기준과 비교하여 범주형 데이터(Categorical Data)로 변환합니다.
+
+각 분류기는 스칼라 버전(classify)과 배열 버전(classify_array)을 함께 제공합니다.
+배열 버전은 오름차순 경계값(edges)에 대한 정렬 탐색(searchsorted)으로 컬럼 전체를 한 번에 구간화하고,
+라벨 대신 정수 코드를 반환합니다. 코드 → 라벨 변환은 각 클래스의 LABELS 튜플을 사용합니다.
 """
 
+import bisect
 import math
 from . import constants as Constants
 
+UNKNOWN = "알 수 없음"
+
+
+def _bin_codes(values, edges, unknown_code, strata=None):
+    """
+    [정렬 경계 기반 구간화]
+    오름차순 경계값(edges) 중 값보다 작거나 같은 경계의 개수를 구간 코드로 사용합니다.
+    (value < edges[0] -> 0, edges[0] <= value < edges[1] -> 1, ...)
+    strata(층 번호 배열)가 있으면 edges는 층 수 × K 경계값 표이며, 레코드마다 edges[층] 행을 사용합니다.
+    NaN/inf 값은 스칼라 경로와 동일하게 unknown_code('알 수 없음')로 처리합니다.
+    """
+    # 배열 버전을 사용하지 않는 호출자가 NumPy에 의존하지 않도록 사용 시점에 로드합니다.
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    if strata is not None:
+        # 성별/연령대별 임계값 표: 경계값 열마다 층별 값을 모아 '값 >= 경계값' 개수를 더합니다.
+        table = np.asarray(edges, dtype=np.float64)
+        codes = np.zeros(values.shape, dtype=np.int8)
+        with np.errstate(invalid="ignore"):
+            for k in range(table.shape[1]):
+                codes += values >= table[:, k][strata]
+    else:
+        codes = np.searchsorted(edges, values, side="right").astype(np.int8)
+    codes[~np.isfinite(values)] = unknown_code
+    return codes
+
 class BMIClassifier:
     """
     [BMI 평가 유틸리티]
@@ -16,6 +48,22 @@ class BMIClassifier:
     입력값에 대한 타입 검사 및 예외 처리를 포함하여 로직의 안정성을 보장합니다.
     """
     
+    LABELS = ("저체중", "정상", "과체중", "비만1단계", "비만2단계", "고도비만", UNKNOWN)
+    UNKNOWN_CODE = len(LABELS) - 1
+    
+    @staticmethod
+    def edges():
+        """구간 경계값 (오름차순)"""
+        t = Constants.BMIThreshold
+        return (t.UNDERWEIGHT, t.NORMAL, t.OVERWEIGHT, t.OBESE_1, t.OBESE_2)
+    
+    @staticmethod
+    def classify_array(bmi, edges=None):
+        """BMI 배열을 카테고리 코드 배열로 분류 (LABELS 인덱스)"""
+        if edges is None:
+            edges = BMIClassifier.edges()
+        return _bin_codes(bmi, edges, BMIClassifier.UNKNOWN_CODE)
+    
     @staticmethod
     def classify(bmi):
         """BMI 값을 카테고리로 분류"""
@@ -50,15 +98,37 @@ class BodyFatClassifier:
     체지방률(Fat Rate) 수치를 입력받아 표준/경도비만/비만 등의 등급으로 분류합니다.
     """
     
+    LABELS = ("표준미만", "표준", "과체중", "비만", UNKNOWN)
+    UNKNOWN_CODE = len(LABELS) - 1
+    
+    @staticmethod
+    def edges():
+        """구간 경계값 (오름차순)"""
+        t = Constants.BodyFatThreshold
+        return (t.LOW, t.NORMAL, t.OVERWEIGHT)
+    
     @staticmethod
-    def classify(fat_rate):
-        """체지방률을 카테고리로 분류"""
+    def classify_array(fat_rate, edges=None, strata=None):
+        """
+        체지방률 배열을 카테고리 코드 배열로 분류 (LABELS 인덱스)
+        strata가 있으면 edges는 층별 경계값 표(층 수 × 3)입니다. (thresholds.ThresholdTable)
+        """
+        if edges is None:
+            edges = BodyFatClassifier.edges()
+        return _bin_codes(fat_rate, edges, BodyFatClassifier.UNKNOWN_CODE, strata)
+    
+    @staticmethod
+    def classify(fat_rate, edges=None):
+        """체지방률을 카테고리로 분류 (edges: 성별/연령대별 경계값 튜플, None이면 constants.BodyFatThreshold)"""
         try:
             fat_rate = float(fat_rate)
             
             if not math.isfinite(fat_rate):
                 return "알 수 없음"
             
+            if edges is not None:
+                return BodyFatClassifier.LABELS[bisect.bisect_right(edges, fat_rate)]
+            
             if fat_rate < Constants.BodyFatThreshold.LOW:
                 return "표준미만"
             elif fat_rate < Constants.BodyFatThreshold.NORMAL:
@@ -79,9 +149,53 @@ class MuscleClassifier:
     이를 기반으로 근육 발달 수준을 평가합니다. (예: 근육 부족, 적정, 근육 많음)
     """
     
+    LABELS = ("근육 적음", "근육 보통", "근육 충분", "근육 많음", "근육 매우 많음", UNKNOWN)
+    UNKNOWN_CODE = len(LABELS) - 1
+    
     @staticmethod
-    def classify(smm, weight):
-        """근육량/체중 비율로 근육 레벨 분류"""
+    def edges():
+        """구간 경계값 (오름차순, 스칼라 경로의 내림차순 비교와 동일한 구간)"""
+        t = Constants.MuscleRatioThreshold
+        return (t.NORMAL, t.SUFFICIENT, t.HIGH, t.VERY_HIGH)
+    
+    @staticmethod
+    def ratio_array(smm, weight):
+        """체중 대비 골격근량 비율 배열 (계산 불가 항목은 NaN)"""
+        import numpy as np
+
+        smm = np.asarray(smm, dtype=np.float64)
+        weight = np.asarray(weight, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            ratio = smm / weight
+        # weight == 0 또는 smm/weight가 비정상 값이면 스칼라 경로와 같이 '알 수 없음'
+        invalid = (weight == 0) | ~np.isfinite(smm) | ~np.isfinite(weight)
+        ratio[invalid] = np.nan
+        return ratio
+    
+    @staticmethod
+    def classify_array(smm, weight, edges=None, strata=None):
+        """
+        근육량/체중 비율 배열을 근육 레벨 코드 배열로 분류 (edges/strata는 classify_ratio_array()와 같음)
+        
+        Returns:
+            tuple: (비율 배열, LABELS 인덱스 코드 배열) - 비율은 반올림하지 않은 값입니다.
+        """
+        ratio = MuscleClassifier.ratio_array(smm, weight)
+        return ratio, MuscleClassifier.classify_ratio_array(ratio, edges, strata)
+    
+    @staticmethod
+    def classify_ratio_array(ratio, edges=None, strata=None):
+        """
+        이미 계산된 비율 배열(ratio_array())을 근육 레벨 코드 배열로 분류 (LABELS 인덱스)
+        strata가 있으면 edges는 층별 경계값 표(층 수 × 4)입니다. (thresholds.ThresholdTable)
+        """
+        if edges is None:
+            edges = MuscleClassifier.edges()
+        return _bin_codes(ratio, edges, MuscleClassifier.UNKNOWN_CODE, strata)
+    
+    @staticmethod
+    def classify(smm, weight, edges=None):
+        """근육량/체중 비율로 근육 레벨 분류 (edges: 성별/연령대별 경계값 튜플, None이면 constants.MuscleRatioThreshold)"""
         try:
             smm = float(smm)
             weight = float(weight)
@@ -94,6 +208,9 @@ class MuscleClassifier:
             if not math.isfinite(ratio):
                 return 0.0, "알 수 없음"
             
+            if edges is not None:
+                return round(ratio, 3), MuscleClassifier.LABELS[bisect.bisect_right(edges, ratio)]
+            
             if ratio >= Constants.MuscleRatioThreshold.VERY_HIGH:
                 level = "근육 매우 많음"
             elif ratio >= Constants.MuscleRatioThreshold.HIGH:
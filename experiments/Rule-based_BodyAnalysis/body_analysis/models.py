@@ -7,6 +7,11 @@ DTO(Data Transfer Object) 역할을 수행하며, 외부 입력(Dictionary/JSON)
 """
 
 import math
+from array import array
+from . import constants as Constants
+
+_SEGMENT_ORDER = Constants.BodyPartKeys.ORDER
+_SEGMENT_KEYS = frozenset(_SEGMENT_ORDER)
 
 class BodyCompositionData:
     """
@@ -95,3 +100,139 @@ class BodyCompositionData:
             return total_fat
         except (TypeError, ZeroDivisionError):
             return 0.0
+
+
+class CompactBodyCompositionData:
+    """
+    [고정 레이아웃 체성분 데이터 객체]
+    BodyCompositionData와 동일한 인터페이스를 제공하는 메모리 절약형 모델 클래스입니다.
+    대량의 측정 데이터를 메모리에 적재하는 코호트 분석(Cohort Analytics) 용도로 사용합니다.
+    - __slots__ 기반으로 인스턴스별 __dict__를 생성하지 않습니다.
+    - 부위별 수치 데이터는 부위 키 딕셔너리 대신 5칸짜리 float 배열(array('d'))로 저장합니다.
+      (열 순서: Constants.BodyPartKeys.ORDER)
+    - muscle_seg / fat_seg 속성은 접근 시점에 딕셔너리로 복원되므로 분석 파이프라인에 그대로 입력할 수 있습니다.
+    
+    Storage:
+        - 5개 부위가 모두 있는 수치형(int/float) 부위 데이터 -> array('d')
+        - 그 외(등급 데이터, 누락/추가 키, Decimal 등 다른 수치 타입, None 등) -> 원본 값 그대로
+          (분석 결과가 BodyCompositionData와 항상 같도록 변환하지 않습니다)
+    """
+    
+    __slots__ = (
+        "sex", "age", "height_cm", "weight_kg",
+        "bmi", "fat_rate", "smm",
+        "muscle_values", "fat_values",
+    )
+    
+    def __init__(self):
+        self.sex = None
+        self.age = None
+        self.height_cm = None
+        self.weight_kg = None
+        self.bmi = None
+        self.fat_rate = None
+        self.smm = None
+        self.muscle_values = None
+        self.fat_values = None
+    
+    @classmethod
+    def from_dict(cls, data_dict):
+        """딕셔너리를 CompactBodyCompositionData 객체로 변환 (BodyCompositionData.from_dict와 동일한 규칙)"""
+        # 슬롯마다 한 번씩만 기록하도록 __init__을 거치지 않고 생성합니다.
+        obj = cls.__new__(cls)
+        d = data_dict
+        
+        if "sex" in d and "age" in d and "height_cm" in d and "weight_kg" in d:
+            obj.sex = d["sex"]
+            obj.age = d["age"]
+            obj.height_cm = d["height_cm"]
+            obj.weight_kg = d["weight_kg"]
+        else:
+            obj.sex = obj.age = obj.height_cm = obj.weight_kg = None
+        
+        if "bmi" in d and "fat_rate" in d and "smm" in d:
+            obj.bmi = d["bmi"]
+            obj.fat_rate = d["fat_rate"]
+            obj.smm = d["smm"]
+        else:
+            obj.bmi = obj.fat_rate = obj.smm = None
+        
+        if "muscle_seg" in d:
+            obj.muscle_values = _pack_segment(d["muscle_seg"])
+            obj.fat_values = _pack_segment(d.get("fat_seg"))
+        else:
+            obj.muscle_values = obj.fat_values = None
+        
+        return obj
+    
+    @classmethod
+    def from_dicts(cls, records):
+        """딕셔너리 목록을 일괄 변환"""
+        from_dict = cls.from_dict
+        return [from_dict(record) for record in records]
+    
+    @classmethod
+    def from_json_lines(cls, lines):
+        """JSON Lines(한 줄에 레코드 하나) 텍스트 줄 목록/파일 객체를 일괄 변환 (빈 줄은 건너뜀)"""
+        import json
+        
+        from_dict = cls.from_dict
+        return [from_dict(json.loads(line)) for line in lines if line.strip()]
+    
+    @classmethod
+    def from_json(cls, text):
+        """레코드 배열 형태의 JSON 문자열을 일괄 변환"""
+        import json
+        
+        return cls.from_dicts(json.loads(text))
+    
+    set_basic_info = BodyCompositionData.set_basic_info
+    set_composition = BodyCompositionData.set_composition
+    get_total_fat = BodyCompositionData.get_total_fat
+    
+    def set_segmental_data(self, muscle_seg, fat_seg=None):
+        """부위별 데이터 설정"""
+        self.muscle_values = _pack_segment(muscle_seg)
+        self.fat_values = _pack_segment(fat_seg)
+        return self
+    
+    @property
+    def muscle_seg(self):
+        """부위별 근육 데이터 (딕셔너리로 복원)"""
+        return _unpack_segment(self.muscle_values)
+    
+    @property
+    def fat_seg(self):
+        """부위별 체지방 데이터 (딕셔너리로 복원)"""
+        return _unpack_segment(self.fat_values)
+
+
+def _pack_segment(seg_data):
+    """
+    부위별 딕셔너리 → 고정 순서 배열
+    부위 키가 정확히 5개 부위이고 모든 값이 float로 손실 없이 바뀌는 수치(bool 제외)인 경우에만 배열로 저장하고,
+    그 외(등급 데이터, 일부 부위 누락, 추가 키, Decimal, double 범위를 넘는 정수 등)는 원본 딕셔너리를 그대로 보관합니다.
+    (원본과 분석 경로가 달라지지 않도록 변환 가능 여부를 추측하지 않습니다)
+    """
+    if type(seg_data) is not dict or seg_data.keys() != _SEGMENT_KEYS:
+        return seg_data
+    values = list(map(seg_data.__getitem__, _SEGMENT_ORDER))
+    for v in values:
+        if type(v) is not float and (type(v) is not int or not _is_exact_float(v)):
+            return seg_data
+    return array("d", values)
+
+
+def _is_exact_float(value):
+    """정수가 float로 정확히 표현되는지 여부 (10**400처럼 범위를 넘거나 2**53 초과로 반올림되는 값은 False)"""
+    try:
+        return float(value) == value
+    except OverflowError:
+        return False
+
+
+def _unpack_segment(packed):
+    """고정 순서 배열 → 부위별 딕셔너리"""
+    if isinstance(packed, array):
+        return dict(zip(_SEGMENT_ORDER, packed))
+    return packed
@@ -0,0 +1,137 @@
+"""
+[병렬 배치 분석 (Multi-process Executor)]
+
+임계값(constants.py) 변경 후 전체 레코드를 재분석하는 작업처럼 CPU 바운드인 대량 분석을
+프로세스 풀(Process Pool)로 분산 실행하는 모듈입니다.
+
+Design:
+    - 입력을 고정 크기 청크로 나누어 워커 프로세스에 전달하고, 결과는 입력 순서대로 반환합니다.
+    - 워커는 프로세스당 하나의 BodyCompositionAnalyzer를 생성하여 margin / 임계값 표 설정을 공유합니다.
+    - 레코드 단위 실패는 전체 실행을 중단하지 않고 failures 목록에 수집됩니다.
+    - 동시에 처리 중인 청크 수를 제한하여 입력이 Iterator여도 메모리 사용량이 일정합니다.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from . import constants
+from .errors import failure_result
+from .pipeline import BodyCompositionAnalyzer
+
+_worker_analyzer = None
+
+
+def _init_worker(margin, thresholds=None):
+    """워커 프로세스 초기화 (프로세스당 분석기 1개)"""
+    global _worker_analyzer
+    _worker_analyzer = BodyCompositionAnalyzer(margin=margin, thresholds=thresholds)
+
+
+def _analyze_chunk(start, records, detailed):
+    """
+    청크 하나를 분석 (워커 프로세스에서 실행)
+
+    Returns:
+        tuple: (결과 목록, 실패 목록)
+    """
+    analyzer = _worker_analyzer
+    results = []
+    failures = []
+    for offset, record in enumerate(records):
+        try:
+            results.append(analyzer._analyze(record, detailed))
+        except Exception as e:
+            cause = e.__cause__ if e.__cause__ is not None else e
+            failures.append({
+                "index": start + offset,
+                "error": getattr(e, "code", None),
+                "stage": getattr(e, "stage", None),
+                "exception": type(cause).__name__,
+                "message": str(cause),
+            })
+            results.append(failure_result(e, detailed))
+    return results, failures
+
+
+class ParallelRunResult:
+    """
+    [병렬 실행 결과]
+    입력 순서와 동일한 결과 목록(results)과 레코드 단위 실패 목록(failures)을 담습니다.
+    실패한 레코드의 결과 자리에는 오류 코드/실패 단계가 담긴 '알 수 없음' 결과가 채워집니다.
+    failures 항목: {"index", "error"(오류 코드), "stage"(실패 단계), "exception"(예외 클래스명), "message"}
+    """
+
+    def __init__(self, results, failures):
+        self.results = results
+        self.failures = failures
+
+    @property
+    def failure_count(self):
+        return len(self.failures)
+
+
+class ParallelBatchRunner:
+    """
+    [병렬 배치 실행기]
+    BodyCompositionAnalyzer를 프로세스 풀에서 실행합니다.
+
+    Args:
+        margin (float): 부위별 '표준' 구간 허용 오차 비율 (모든 워커에 동일하게 적용)
+        workers (int): 워커 프로세스 수 (기본값: CPU 코어 수, 1이면 현재 프로세스에서 실행)
+        chunk_size (int): 워커에 한 번에 전달할 레코드 수
+        detailed (bool): True이면 analyze_report() 형태의 상세 결과를 반환
+        thresholds: 성별/연령대별 임계값 표 (thresholds.ThresholdTable, None이면 constants.py의 단일 기준)
+    """
+
+    DEFAULT_CHUNK_SIZE = 2000
+
+    def __init__(self, margin=constants.ValidationLimits.DEFAULT_MARGIN, workers=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, detailed=False, thresholds=None):
+        self.margin = margin
+        self.thresholds = thresholds
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, int(chunk_size))
+        self.detailed = detailed
+
+    def run(self, records):
+        """전체 레코드를 분석하여 ParallelRunResult 반환"""
+        results = []
+        failures = []
+        for chunk_results, chunk_failures in self.iter_chunks(records):
+            results.extend(chunk_results)
+            failures.extend(chunk_failures)
+        return ParallelRunResult(results, failures)
+
+    def iter_chunks(self, records):
+        """
+        청크 단위 (결과 목록, 실패 목록)을 입력 순서대로 반환 (Generator)
+        처리 중인 청크는 워커 수의 2배로 제한됩니다.
+        """
+        chunks = self._split(records)
+        if self.workers == 1:
+            _init_worker(self.margin, self.thresholds)
+            for start, chunk in chunks:
+                yield _analyze_chunk(start, chunk, self.detailed)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(self.margin, self.thresholds)
+        ) as executor:
+            pending = deque()
+            for start, chunk in chunks:
+                pending.append(executor.submit(_analyze_chunk, start, chunk, self.detailed))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _split(self, records):
+        iterator = iter(records)
+        start = 0
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield start, chunk
+            start += len(chunk)
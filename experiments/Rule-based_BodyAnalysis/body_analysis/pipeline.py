@@ -4,14 +4,17 @@
 본 모듈은 Facade Pattern을 적용하여 전체 체형 분석 프로세스를 캡슐화한 진입점(Entry Point)입니다.
 복잡한 서브 시스템(Metrics, Stages, Segmental) 간의 의존성을 숨기고,
 단일 인터페이스(analyze_full_pipeline)를 통해 일관된 분석 및 결과 생성을 오케스트레이션(Orchestration)합니다.
+
+결과 캐시(cache.py), 단일 패스 경로(fused.py), 배치 경로(batch.py, NumPy)는 해당 기능을 사용할 때만 로드하여
+스칼라 분석만 하는 호출자의 시작(Cold Start) 비용을 늘리지 않습니다.
 """
 
-import traceback
 from . import constants
 from .models import BodyCompositionData
 from .metrics import BMIClassifier, BodyFatClassifier, MuscleClassifier
 from .stages import Stage1BodyTypeClassifier, Stage2MuscleAdjuster, Stage3BalanceAnalyzer
 from .segmental import DataNormalizer
+from .errors import AnalysisError, ErrorReporter, failure_result
 
 class BodyCompositionAnalyzer:
     """
@@ -19,12 +22,66 @@ class BodyCompositionAnalyzer:
     체성분 분석의 전체 라이프사이클을 관리하는 메인 컨트롤러 클래스입니다.
     - Input Validation 및 객체 변환
     - Stage 1 -> 2 -> 3 순차 실행 제어
-    - 예외 처리(Exception Handling) 및 Fallback 메커니즘 제공
+    - 예외 처리(Exception Handling) 및 Fallback 메커니즘 제공 (오류 코드 + 실패 단계가 담긴 실패 결과)
     - 최종 Output Dictionary 구성
+    - (선택) 입력 값 완전 일치 기준 LRU 결과 캐시
+    
+    Args:
+        margin (float): 부위별 '표준' 구간 허용 오차 비율
+        cache_size (int): 결과 캐시 최대 항목 수 (0이면 캐시 미사용)
+        cache_precision: 사용하지 않음 (이전 버전 호환용, 캐시 키는 항상 원본 입력 값 기준)
+        instrumentation: 단계별 계측기 (instrumentation.PipelineInstrumentation 등, None이면 계측 안 함)
+        error_reporter: 분석 실패 보고기 (기본값: Traceback 없이 집계만 하는 errors.ErrorReporter())
+        fast_path (bool): True이면 analyze_full_pipeline()이 중간 딕셔너리 없이 결과를 계산하는
+            단일 패스 경로(fused.FusedPipeline)를 사용합니다. 결과는 단계별 경로와 같으며,
+            계측기가 연결된 경우와 analyze_report()는 항상 단계별 경로를 사용합니다.
+        thresholds: 체지방률/근육 비율 분류에 사용할 성별/연령대별 임계값 표
+            (thresholds.ThresholdTable, 예: ThresholdTable.stratified()). None이면 constants.py의 단일 기준
     """
     
-    def __init__(self, margin=constants.ValidationLimits.DEFAULT_MARGIN):
-        self.margin = margin
+    def __init__(self, margin=constants.ValidationLimits.DEFAULT_MARGIN,
+                 cache_size=0, cache_precision=None,
+                 instrumentation=None, error_reporter=None, fast_path=False, thresholds=None):
+        self._margin = margin
+        self._thresholds = thresholds
+        self.fast_path = fast_path
+        self._cache = None
+        if cache_size:
+            from .cache import AnalysisCache
+            self._cache = AnalysisCache(cache_size)
+        self.instrumentation = instrumentation
+        self.error_reporter = error_reporter if error_reporter is not None else ErrorReporter()
+    
+    @property
+    def margin(self):
+        return self._margin
+    
+    @property
+    def thresholds(self):
+        return self._thresholds
+    
+    @property
+    def fast_path(self):
+        return self._fused is not None
+    
+    @fast_path.setter
+    def fast_path(self, enabled):
+        if enabled:
+            from .fused import FusedPipeline
+            self._fused = FusedPipeline.analyze
+        else:
+            self._fused = None
+    
+    @margin.setter
+    def margin(self, value):
+        # margin이 바뀌면 기존 캐시 결과는 더 이상 유효하지 않습니다.
+        if value != self._margin and self._cache is not None:
+            self._cache.invalidate()
+        self._margin = value
+    
+    def cache_info(self):
+        """결과 캐시 통계 (캐시 미사용 시 None)"""
+        return self._cache.stats() if self._cache is not None else None
     
     def _convert_input_to_object(self, input_data: dict) -> BodyCompositionData:
         """입력 데이터 객체 변환"""
@@ -33,11 +90,115 @@ class BodyCompositionAnalyzer:
         return input_data
 
     def analyze_full_pipeline(self, raw_input):
-        """전체 체성분 분석 파이프라인 실행"""
+        """
+        전체 체성분 분석 파이프라인 실행
+
+        Returns:
+            dict: {"stage2", "stage3"}
+                  (실패 시 '알 수 없음' 결과에 "error"(오류 코드), "error_stage"(실패 단계)가 추가된 딕셔너리)
+        """
+        try:
+            if self._cache is not None:
+                return self._analyze_cached(raw_input)
+            return self._analyze(raw_input)
+        except Exception as e:
+            return self._handle_failure(e)
+    
+    def analyze_report(self, raw_input):
+        """
+        [상세 분석 리포트]
+        analyze_full_pipeline과 같은 분석을 수행하되, LLM 입력으로 사용하는 상세 결과 형태로 반환합니다.
+        (experiments/llm/json/sample*.json과 동일한 구조)
+        
+        Returns:
+            dict: {"basic_info", "stage1_2", "muscle_seg", "fat_seg", "stage3"}
+        """
+        try:
+            return self._analyze(raw_input, detailed=True)
+        except Exception as e:
+            return self._handle_failure(e, detailed=True)
+    
+    def _analyze(self, raw_input, detailed=False):
+        """
+        실패 시 AnalysisError(실패 단계, 오류 코드)를 전파하는 분석 실행
+        (analyze_full_pipeline / analyze_report / parallel 워커 공용)
+        """
+        probe = self.instrumentation
+        if self._fused is not None and not detailed and probe is None:
+            try:
+                return self._fused(raw_input, self._margin, self._thresholds)
+            except Exception:
+                # 실패하는 입력은 단계별 경로로 다시 분석하여 실패 단계/오류 코드를 동일하게 보고합니다.
+                pass
+        mark = probe.start() if probe is not None else 0
+        
+        # 0. 입력 데이터 변환
         try:
-            # 0. 입력 데이터 변환
             data = self._convert_input_to_object(raw_input)
-            
+        except Exception as e:
+            raise AnalysisError("convert", e) from e
+        if probe is not None:
+            mark = probe.lap("convert", mark)
+        
+        stage12_result, muscle_seg, fat_seg, stage3_type = self._run_stages(data, probe, mark)
+        
+        # 4. 최종 결과 반환
+        if detailed:
+            return {
+                "basic_info": {
+                    "sex": data.sex,
+                    "age": data.age,
+                    "weight_kg": data.weight_kg
+                },
+                "stage1_2": stage12_result,
+                "muscle_seg": muscle_seg,
+                "fat_seg": fat_seg,
+                "stage3": stage3_type
+            }
+        return {
+            "stage2": stage12_result["stage2_type"],
+            "stage3": stage3_type
+        }
+    
+    def _analyze_cached(self, raw_input):
+        """캐시를 거치는 분석 실행 (미스 시 원본 입력을 분석하여 저장)"""
+        cache = self._cache
+        key = cache.make_key(raw_input)
+        if key is None:
+            return self._analyze(raw_input)
+        
+        result = cache.get(key)
+        if result is None:
+            result = self._analyze(raw_input)
+            cache.put(key, result)
+        # 호출자가 결과를 수정해도 캐시 항목이 바뀌지 않도록 복사본을 반환합니다.
+        return dict(result)
+    
+    def _handle_failure(self, error, detailed=False):
+        """분석 실패 기록 후 Fallback 결과 반환 (Traceback 포맷팅은 error_reporter 설정 시에만)"""
+        if self.instrumentation is not None:
+            self.instrumentation.record_error(error)
+        self.error_reporter.report(error)
+        return failure_result(error, detailed)
+    
+    def _run_stages(self, data, probe=None, mark=0):
+        """
+        Stage 1 -> 2 -> 3 순차 실행
+        
+        Args:
+            data: BodyCompositionData (또는 호환 객체)
+            probe: 계측기 (None이면 계측 안 함)
+            mark: 계측 기준 시각 (probe.start() / probe.lap() 반환값)
+        
+        Returns:
+            tuple: (stage12_result, 정규화된 muscle_seg, 정규화된 fat_seg, stage3_type)
+        
+        Raises:
+            AnalysisError: 실패한 단계(stage)와 오류 코드를 담은 예외
+        """
+        # 예외 발생 시 실패 단계를 알 수 있도록 진행 중인 단계를 지역 변수로 기록합니다.
+        stage = "convert"
+        try:
             # 데이터 추출
             bmi = data.bmi
             fat_rate = data.fat_rate
@@ -46,14 +207,23 @@ class BodyCompositionAnalyzer:
             muscle_seg_raw = data.muscle_seg
             fat_seg_raw = data.fat_seg
             
-            # 1. 신체 정보 분류
+            # 1. 신체 정보 분류 (성별/연령대별 임계값 표가 있으면 해당 층의 경계값 사용)
+            stage = "metrics"
+            fat_edges = muscle_edges = None
+            if self._thresholds is not None:
+                fat_edges, muscle_edges = self._thresholds.lookup(data.sex, data.age)
             bmi_value, bmi_cat = BMIClassifier.classify(bmi)
-            fat_cat = BodyFatClassifier.classify(fat_rate)
-            smm_ratio, muscle_level = MuscleClassifier.classify(smm, weight)
+            fat_cat = BodyFatClassifier.classify(fat_rate, fat_edges)
+            smm_ratio, muscle_level = MuscleClassifier.classify(smm, weight, muscle_edges)
+            if probe is not None:
+                mark = probe.lap("metrics", mark)
 
             # 2. 체형 분류 및 보정 (Stage 1 & 2)
+            stage = "stage12"
             stage1_type = Stage1BodyTypeClassifier.classify(bmi_cat, fat_cat, muscle_level)
             stage2_type = Stage2MuscleAdjuster.adjust(stage1_type, muscle_level)
+            if probe is not None:
+                mark = probe.lap("stage12", mark)
             
             stage12_result = {
                 "bmi": bmi_value,
@@ -66,6 +236,7 @@ class BodyCompositionAnalyzer:
             }
 
             # 3. 데이터 정규화 및 균형 분석 (Stage 3)
+            stage = "normalize"
             muscle_seg_normalized = DataNormalizer.normalize_muscle_segment(
                 muscle_seg_raw, smm, self.margin
             )
@@ -76,20 +247,38 @@ class BodyCompositionAnalyzer:
                 fat_seg_normalized = DataNormalizer.normalize_fat_segment(
                     fat_seg_raw, total_fat_kg, self.margin
                 )
+            if probe is not None:
+                mark = probe.lap("normalize", mark)
             
+            stage = "stage3"
             stage3_type = Stage3BalanceAnalyzer.classify(muscle_seg_normalized, fat_seg_normalized)
-            
-            # 4. 최종 결과 반환
-            return {
-                "stage2": stage2_type,
-                "stage3": stage3_type
-            }
-            
+            if probe is not None:
+                probe.lap("stage3", mark)
+                probe.observe(data, stage12_result, muscle_seg_raw, fat_seg_raw, muscle_seg_normalized)
         except Exception as e:
-            print(f"[ERROR] 분석 파이프라인 실행 중 오류 발생: {e}")
-            traceback.print_exc()
-            
-            return {
-                "stage2": "알 수 없음",
-                "stage3": "알 수 없음"
-            }
+            raise AnalysisError(stage, e) from e
+        
+        return stage12_result, muscle_seg_normalized, fat_seg_normalized, stage3_type
+    
+    def analyze_batch(self, bmi, fat_rate, smm, weight, muscle_seg, fat_seg=None, sex=None, age=None):
+        """
+        [컬럼 단위 배치 분석]
+        대량의 레코드를 NumPy 배열(컬럼)로 받아 한 번에 분석합니다.
+        레코드별 analyze_full_pipeline() 결과와 동일한 라벨을 반환합니다.
+
+        Args:
+            bmi, fat_rate, smm, weight: 길이 N의 수치 배열 (결측값은 NaN)
+            muscle_seg: N×5 부위별 근육량 행렬 (열 순서: constants.BodyPartKeys.ORDER)
+            fat_seg: N×5 부위별 체지방량 행렬 (선택, 데이터가 없는 행은 NaN)
+            sex, age: 길이 N의 성별 값(또는 ThresholdTable.sex_code_array() 결과)과 나이 배열
+                (성별/연령대별 임계값 표를 사용하는 분석기에서만 사용, 없으면 모든 레코드가 단일 기준)
+
+        Returns:
+            dict: {"stage2": 라벨 배열, "stage3": 라벨 배열}
+        """
+        # 스칼라 경로만 사용하는 호출자가 NumPy에 의존하지 않도록 배치 모듈은 사용 시점에 로드합니다.
+        from .batch import BatchAnalyzer
+        return BatchAnalyzer.analyze(
+            bmi, fat_rate, smm, weight, muscle_seg, fat_seg, margin=self.margin,
+            thresholds=self._thresholds, sex=sex, age=age,
+        )
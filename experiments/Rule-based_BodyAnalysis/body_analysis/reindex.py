@@ -0,0 +1,322 @@
+"""
+[증분 재분석 (Incremental Re-analysis)]
+
+constants.py의 임계값이나 부위별 허용 오차 비율(margin)이 바뀌었을 때, 전체 레코드를 다시 분석하는 대신
+결과가 바뀔 수 있는 레코드만 골라 다시 분석하는 모듈입니다.
+
+Index (ThresholdIndex):
+    - 축별(BMI / 체지방률 / 근육 비율) 가장 가까운 경계값 번호와 그 경계값까지의 부호 있는 거리 (값 - 경계값)
+    - 부위별 여유 행렬 (SegmentalAnalyzer.level_margin_array(), 근육/체지방 각 N×5, 임계값/margin과 무관)
+    - 인덱스를 만든 시점의 임계값, margin, 부위 라벨과 규칙 버전(constants.rules_version())
+
+Selection:
+    - 경계값이 a -> b로 움직이면 값이 [min(a, b), max(a, b)) 안에 있는 레코드만 카테고리가 바뀔 수 있습니다.
+      이런 레코드는 가장 가까운 경계값까지의 거리가 |b - a| 이하이므로, 거리로 후보를 먼저 거른 뒤 구간을 확인합니다.
+    - margin이 바뀌면 |여유|가 이전/이후 margin 사이인 부위가 있는 레코드만 Stage 3가 바뀔 수 있습니다.
+    - 부위 등급 라벨이나 부위 순서가 바뀌면 모든 레코드를 선택합니다.
+    - 부동소수점 반올림으로 경계의 레코드를 놓치지 않도록 구간을 SLACK만큼 넓혀 선택합니다. (더 선택된 레코드는 같은 결과를 냅니다)
+"""
+
+import json
+import numpy as np
+from . import constants as Constants
+from .batch import STAGE3_LABELS, BatchAnalyzer
+from .metrics import MuscleClassifier
+from .segmental import SegmentalAnalyzer, MuscleSegmentalAnalyzer, FatSegmentalAnalyzer
+from .stages import BODY_TYPE_LABELS
+from .sweep import ThresholdSet
+
+# 축 이름 (ThresholdSet.edges()의 축 이름과 같음)
+AXES = ("bmi", "fat", "muscle")
+SLACK = 1e-9
+
+_MARGIN = "ValidationLimits.DEFAULT_MARGIN"
+
+
+def _rule_labels():
+    """임계값이 아닌 규칙 상수 (바뀌면 모든 결과를 다시 분석)"""
+    t = Constants.BodyPartLevel
+    return [t.ABOVE, t.NORMAL, t.BELOW, list(Constants.BodyPartKeys.ORDER)]
+
+
+def _nearest_edge(values, edges):
+    """값 배열 -> (가장 가까운 경계값 번호 int8 배열, 부호 있는 거리 배열) (비정상 값은 거리 NaN)"""
+    edges = np.asarray(edges, dtype=np.float64)
+    upper = np.searchsorted(edges, values, side="right").clip(0, len(edges) - 1)
+    lower = (upper - 1).clip(0, len(edges) - 1)
+    with np.errstate(invalid="ignore"):
+        use_upper = np.abs(edges[upper] - values) < np.abs(values - edges[lower])
+    index = np.where(use_upper, upper, lower).astype(np.int8)
+    distance = values - edges[index]
+    distance[~np.isfinite(values)] = np.nan
+    return index, distance
+
+
+class ThresholdIndex:
+    """
+    [경계값 거리 인덱스]
+    레코드별로 결과가 임계값/margin 변경에 얼마나 민감한지를 저장하고, 규칙이 바뀐 뒤 다시 분석할 레코드를 선택합니다.
+    build()로 생성하며, save()/load()로 .npz 파일에 보관합니다.
+
+    Attributes:
+        edge, distance (dict): 축 이름 -> 가장 가까운 경계값 번호 / 부호 있는 거리 (길이 N)
+        muscle_margin, fat_margin: N×5 부위별 여유 행렬
+        thresholds (ThresholdSet): 인덱스를 만든 시점의 임계값과 margin
+        version (int): 인덱스를 만든 시점의 규칙 버전
+    """
+
+    def __init__(self, edge, distance, muscle_margin, fat_margin, thresholds, labels, version):
+        self.edge = edge
+        self.distance = distance
+        self.muscle_margin = muscle_margin
+        self.fat_margin = fat_margin
+        self.thresholds = thresholds
+        self.labels = labels
+        self.version = version
+        self.size = muscle_margin.shape[0]
+
+    @staticmethod
+    def build(bmi, fat_rate, smm, weight, muscle_seg, fat_seg=None,
+              margin=Constants.ValidationLimits.DEFAULT_MARGIN):
+        """
+        [인덱스 생성]
+        BatchAnalyzer.analyze()와 같은 컬럼 입력으로 현재 constants.py와 margin 기준의 인덱스를 만듭니다.
+        """
+        bmi = BatchAnalyzer._as_column(bmi, "bmi")
+        n = bmi.shape[0]
+        fat_rate = BatchAnalyzer._as_column(fat_rate, "fat_rate", n)
+        smm = BatchAnalyzer._as_column(smm, "smm", n)
+        weight = BatchAnalyzer._as_column(weight, "weight", n)
+        muscle_seg = BatchAnalyzer._as_segment_matrix(muscle_seg, "muscle_seg", n)
+        if fat_seg is None:
+            fat_seg = np.full(muscle_seg.shape, np.nan)
+        else:
+            fat_seg = BatchAnalyzer._as_segment_matrix(fat_seg, "fat_seg", n)
+
+        muscle_margin = SegmentalAnalyzer.level_margin_array(
+            *MuscleSegmentalAnalyzer.reference_arrays(muscle_seg, smm)
+        )
+        fat_margin = SegmentalAnalyzer.level_margin_array(
+            *FatSegmentalAnalyzer.reference_arrays(fat_seg, BatchAnalyzer.total_fat_array(weight, fat_rate))
+        )
+        index = ThresholdIndex({}, {}, muscle_margin, fat_margin, None, None, None)
+        return index.rebase(bmi, fat_rate, smm, weight, margin)
+
+    def rebase(self, bmi, fat_rate, smm, weight, margin=Constants.ValidationLimits.DEFAULT_MARGIN):
+        """
+        [인덱스 갱신]
+        현재 constants.py와 margin 기준으로 축별 거리만 다시 계산한 새 인덱스를 반환합니다.
+        부위별 여유 행렬은 임계값/margin과 무관하므로 그대로 재사용합니다. (부위 입력을 다시 읽지 않음)
+        """
+        thresholds = ThresholdSet({_MARGIN: margin}, name="index")
+        # 경계값이 바뀐 축의 값만 읽습니다.
+        values = {
+            "bmi": lambda: BatchAnalyzer._as_column(bmi, "bmi", self.size),
+            "fat": lambda: BatchAnalyzer._as_column(fat_rate, "fat_rate", self.size),
+            "muscle": lambda: MuscleClassifier.ratio_array(
+                BatchAnalyzer._as_column(smm, "smm", self.size),
+                BatchAnalyzer._as_column(weight, "weight", self.size),
+            ),
+        }
+        edge, distance = {}, {}
+        for axis in AXES:
+            if self.thresholds is not None and self.thresholds.edges(axis) == thresholds.edges(axis):
+                edge[axis], distance[axis] = self.edge[axis], self.distance[axis]
+            else:
+                edge[axis], distance[axis] = _nearest_edge(values[axis](), thresholds.edges(axis))
+        return ThresholdIndex(
+            edge, distance, self.muscle_margin, self.fat_margin,
+            thresholds, _rule_labels(), Constants.rules_version(margin),
+        )
+
+    def select(self, margin=None):
+        """
+        [재분석 대상 선택]
+        현재 constants.py와 margin(None이면 인덱스의 margin) 기준으로 결과가 바뀔 수 있는 레코드 번호를 반환합니다.
+
+        Returns:
+            오름차순 레코드 번호 배열 (int64)
+        """
+        if margin is None:
+            margin = self.thresholds.margin
+        if _rule_labels() != self.labels:
+            return np.arange(self.size)
+        target = ThresholdSet({_MARGIN: margin})
+        mask = np.zeros(self.size, dtype=bool)
+        for axis in AXES:
+            self._mark_axis(mask, axis, self.thresholds.edges(axis), target.edges(axis))
+        self._mark_margin(mask, self.thresholds.margin, target.margin)
+        return np.flatnonzero(mask)
+
+    def _mark_axis(self, mask, axis, old, new):
+        """경계값이 old -> new로 움직인 구간 안의 레코드 표시"""
+        moved = [(min(a, b), max(a, b)) for a, b in zip(old, new) if a != b]
+        if not moved:
+            return
+        shift = max(hi - lo for lo, hi in moved)
+        slack = SLACK * max(1.0, *(abs(x) for x in old + new))
+        distance = self.distance[axis]
+        candidates = np.flatnonzero(np.abs(distance) <= shift + slack)
+        values = np.asarray(old, dtype=np.float64)[self.edge[axis][candidates]] + distance[candidates]
+        hit = np.zeros(candidates.shape[0], dtype=bool)
+        for lo, hi in moved:
+            hit |= (values >= lo - slack) & (values < hi + slack)
+        mask[candidates[hit]] = True
+
+    def _mark_margin(self, mask, old, new):
+        """margin이 old -> new로 바뀌었을 때 등급이 바뀔 수 있는 부위가 있는 레코드 표시"""
+        if old == new:
+            return
+        for margins in (self.muscle_margin, self.fat_margin):
+            finite = np.isfinite(margins)
+            if not (np.isfinite(old) and np.isfinite(new) and old >= 0 and new >= 0):
+                mask |= finite.any(axis=1)
+                continue
+            lo, hi = min(old, new), max(old, new)
+            slack = SLACK * max(1.0, hi)
+            with np.errstate(invalid="ignore"):
+                size = np.abs(margins)
+                mask |= ((size >= lo - slack) & (size <= hi + slack)).any(axis=1)
+
+    def arrays(self):
+        """save()에 저장하는 배열 {이름: 배열} (메타데이터는 JSON 문자열 "index_meta")"""
+        arrays = {"muscle_margin": self.muscle_margin, "fat_margin": self.fat_margin}
+        for axis in AXES:
+            arrays[f"edge_{axis}"] = self.edge[axis]
+            arrays[f"distance_{axis}"] = self.distance[axis]
+        arrays["index_meta"] = np.array(json.dumps({
+            "thresholds": self.thresholds.values,
+            "labels": self.labels,
+            "version": self.version,
+        }, ensure_ascii=False))
+        return arrays
+
+    @staticmethod
+    def from_arrays(arrays):
+        """arrays() 결과(또는 np.load()로 읽은 .npz)로 인덱스 복원"""
+        meta = json.loads(str(arrays["index_meta"]))
+        thresholds = ThresholdSet(meta["thresholds"], name="index")
+        return ThresholdIndex(
+            {axis: arrays[f"edge_{axis}"] for axis in AXES},
+            {axis: arrays[f"distance_{axis}"] for axis in AXES},
+            arrays["muscle_margin"], arrays["fat_margin"],
+            thresholds, meta["labels"], int(meta["version"]),
+        )
+
+    def save(self, path):
+        np.savez(path, **self.arrays())
+
+    @staticmethod
+    def load(path):
+        with np.load(path) as data:
+            return ThresholdIndex.from_arrays({key: data[key] for key in data.files})
+
+
+class IncrementalAnalyzer:
+    """
+    [증분 재분석기]
+    컬럼 입력 전체를 한 번 배치 분석해 두고, 규칙이 바뀐 뒤 refresh()를 호출하면 ThresholdIndex가 고른 레코드만
+    다시 분석합니다. 레코드별 결과에는 그 결과를 만든 규칙 버전(rule_version)이 함께 기록됩니다.
+
+    Args:
+        bmi, fat_rate, smm, weight, muscle_seg, fat_seg: BatchAnalyzer.analyze()와 같은 컬럼 입력
+            (records_to_columns() 결과나 store.ColumnStore.columns()의 메모리 매핑 뷰)
+        margin (float): 부위별 '표준' 구간 허용 오차 비율
+
+    Attributes:
+        results (dict): {"stage2": N 라벨 배열, "stage3": N 라벨 배열} (BatchAnalyzer.analyze()와 같은 형태)
+        rule_version: 길이 N의 uint32 규칙 버전 배열 (constants.rules_version())
+
+    Usage:
+        incremental = IncrementalAnalyzer(**BatchAnalyzer.records_to_columns(records))
+        ...  # constants.py 임계값 변경
+        incremental.stale().any()     # True: 이전 규칙으로 분석된 결과가 있음
+        rows = incremental.refresh()  # 결과가 바뀔 수 있는 레코드만 다시 분석
+    """
+
+    def __init__(self, bmi, fat_rate, smm, weight, muscle_seg, fat_seg=None,
+                 margin=Constants.ValidationLimits.DEFAULT_MARGIN, _state=None):
+        self.columns = {
+            "bmi": bmi, "fat_rate": fat_rate, "smm": smm, "weight": weight,
+            "muscle_seg": muscle_seg, "fat_seg": fat_seg,
+        }
+        if _state is not None:
+            self.margin, self.results, self.rule_version, self.index = _state
+            return
+        self.margin = float(margin)
+        self.results = BatchAnalyzer.analyze(**self.columns, margin=self.margin)
+        self.index = ThresholdIndex.build(**self.columns, margin=self.margin)
+        self.rule_version = np.full(self.index.size, self.index.version, dtype=np.uint32)
+
+    @staticmethod
+    def from_records(records, margin=Constants.ValidationLimits.DEFAULT_MARGIN):
+        """BodyCompositionData.from_dict()가 받는 형태의 딕셔너리 목록으로 생성"""
+        return IncrementalAnalyzer(**BatchAnalyzer.records_to_columns(records), margin=margin)
+
+    def stale(self):
+        """현재 constants.py와 margin으로 분석된 결과가 아닌 레코드 (bool 배열)"""
+        return self.rule_version != Constants.rules_version(self.margin)
+
+    def refresh(self, margin=None):
+        """
+        [증분 재분석]
+        현재 constants.py와 margin(None이면 기존 값) 기준으로 결과가 바뀔 수 있는 레코드와
+        인덱스와 다른 규칙 버전으로 기록된 레코드만 다시 분석하고, 모든 레코드의 규칙 버전을 현재 버전으로 갱신합니다.
+
+        Returns:
+            다시 분석한 레코드 번호 배열 (오름차순)
+        """
+        margin = self.margin if margin is None else float(margin)
+        selected = self.rule_version != self.index.version
+        selected[self.index.select(margin)] = True
+        rows = np.flatnonzero(selected)
+        if rows.size * 2 > self.index.size:
+            # 절반 이상이면 행 선택(fancy indexing) 없이 전체를 다시 분석하는 편이 빠릅니다.
+            self.results = BatchAnalyzer.analyze(**self.columns, margin=margin)
+        elif rows.size:
+            subset = {name: np.asarray(column)[rows] for name, column in self.columns.items() if column is not None}
+            updated = BatchAnalyzer.analyze(**subset, margin=margin)
+            for key, labels in updated.items():
+                self.results[key][rows] = labels
+
+        # 선택되지 않은 레코드는 새 규칙에서도 결과가 같으므로 버전만 갱신합니다.
+        self.margin = margin
+        self.index = self.index.rebase(
+            self.columns["bmi"], self.columns["fat_rate"], self.columns["smm"], self.columns["weight"], margin
+        )
+        self.rule_version[:] = self.index.version
+        return rows
+
+    def save(self, path):
+        """결과(라벨 코드), 규칙 버전, 인덱스를 .npz 파일로 저장 (입력 컬럼은 저장하지 않음)"""
+        stage2_codes = {label: i for i, label in enumerate(BODY_TYPE_LABELS)}
+        stage3_codes = {label: i for i, label in enumerate(STAGE3_LABELS)}
+        np.savez(
+            path,
+            margin=np.float64(self.margin),
+            stage2=np.array([stage2_codes[x] for x in self.results["stage2"]], dtype=np.uint8),
+            stage3=np.array([stage3_codes[x] for x in self.results["stage3"]], dtype=np.uint8),
+            rule_version=self.rule_version,
+            **self.index.arrays(),
+        )
+
+    @staticmethod
+    def load(path, bmi, fat_rate, smm, weight, muscle_seg, fat_seg=None):
+        """
+        save()로 저장한 파일과 같은 순서의 입력 컬럼으로 복원
+
+        Raises:
+            ValueError: 입력 컬럼의 레코드 수가 저장된 결과와 다른 경우
+        """
+        with np.load(path) as data:
+            arrays = {key: data[key] for key in data.files}
+        index = ThresholdIndex.from_arrays(arrays)
+        n = BatchAnalyzer._as_column(bmi, "bmi").shape[0]
+        if n != index.size:
+            raise ValueError(f"저장된 결과는 {index.size}건인데 입력 컬럼은 {n}건입니다.")
+        results = {
+            "stage2": np.array(BODY_TYPE_LABELS, dtype=object)[arrays["stage2"]],
+            "stage3": np.array(STAGE3_LABELS, dtype=object)[arrays["stage3"]],
+        }
+        state = (float(arrays["margin"]), results, arrays["rule_version"].astype(np.uint32), index)
+        return IncrementalAnalyzer(bmi, fat_rate, smm, weight, muscle_seg, fat_seg, _state=state)
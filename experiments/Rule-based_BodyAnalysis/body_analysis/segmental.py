@@ -9,6 +9,17 @@ Input Data를 전체 총량(Total Mass) 대비 비율(Relative Ratio)로 변환
 import math
 from . import constants as Constants
 
+# 배치(행렬) 경로의 부위별 등급 코드 (GRADE_LABELS 인덱스)
+GRADE_BELOW, GRADE_NORMAL, GRADE_ABOVE = 0, 1, 2
+GRADE_LABELS = (
+    Constants.BodyPartLevel.BELOW,
+    Constants.BodyPartLevel.NORMAL,
+    Constants.BodyPartLevel.ABOVE,
+)
+
+# 부위 행렬의 열 인덱스 (Constants.BodyPartKeys.ORDER 순서)
+_LEFT_ARM, _RIGHT_ARM, _TRUNK, _LEFT_LEG, _RIGHT_LEG = range(len(Constants.BodyPartKeys.ORDER))
+
 class SegmentalAnalyzer:
     """
     [분석기 Base Class]
@@ -108,6 +119,83 @@ class SegmentalAnalyzer:
             
         except (TypeError, ValueError):
             return {k: 0.0 for k in parts.keys()}
+    
+    # ------------------------------------------------------------------
+    # 배치(행렬) 버전: 스칼라 메서드와 같은 순서로 같은 float64 연산을 수행합니다.
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def development_ratio_array(parts, totals):
+        """
+        calculate_development_ratio()의 배열 버전
+        
+        Args:
+            parts: N×5 부위별 측정값 행렬 (비정상 값은 비율 0)
+            totals: 길이 N의 총량 배열 (0 또는 비정상 값인 행은 모든 비율 0)
+        """
+        import numpy as np
+        
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            dev = parts / totals[:, np.newaxis]
+        dev = np.where(np.isfinite(parts), dev, 0.0)
+        dev[~(np.isfinite(totals) & (totals != 0))] = 0.0
+        return dev
+    
+    @staticmethod
+    def average_reference_array(left, right):
+        """좌/우 평균 기준값의 배열 버전 (비정상 값은 0)"""
+        import numpy as np
+        
+        with np.errstate(invalid="ignore", over="ignore"):
+            avg = (left + right) / 2.0
+        return np.where(np.isfinite(avg), avg, 0.0)
+    
+    @staticmethod
+    def classify_level_array(dev, refs, margins):
+        """
+        classify_part_level()의 배열 버전
+        
+        Args:
+            dev: N×5 부위별 비율 행렬
+            refs: N×5 기준값 행렬
+            margins: 길이 N의 허용 오차 비율 배열 (비정상 값인 행은 모두 '표준')
+            
+        Returns:
+            N×5 int8 등급 코드 행렬 (GRADE_BELOW / GRADE_NORMAL / GRADE_ABOVE)
+        """
+        import numpy as np
+        
+        margins = margins[:, np.newaxis]
+        with np.errstate(invalid="ignore", over="ignore"):
+            upper = refs * (1 + margins)
+            lower = refs * (1 - margins)
+        valid = np.isfinite(dev) & np.isfinite(refs) & np.isfinite(margins) & (refs != 0)
+        above = valid & (dev >= upper)
+        below = valid & ~above & (dev <= lower)
+        
+        grades = np.full(dev.shape, GRADE_NORMAL, dtype=np.int8)
+        grades[above] = GRADE_ABOVE
+        grades[below] = GRADE_BELOW
+        return grades
+    
+    @staticmethod
+    def level_margin_array(dev, refs):
+        """
+        classify_part_level()의 부위별 여유(margin) 행렬: 비율이 기준값에서 벗어난 정도 (dev / ref - 1)
+        
+        음수가 아닌 margin에 대해 기준값이 양수이면 |값| >= margin일 때 '표준이상'/'표준미만', 아니면 '표준'이며
+        (음수 기준값도 등급이 바뀌는 지점은 margin = |값|), margin을 바꿨을 때 등급이 바뀔 수 있는 부위는
+        |값|이 이전/이후 margin 사이에 있는 부위뿐입니다.
+        
+        Returns:
+            N×5 float64 행렬 (기준값이 0이거나 비정상 값이라 margin과 무관하게 '표준'인 부위는 NaN)
+        """
+        import numpy as np
+        
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            margins = dev / refs - 1.0
+        margins[~(np.isfinite(dev) & np.isfinite(refs) & (refs != 0))] = np.nan
+        return margins
 
 
 class MuscleSegmentalAnalyzer(SegmentalAnalyzer):
@@ -153,6 +241,28 @@ class MuscleSegmentalAnalyzer(SegmentalAnalyzer):
         except (TypeError, KeyError, AttributeError):
             return MuscleSegmentalAnalyzer._get_default_classification()
     
+    @staticmethod
+    def classify_batch(parts, totals, margins):
+        """
+        부위별 근육 분류 (배치): N×5 부위 행렬 → N×5 등급 코드 행렬
+        기준값은 classify()와 같이 팔/다리는 좌우 평균, 몸통은 팔/다리 기준값의 평균입니다.
+        """
+        dev, refs = MuscleSegmentalAnalyzer.reference_arrays(parts, totals)
+        return SegmentalAnalyzer.classify_level_array(dev, refs, margins)
+    
+    @staticmethod
+    def reference_arrays(parts, totals):
+        """
+        classify_batch()의 오차 비율(margin)과 무관한 단계: N×5 부위 행렬 → (N×5 비율 행렬, N×5 기준값 행렬)
+        """
+        import numpy as np
+        
+        dev = SegmentalAnalyzer.development_ratio_array(parts, totals)
+        arm_ref = SegmentalAnalyzer.average_reference_array(dev[:, _LEFT_ARM], dev[:, _RIGHT_ARM])
+        leg_ref = SegmentalAnalyzer.average_reference_array(dev[:, _LEFT_LEG], dev[:, _RIGHT_LEG])
+        trunk_ref = SegmentalAnalyzer.average_reference_array(arm_ref, leg_ref)
+        return dev, np.stack([arm_ref, arm_ref, trunk_ref, leg_ref, leg_ref], axis=1)
+    
     @staticmethod
     def _calculate_arm_reference(dev):
         """팔 기준값 계산"""
@@ -237,6 +347,28 @@ class FatSegmentalAnalyzer(SegmentalAnalyzer):
         except (TypeError, KeyError, AttributeError):
             return FatSegmentalAnalyzer._get_default_classification()
     
+    @staticmethod
+    def classify_batch(fat_parts, totals, margins):
+        """
+        부위별 체지방 분류 (배치): N×5 부위 행렬 → N×5 등급 코드 행렬
+        기준값은 classify()와 같이 팔/다리는 좌우 평균, 몸통은 자기 자신입니다.
+        """
+        dev, refs = FatSegmentalAnalyzer.reference_arrays(fat_parts, totals)
+        return SegmentalAnalyzer.classify_level_array(dev, refs, margins)
+    
+    @staticmethod
+    def reference_arrays(fat_parts, totals):
+        """
+        classify_batch()의 오차 비율(margin)과 무관한 단계: N×5 부위 행렬 → (N×5 비율 행렬, N×5 기준값 행렬)
+        """
+        import numpy as np
+        
+        dev = SegmentalAnalyzer.development_ratio_array(fat_parts, totals)
+        arm_ref = SegmentalAnalyzer.average_reference_array(dev[:, _LEFT_ARM], dev[:, _RIGHT_ARM])
+        leg_ref = SegmentalAnalyzer.average_reference_array(dev[:, _LEFT_LEG], dev[:, _RIGHT_LEG])
+        trunk_ref = np.where(np.isfinite(dev[:, _TRUNK]), dev[:, _TRUNK], 0.0)
+        return dev, np.stack([arm_ref, arm_ref, trunk_ref, leg_ref, leg_ref], axis=1)
+    
     @staticmethod
     def _calculate_arm_reference(dev):
         """팔 기준값 계산"""
@@ -314,3 +446,74 @@ class DataNormalizer:
             
         except (TypeError, AttributeError):
             return fat_input
+    
+    # ------------------------------------------------------------------
+    # 배치(행렬) 버전
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def normalize_muscle_segment_batch(parts, totals, margins=Constants.ValidationLimits.DEFAULT_MARGIN):
+        """
+        근육 데이터 정규화 (배치)
+        수치형 부위 데이터 N건을 한 번에 분류하며, 결과는 행마다 normalize_muscle_segment()와 같습니다.
+        
+        Args:
+            parts: N×5 부위별 근육량 행렬 (열 순서: Constants.BodyPartKeys.ORDER, 누락 부위는 0)
+            totals: 길이 N의 총 골격근량(SMM) 배열
+            margins: 허용 오차 비율 (스칼라 또는 길이 N 배열)
+            
+        Returns:
+            N×5 int8 등급 코드 행렬 (GRADE_LABELS 인덱스, grade_labels()로 라벨 변환)
+        """
+        parts, totals, margins = DataNormalizer._batch_inputs(parts, totals, margins)
+        return MuscleSegmentalAnalyzer.classify_batch(parts, totals, margins)
+    
+    @staticmethod
+    def normalize_fat_segment_batch(parts, totals, margins=Constants.ValidationLimits.DEFAULT_MARGIN):
+        """
+        체지방 데이터 정규화 (배치)
+        
+        Args:
+            parts: N×5 부위별 체지방량 행렬
+            totals: 길이 N의 총 체지방량(kg) 배열
+            margins: 허용 오차 비율 (스칼라 또는 길이 N 배열)
+            
+        Returns:
+            N×5 int8 등급 코드 행렬 (GRADE_LABELS 인덱스)
+        """
+        parts, totals, margins = DataNormalizer._batch_inputs(parts, totals, margins)
+        return FatSegmentalAnalyzer.classify_batch(parts, totals, margins)
+    
+    @staticmethod
+    def grade_labels(codes):
+        """등급 코드 행렬을 '표준이상'/'표준'/'표준미만' 라벨 행렬(object)로 변환"""
+        import numpy as np
+        
+        return np.array(GRADE_LABELS, dtype=object)[codes]
+    
+    @staticmethod
+    def _batch_inputs(parts, totals, margins):
+        import numpy as np
+        
+        parts = np.asarray(parts, dtype=np.float64)
+        n_parts = len(Constants.BodyPartKeys.ORDER)
+        if parts.ndim != 2 or parts.shape[1] != n_parts:
+            raise ValueError(f"parts: (N, {n_parts}) 형태여야 합니다. (shape={parts.shape})")
+        n = parts.shape[0]
+        
+        totals = np.asarray(totals, dtype=np.float64)
+        if totals.shape != (n,):
+            raise ValueError(f"totals: 길이 {n}의 1차원 배열이어야 합니다. (shape={totals.shape})")
+        
+        if np.ndim(margins) == 0:
+            # 스칼라 경로와 같이 수치로 해석할 수 없는 margin은 모든 부위를 '표준'으로 처리합니다.
+            try:
+                margin = float(margins)
+            except (TypeError, ValueError):
+                margin = math.nan
+            margins = np.full(n, margin)
+        else:
+            margins = np.asarray(margins, dtype=np.float64)
+            if margins.shape != (n,):
+                raise ValueError(f"margins: 스칼라 또는 길이 {n}의 배열이어야 합니다. (shape={margins.shape})")
+        return parts, totals, margins
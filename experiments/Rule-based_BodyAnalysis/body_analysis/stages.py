@@ -6,9 +6,18 @@ Rule-based System의 각 Stage가 순차적으로 실행되며 데이터를 구
 - Stage 1: 기초 분류 (BMI + Fat)
 - Stage 2: 보정 로직 (Muscle Adjustment)
 - Stage 3: 종합 분석 (Balance Analysis)
+
+Stage 1/2는 (BMI 등급, 체지방 등급, 근육 레벨) 조합에만 의존하므로,
+모듈 로드 시점에 전 조합을 평가한 결정 테이블(Stage12DecisionTable)로 컴파일됩니다.
 """
 
 from . import constants as Constants
+from .metrics import BMIClassifier, BodyFatClassifier, MuscleClassifier
+
+BODY_TYPE_LABELS = (
+    "마른형", "표준형", "근육형", "비만형", "고도비만형",
+    "마른비만형", "마른근육형", "고근육체형", "알 수 없음",
+)
 
 class Stage1BodyTypeClassifier:
     """
@@ -231,3 +240,87 @@ class Stage3BalanceAnalyzer:
         if muscle_dist == "하체": return "하체발달형"
         elif muscle_dist == "상체": return "상체발달형"
         else: return "표준형"
+
+
+class Stage12DecisionTable:
+    """
+    [Stage 1×2 결정 테이블]
+    Stage1BodyTypeClassifier.classify()와 Stage2MuscleAdjuster.adjust()를
+    (BMI 코드, 체지방 코드, 근육 코드) 전 조합(7×5×6)에 대해 미리 평가한 밀집(Dense) 조회 테이블입니다.
+    문자열 비교/딕셔너리 조회 대신 정수 인덱스 한 번으로 체형 코드(BODY_TYPE_LABELS 인덱스)를 얻습니다.
+    
+    Layout:
+        index = (bmi_code * FAT_SIZE + fat_code) * MUSCLE_SIZE + muscle_code
+        STAGE1[index], STAGE2[index] -> 체형 코드
+    
+    Note:
+        테이블은 규칙 함수 자체를 평가하여 만들어지므로 규칙 변경 시 자동으로 반영됩니다.
+        규칙이 BODY_TYPE_LABELS에 없는 새 체형을 반환하면 컴파일 단계에서 ValueError가 발생합니다.
+    """
+    
+    BMI_SIZE = len(BMIClassifier.LABELS)
+    FAT_SIZE = len(BodyFatClassifier.LABELS)
+    MUSCLE_SIZE = len(MuscleClassifier.LABELS)
+    SHAPE = (BMI_SIZE, FAT_SIZE, MUSCLE_SIZE)
+    
+    STAGE1 = ()
+    STAGE2 = ()
+    _arrays = None
+    
+    @staticmethod
+    def compile():
+        """전 조합에 대해 Stage 1/2 규칙을 평가하여 (STAGE1, STAGE2) 코드 튜플을 생성"""
+        codes = {label: code for code, label in enumerate(BODY_TYPE_LABELS)}
+        stage1_codes, stage2_codes = [], []
+        for bmi_cat in BMIClassifier.LABELS:
+            for fat_cat in BodyFatClassifier.LABELS:
+                for muscle_level in MuscleClassifier.LABELS:
+                    stage1_type = Stage1BodyTypeClassifier.classify(bmi_cat, fat_cat, muscle_level)
+                    stage2_type = Stage2MuscleAdjuster.adjust(stage1_type, muscle_level)
+                    for body_type in (stage1_type, stage2_type):
+                        if body_type not in codes:
+                            raise ValueError(f"BODY_TYPE_LABELS에 없는 체형입니다: {body_type}")
+                    stage1_codes.append(codes[stage1_type])
+                    stage2_codes.append(codes[stage2_type])
+        return tuple(stage1_codes), tuple(stage2_codes)
+    
+    @staticmethod
+    def index(bmi_code, fat_code, muscle_code):
+        """카테고리 코드 → 테이블 인덱스"""
+        return (
+            bmi_code * Stage12DecisionTable.FAT_SIZE + fat_code
+        ) * Stage12DecisionTable.MUSCLE_SIZE + muscle_code
+    
+    @staticmethod
+    def lookup(bmi_code, fat_code, muscle_code):
+        """스칼라 조회: (stage1 코드, stage2 코드)"""
+        i = Stage12DecisionTable.index(bmi_code, fat_code, muscle_code)
+        return Stage12DecisionTable.STAGE1[i], Stage12DecisionTable.STAGE2[i]
+    
+    @staticmethod
+    def lookup_array(bmi_codes, fat_codes, muscle_codes):
+        """배열 조회: (stage1 코드 배열, stage2 코드 배열)"""
+        import numpy as np
+
+        stage1_table, stage2_table = Stage12DecisionTable.as_arrays()
+        i = Stage12DecisionTable.index(
+            np.asarray(bmi_codes, dtype=np.intp),
+            np.asarray(fat_codes, dtype=np.intp),
+            np.asarray(muscle_codes, dtype=np.intp),
+        )
+        return stage1_table[i], stage2_table[i]
+    
+    @staticmethod
+    def as_arrays():
+        """테이블의 NumPy 배열 버전 (최초 호출 시 생성 후 재사용)"""
+        if Stage12DecisionTable._arrays is None:
+            import numpy as np
+
+            Stage12DecisionTable._arrays = (
+                np.array(Stage12DecisionTable.STAGE1, dtype=np.int8),
+                np.array(Stage12DecisionTable.STAGE2, dtype=np.int8),
+            )
+        return Stage12DecisionTable._arrays
+
+
+Stage12DecisionTable.STAGE1, Stage12DecisionTable.STAGE2 = Stage12DecisionTable.compile()
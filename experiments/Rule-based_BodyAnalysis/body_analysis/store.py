@@ -0,0 +1,302 @@
+"""
+[컬럼형 레코드 저장소 (Memory-mapped Columnar Store)]
+
+측정 레코드를 JSON 텍스트 대신 고정 폭 이진 컬럼으로 저장하는 모듈입니다.
+재분석 시 파일을 메모리 매핑(mmap)하고 컬럼 배열 뷰(복사 없음)를 BatchAnalyzer에 바로 넘기므로,
+레코드 수가 많아도 텍스트 파싱 없이 디스크 읽기 속도로 처리됩니다.
+
+File Layout (리틀 엔디언):
+    - MAGIC(8바이트) + 헤더 길이(uint64) + 헤더(JSON, UTF-8)
+    - 컬럼 데이터: 각 컬럼은 ALIGNMENT 바이트 경계에서 시작하는 연속 배열
+      헤더: {"format", "version", "rows", "columns": [{"name", "dtype", "shape", "offset"}], "dictionaries": {"sex": [...]}}
+
+Columns:
+    - bmi, fat_rate, smm, weight, height, age: float64 (결측값은 NaN)
+    - muscle_seg, fat_seg: N×5 float64 (열 순서: Constants.BodyPartKeys.ORDER, 부위 데이터 없음은 NaN 행)
+    - sex: int8 사전 코드 (dictionaries["sex"]의 인덱스, 결측값은 -1)
+    수치 컬럼은 BatchAnalyzer.records_to_columns()와 같은 규칙으로 채워지며,
+    등급(텍스트)으로 주어진 부위 데이터는 저장할 수 없습니다. (ValueError)
+"""
+
+import json
+import os
+import shutil
+import struct
+import tempfile
+from itertools import islice
+from pathlib import Path
+import numpy as np
+from .batch import SEGMENT_COUNT, BatchAnalyzer
+
+MAGIC = b"BACOLS\x00\x01"
+VERSION = 1
+ALIGNMENT = 64
+FORMAT = "body_analysis.columns"
+
+# 컬럼 이름 -> (dtype, 행당 값 개수)
+COLUMNS = {
+    "bmi": ("<f8", 1),
+    "fat_rate": ("<f8", 1),
+    "smm": ("<f8", 1),
+    "weight": ("<f8", 1),
+    "height": ("<f8", 1),
+    "age": ("<f8", 1),
+    "muscle_seg": ("<f8", SEGMENT_COUNT),
+    "fat_seg": ("<f8", SEGMENT_COUNT),
+    "sex": ("<i1", 1),
+}
+
+# BatchAnalyzer.analyze() / BodyCompositionAnalyzer.analyze_batch() 입력 컬럼
+ANALYSIS_COLUMNS = ("bmi", "fat_rate", "smm", "weight", "muscle_seg", "fat_seg")
+
+_HEADER_PREFIX = struct.Struct("<8sQ")
+_MAX_SEX_CODES = 127
+_MISSING_CODE = -1
+
+
+class ColumnStoreWriter:
+    """
+    [컬럼 저장소 기록기]
+    레코드를 청크 단위로 추가하며, 컬럼별 임시 파일에 기록한 뒤 close() 시점에 하나의 파일로 합칩니다.
+    (입력 크기와 무관하게 메모리 사용량은 청크 크기만큼입니다.)
+
+    Usage:
+        with ColumnStoreWriter("measurements.bacols") as writer:
+            for chunk in chunks:
+                writer.write_records(chunk)
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.rows = 0
+        self._sex_codes = {}
+        self._tmpdir = tempfile.TemporaryDirectory(prefix=".bacols-", dir=self.path.parent)
+        self._spills = {
+            name: open(os.path.join(self._tmpdir.name, name), "wb") for name in COLUMNS
+        }
+
+    def write_records(self, records):
+        """BodyCompositionData.from_dict()가 받는 형태의 딕셔너리 목록 추가"""
+        columns = BatchAnalyzer.records_to_columns(records)
+        n = len(records)
+        sex = [None] * n
+        age = np.full(n, np.nan)
+        height = np.full(n, np.nan)
+        for i, record in enumerate(records):
+            if all(k in record for k in ("sex", "age", "height_cm", "weight_kg")):
+                sex[i] = record["sex"]
+                age[i] = BatchAnalyzer._to_float(record["age"])
+                height[i] = BatchAnalyzer._to_float(record["height_cm"])
+        self.write_columns(**columns, sex=sex, age=age, height=height)
+
+    def write_columns(self, bmi, fat_rate, smm, weight, muscle_seg, fat_seg=None, sex=None, age=None, height=None):
+        """
+        컬럼 입력 추가 (BatchAnalyzer.analyze()와 같은 컬럼 + 선택 컬럼)
+
+        Args:
+            sex: 길이 N의 성별 값 목록 (None 항목은 결측)
+            age, height: 길이 N의 수치 배열
+        """
+        bmi = BatchAnalyzer._as_column(bmi, "bmi")
+        n = bmi.shape[0]
+        arrays = {
+            "bmi": bmi,
+            "fat_rate": BatchAnalyzer._as_column(fat_rate, "fat_rate", n),
+            "smm": BatchAnalyzer._as_column(smm, "smm", n),
+            "weight": BatchAnalyzer._as_column(weight, "weight", n),
+            "height": np.full(n, np.nan) if height is None else BatchAnalyzer._as_column(height, "height", n),
+            "age": np.full(n, np.nan) if age is None else BatchAnalyzer._as_column(age, "age", n),
+            "muscle_seg": BatchAnalyzer._as_segment_matrix(muscle_seg, "muscle_seg", n),
+            "fat_seg": (
+                np.full((n, SEGMENT_COUNT), np.nan) if fat_seg is None
+                else BatchAnalyzer._as_segment_matrix(fat_seg, "fat_seg", n)
+            ),
+            "sex": self._encode_sex(sex, n),
+        }
+        for name, (dtype, _) in COLUMNS.items():
+            self._spills[name].write(np.ascontiguousarray(arrays[name], dtype=dtype).tobytes())
+        self.rows += n
+
+    def close(self):
+        """임시 컬럼 파일을 하나의 저장소 파일로 합쳐 기록 (같은 디렉토리의 임시 파일에 쓴 뒤 교체)"""
+        if self._spills is None:
+            return
+        for spill in self._spills.values():
+            spill.close()
+
+        header = self._header()
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as out:
+                out.write(_HEADER_PREFIX.pack(MAGIC, len(header)))
+                out.write(header)
+                for column in json.loads(header)["columns"]:
+                    out.write(b"\0" * (column["offset"] - out.tell()))
+                    with open(os.path.join(self._tmpdir.name, column["name"]), "rb") as spill:
+                        shutil.copyfileobj(spill, out, 1 << 20)
+            os.replace(tmp_path, self.path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            self._discard()
+
+    def abort(self):
+        """기록 중단 (임시 파일 삭제, 저장소 파일은 만들지 않음)"""
+        if self._spills is not None:
+            for spill in self._spills.values():
+                spill.close()
+            self._discard()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _discard(self):
+        self._spills = None
+        self._tmpdir.cleanup()
+
+    def _encode_sex(self, sex, n):
+        codes = np.full(n, _MISSING_CODE, dtype=np.int8)
+        if sex is None:
+            return codes
+        if len(sex) != n:
+            raise ValueError(f"sex: 길이가 {n}이어야 합니다. (len={len(sex)})")
+        for i, value in enumerate(sex):
+            if value is None:
+                continue
+            value = str(value)
+            code = self._sex_codes.get(value)
+            if code is None:
+                if len(self._sex_codes) >= _MAX_SEX_CODES:
+                    raise ValueError(f"sex: 서로 다른 값이 {_MAX_SEX_CODES}개를 넘습니다.")
+                code = self._sex_codes[value] = len(self._sex_codes)
+            codes[i] = code
+        return codes
+
+    def _header(self):
+        """헤더 JSON 바이트 (헤더 길이가 컬럼 오프셋에 영향을 주므로 오프셋이 변하지 않을 때까지 반복)"""
+        data_start = 0
+        while True:
+            offset = data_start
+            columns = []
+            for name, (dtype, width) in COLUMNS.items():
+                offset = _align(offset)
+                shape = [self.rows] if width == 1 else [self.rows, width]
+                columns.append({"name": name, "dtype": dtype, "shape": shape, "offset": offset})
+                offset += self.rows * width * np.dtype(dtype).itemsize
+            header = json.dumps({
+                "format": FORMAT,
+                "version": VERSION,
+                "rows": self.rows,
+                "columns": columns,
+                "dictionaries": {"sex": list(self._sex_codes)},
+            }, ensure_ascii=False).encode("utf-8")
+            needed = _align(_HEADER_PREFIX.size + len(header))
+            if needed == data_start:
+                return header
+            data_start = needed
+
+
+class ColumnStore:
+    """
+    [컬럼 저장소 읽기 (Memory-mapped)]
+    파일 전체를 읽기 전용으로 메모리 매핑하고, 각 컬럼을 복사 없는 NumPy 배열 뷰로 제공합니다.
+    (뷰는 읽기 전용이며, 뷰를 참조하는 동안에는 파일 매핑이 유지됩니다.)
+
+    Usage:
+        store = ColumnStore("measurements.bacols")
+        result = analyzer.analyze_batch(**store.columns())
+        for start, columns in store.iter_chunks(1_000_000):
+            ...
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._map = np.memmap(self.path, dtype=np.uint8, mode="r")
+        if self._map.shape[0] < _HEADER_PREFIX.size:
+            raise ValueError(f"{self.path}: 컬럼 저장소 파일이 아닙니다. (크기 부족)")
+        magic, header_size = _HEADER_PREFIX.unpack(self._map[:_HEADER_PREFIX.size].tobytes())
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: 컬럼 저장소 파일이 아닙니다. (magic={magic!r})")
+        self.header = json.loads(
+            self._map[_HEADER_PREFIX.size:_HEADER_PREFIX.size + header_size].tobytes().decode("utf-8")
+        )
+        if self.header.get("format") != FORMAT or self.header.get("version") != VERSION:
+            raise ValueError(
+                f"{self.path}: 지원하지 않는 형식입니다. "
+                f"(format={self.header.get('format')}, version={self.header.get('version')})"
+            )
+        self.rows = self.header["rows"]
+        self.sex_dictionary = tuple(self.header["dictionaries"]["sex"])
+        self._columns = {}
+        for column in self.header["columns"]:
+            dtype = np.dtype(column["dtype"])
+            count = int(np.prod(column["shape"]))
+            if column["offset"] + count * dtype.itemsize > self._map.shape[0]:
+                raise ValueError(f"{self.path}: '{column['name']}' 컬럼이 파일 크기를 넘습니다. (손상된 파일)")
+            view = np.frombuffer(self._map, dtype=dtype, count=count, offset=column["offset"])
+            self._columns[column["name"]] = view.reshape(column["shape"])
+
+    def __len__(self):
+        return self.rows
+
+    @property
+    def names(self):
+        return tuple(self._columns)
+
+    def column(self, name, start=0, stop=None):
+        """컬럼 배열 뷰 (행 범위 [start, stop))"""
+        return self._columns[name][start:stop]
+
+    def columns(self, start=0, stop=None):
+        """analyze_batch() 입력 컬럼 뷰 딕셔너리 {"bmi", "fat_rate", "smm", "weight", "muscle_seg", "fat_seg"}"""
+        return {name: self._columns[name][start:stop] for name in ANALYSIS_COLUMNS}
+
+    def iter_chunks(self, chunk_size):
+        """(시작 행, columns()) 를 chunk_size 행 단위로 순차 반환 (Generator)"""
+        chunk_size = max(1, int(chunk_size))
+        for start in range(0, self.rows, chunk_size):
+            yield start, self.columns(start, start + chunk_size)
+
+    def sex_labels(self, start=0, stop=None):
+        """성별 사전 코드 -> 값 배열 (결측은 None)"""
+        labels = np.array(self.sex_dictionary + (None,), dtype=object)
+        return labels[self._columns["sex"][start:stop]]
+
+    def close(self):
+        """매핑 참조 해제 (이미 반환된 뷰는 참조가 남아 있는 동안 유효)"""
+        self._columns = {}
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def write_records(path, records, chunk_size=100_000):
+    """
+    [레코드 → 저장소 파일]
+    레코드 Iterable을 chunk_size 단위로 읽어 저장소 파일 하나로 기록합니다.
+
+    Returns:
+        int: 기록한 행 수
+    """
+    records = iter(records)
+    with ColumnStoreWriter(path) as writer:
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+            writer.write_records(chunk)
+    return writer.rows
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
@@ -0,0 +1,152 @@
+"""
+[스트리밍 분석 (JSONL Streaming)]
+
+줄 단위 JSON(JSON Lines) 형식의 InBody 레코드를 읽어 분석 결과를 JSON Lines로 기록하는 모듈입니다.
+입력을 고정 크기 청크(Chunk) 단위로 처리하므로 입력 파일 크기와 무관하게 메모리 사용량이 일정합니다.
+
+Output Format:
+    - 입력 한 줄당 출력 한 줄 (입력 순서 유지, 빈 줄은 건너뜀)
+    - 정상 레코드: BodyCompositionAnalyzer.analyze_report() 결과
+      {"basic_info", "stage1_2", "muscle_seg", "fat_seg", "stage3"}
+    - JSON 파싱 실패: {"line": 줄 번호, "error": "invalid_json"}
+    - 유효성 검증 실패 (validator 사용 시): {"line", "error": "quarantined", "reasons": [사유 이름], "record": 원본}
+      청크 단위로 validation.RecordValidator를 한 번에 적용하며, 격리된 레코드는 분석하지 않습니다.
+      run()에 quarantine 스트림을 주면 격리 항목은 출력 대신 그쪽에 기록됩니다.
+"""
+
+import json
+import time
+from itertools import islice
+from .pipeline import BodyCompositionAnalyzer
+
+# JSON 파싱 실패 표시 (None 등 JSON 값과 구분)
+_INVALID_JSON = object()
+
+
+class StreamStats:
+    """
+    [스트리밍 처리 통계]
+    처리한 레코드 수, 파싱 실패 수(invalid), 격리 수(quarantined), 분석 실패 수(failed), 경과 시간을 집계합니다.
+    (분석 실패는 JSON으로는 정상 파싱되었지만 결과에 "error"(오류 코드)가 담긴 레코드입니다)
+    """
+
+    def __init__(self):
+        self.records = 0
+        self.invalid = 0
+        self.quarantined = 0
+        self.failed = 0
+        self.elapsed = 0.0
+
+    @property
+    def records_per_sec(self):
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self):
+        """사람이 읽을 수 있는 요약 문자열"""
+        quarantined = f", {self.quarantined} quarantined" if self.quarantined else ""
+        return (
+            f"{self.records} records ({self.invalid} invalid, {self.failed} failed{quarantined}) in {self.elapsed:.2f}s "
+            f"- {self.records_per_sec:,.0f} records/sec"
+        )
+
+
+class JsonlStreamAnalyzer:
+    """
+    [JSONL 스트리밍 분석기]
+    파일 객체(또는 문자열 줄 Iterable)에서 레코드를 청크 단위로 읽어 분석하고,
+    청크마다 결과를 한 번에 기록(write)합니다.
+
+    Args:
+        analyzer (BodyCompositionAnalyzer): 분석기 (None이면 기본 설정)
+        chunk_size (int): 한 번에 읽어 처리할 줄 수
+        validator (RecordValidator): 청크 단위 유효성 검증기 (None이면 검증하지 않음)
+    """
+
+    DEFAULT_CHUNK_SIZE = 1000
+
+    def __init__(self, analyzer=None, chunk_size=DEFAULT_CHUNK_SIZE, validator=None):
+        self.analyzer = analyzer if analyzer is not None else BodyCompositionAnalyzer()
+        self.chunk_size = max(1, int(chunk_size))
+        self.validator = validator
+
+    def iter_chunks(self, lines):
+        """
+        입력 줄을 청크 단위로 분석하여 결과 목록을 순차 반환 (Generator)
+
+        Yields:
+            list: 청크 내 레코드별 결과 딕셔너리 목록
+        """
+        numbered = enumerate(lines, start=1)
+        while True:
+            chunk = list(islice(numbered, self.chunk_size))
+            if not chunk:
+                return
+            parsed = []
+            for line_no, line in chunk:
+                line = line.strip()
+                if not line:
+                    continue
+                parsed.append((line_no, self._parse_line(line)))
+            reasons = self._quarantine_reasons([record for _, record in parsed])
+
+            results = []
+            for i, (line_no, record) in enumerate(parsed):
+                if record is _INVALID_JSON:
+                    results.append({"line": line_no, "error": "invalid_json"})
+                elif reasons is not None and reasons[i]:
+                    results.append({"line": line_no, "error": "quarantined", "reasons": reasons[i], "record": record})
+                else:
+                    results.append(self.analyzer.analyze_report(record))
+            yield results
+
+    def run(self, infile, outfile, quarantine=None):
+        """
+        입력 스트림 전체를 분석하여 출력 스트림에 JSONL로 기록
+
+        Args:
+            quarantine: 격리 항목을 따로 기록할 출력 스트림 (None이면 outfile에 함께 기록)
+
+        Returns:
+            StreamStats: 처리 통계
+        """
+        stats = StreamStats()
+        start = time.perf_counter()
+        for results in self.iter_chunks(infile):
+            if not results:
+                continue
+            isolated = [r for r in results if r.get("error") == "quarantined"]
+            invalid = sum(1 for r in results if r.get("error") == "invalid_json")
+            stats.records += len(results)
+            stats.quarantined += len(isolated)
+            stats.invalid += invalid
+            stats.failed += sum(1 for r in results if "error" in r) - len(isolated) - invalid
+            if quarantine is not None and isolated:
+                quarantine.write(
+                    "\n".join(json.dumps(r, ensure_ascii=False) for r in isolated) + "\n"
+                )
+                results = [r for r in results if r.get("error") != "quarantined"]
+            if results:
+                outfile.write(
+                    "\n".join(json.dumps(r, ensure_ascii=False) for r in results) + "\n"
+                )
+        outfile.flush()
+        if quarantine is not None:
+            quarantine.flush()
+        stats.elapsed = time.perf_counter() - start
+        return stats
+
+    @staticmethod
+    def _parse_line(line):
+        try:
+            return json.loads(line)
+        except ValueError:
+            return _INVALID_JSON
+
+    def _quarantine_reasons(self, records):
+        """청크 전체 유효성 검증 -> 레코드별 격리 사유 이름 리스트 (통과는 빈 리스트, 검증기가 없으면 None)"""
+        if self.validator is None or not records:
+            return None
+        # validation 모듈(NumPy)은 검증을 사용할 때만 로드합니다.
+        from .validation import ValidationReason
+        codes = self.validator.validate_records(records)
+        return [ValidationReason.names(code) if code else [] for code in codes.tolist()]
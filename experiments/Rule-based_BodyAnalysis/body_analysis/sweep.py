@@ -0,0 +1,283 @@
+"""
+[임계값 스윕 (Threshold Sweep)]
+
+constants.py의 임계값(BMIThreshold, BodyFatThreshold, MuscleRatioThreshold, ValidationLimits.DEFAULT_MARGIN)을
+조정할 때, 모듈을 수정하고 전체를 재분석하는 대신 후보 임계값 조합 여러 개를 고정된 레코드 묶음에 한 번에 적용해 보는 모듈입니다.
+후보마다 Stage 2 / Stage 3 라벨 분포와 기준(baseline) 대비 전이 행렬(transition matrix)을 반환합니다.
+
+Precomputation:
+    - 임계값과 무관한 값(골격근 비율, 부위별 비율/기준값 행렬, 총 체지방량)은 생성 시 한 번만 계산합니다.
+    - 축별 카테고리 코드(BMI / 체지방률 / 근육 비율 경계값별)와 Stage 3 코드(margin별)는 int8 배열로 계산해 두고
+      이후 후보에서는 재사용하므로, 후보 하나의 비용은 결정 테이블 조회와 집계(bincount) 정도입니다.
+    - 코드 배열은 레코드 수 N에 비례하므로 축마다 최근 MAX_CACHED개만 보관(LRU)하고,
+      run()은 같은 경계값을 쓰는 후보가 이어지도록 축 순서로 정렬해 평가합니다. (결과는 입력 순서)
+      후보 수가 수천 개여도 코드 캐시의 메모리는 N × MAX_CACHED × 4바이트 수준으로 일정합니다.
+"""
+
+import itertools
+from collections import OrderedDict
+import numpy as np
+from . import constants as Constants
+from .batch import STAGE3_LABELS, BatchAnalyzer
+from .metrics import BMIClassifier, BodyFatClassifier, MuscleClassifier
+from .segmental import SegmentalAnalyzer, MuscleSegmentalAnalyzer, FatSegmentalAnalyzer
+from .stages import BODY_TYPE_LABELS, Stage12DecisionTable
+
+# 축 이름 -> (constants.py 클래스 이름, 오름차순 경계값 속성 이름)
+_AXES = {
+    "bmi": ("BMIThreshold", ("UNDERWEIGHT", "NORMAL", "OVERWEIGHT", "OBESE_1", "OBESE_2")),
+    "fat": ("BodyFatThreshold", ("LOW", "NORMAL", "OVERWEIGHT")),
+    "muscle": ("MuscleRatioThreshold", ("NORMAL", "SUFFICIENT", "HIGH", "VERY_HIGH")),
+}
+_MARGIN = "ValidationLimits.DEFAULT_MARGIN"
+
+# 축 이름 -> (값 배열, 경계값) -> 카테고리 코드 배열
+_CLASSIFIERS = {
+    "bmi": BMIClassifier.classify_array,
+    "fat": BodyFatClassifier.classify_array,
+    "muscle": MuscleClassifier.classify_ratio_array,
+}
+
+
+class ThresholdSet:
+    """
+    [임계값 후보 1개]
+    constants.py와 같은 이름("BMIThreshold.NORMAL" 등)의 값 딕셔너리이며, 지정하지 않은 값은 현재 상수를 따릅니다.
+
+    Args:
+        values (dict): {"<클래스>.<속성>": 값} (PARAMETERS 중 일부)
+        name (str): 결과에 표시할 이름 (None이면 변경된 값으로 생성)
+
+    Raises:
+        KeyError: PARAMETERS에 없는 이름
+        ValueError: 경계값이 오름차순이 아닌 경우
+    """
+    __slots__ = ("values", "name")
+
+    PARAMETERS = tuple(
+        f"{cls}.{attr}" for cls, attrs in _AXES.values() for attr in attrs
+    ) + (_MARGIN,)
+
+    def __init__(self, values=None, name=None):
+        self.values = ThresholdSet.current_values()
+        for key, value in (values or {}).items():
+            if key not in self.values:
+                raise KeyError(f"알 수 없는 임계값: {key} (사용 가능: {', '.join(ThresholdSet.PARAMETERS)})")
+            self.values[key] = float(value)
+        for axis in _AXES:
+            edges = self.edges(axis)
+            if any(b < a for a, b in zip(edges, edges[1:])):
+                raise ValueError(f"{_AXES[axis][0]} 경계값은 오름차순이어야 합니다. ({edges})")
+        self.name = name if name is not None else self._default_name()
+
+    @staticmethod
+    def current_values():
+        """constants.py의 현재 값 {"<클래스>.<속성>": 값}"""
+        values = {}
+        for key in ThresholdSet.PARAMETERS:
+            cls, attr = key.split(".")
+            values[key] = float(getattr(getattr(Constants, cls), attr))
+        return values
+
+    @staticmethod
+    def grid(axes, base=None):
+        """
+        [후보 격자 생성]
+        축별 후보 값 목록의 모든 조합(데카르트 곱)으로 ThresholdSet 목록을 만듭니다.
+        경계값 순서가 뒤집히는 조합은 제외합니다.
+
+        Args:
+            axes (dict): {"<클래스>.<속성>": [후보 값, ...]}
+            base (dict): 모든 후보에 공통으로 적용할 값 (None이면 현재 상수)
+
+        Returns:
+            list[ThresholdSet]
+        """
+        keys = list(axes)
+        sets = []
+        for combo in itertools.product(*(axes[k] for k in keys)):
+            values = dict(base or {})
+            values.update(zip(keys, combo))
+            try:
+                sets.append(ThresholdSet(values))
+            except ValueError:
+                continue
+        return sets
+
+    def edges(self, axis):
+        """축("bmi" / "fat" / "muscle")의 오름차순 경계값 튜플"""
+        cls, attrs = _AXES[axis]
+        return tuple(self.values[f"{cls}.{attr}"] for attr in attrs)
+
+    @property
+    def margin(self):
+        return self.values[_MARGIN]
+
+    def changes(self):
+        """현재 상수와 다른 값만 {"<클래스>.<속성>": 값}"""
+        current = ThresholdSet.current_values()
+        return {k: v for k, v in self.values.items() if v != current[k]}
+
+    def _default_name(self):
+        changes = self.changes()
+        if not changes:
+            return "baseline"
+        return ", ".join(f"{k}={v:g}" for k, v in changes.items())
+
+    def __repr__(self):
+        return f"ThresholdSet({self.name})"
+
+
+class ThresholdSweep:
+    """
+    [임계값 스윕 엔진]
+    BatchAnalyzer.analyze()와 같은 컬럼 입력을 받아 임계값과 무관한 값을 미리 계산해 두고,
+    evaluate()/run()으로 후보 임계값마다 라벨 분포와 기준 대비 전이 행렬을 계산합니다.
+
+    Args:
+        bmi, fat_rate, smm, weight: 길이 N의 수치 배열
+        muscle_seg: N×5 부위별 근육량 행렬
+        fat_seg: N×5 부위별 체지방량 행렬 (None이면 전체 레코드에 체지방 부위 데이터 없음)
+        baseline (ThresholdSet): 전이 행렬의 기준 (None이면 현재 constants.py 값)
+
+    Usage:
+        sweep = ThresholdSweep.from_records(records)
+        results = sweep.run(ThresholdSet.grid({"BMIThreshold.NORMAL": [22.5, 23.0, 23.5]}))
+    """
+
+    STAGE2_LABELS = BODY_TYPE_LABELS
+    STAGE3_LABELS = STAGE3_LABELS
+    MAX_CACHED = 8
+
+    def __init__(self, bmi, fat_rate, smm, weight, muscle_seg, fat_seg=None, baseline=None):
+        bmi = BatchAnalyzer._as_column(bmi, "bmi")
+        n = bmi.shape[0]
+        fat_rate = BatchAnalyzer._as_column(fat_rate, "fat_rate", n)
+        smm = BatchAnalyzer._as_column(smm, "smm", n)
+        weight = BatchAnalyzer._as_column(weight, "weight", n)
+        muscle_seg = BatchAnalyzer._as_segment_matrix(muscle_seg, "muscle_seg", n)
+        if fat_seg is None:
+            fat_seg = np.full(muscle_seg.shape, np.nan)
+        else:
+            fat_seg = BatchAnalyzer._as_segment_matrix(fat_seg, "fat_seg", n)
+
+        self.size = n
+        # 임계값과 무관한 값 (1회 계산)
+        self._values = {
+            "bmi": bmi,
+            "fat": fat_rate,
+            "muscle": MuscleClassifier.ratio_array(smm, weight),
+        }
+        self._muscle_refs = MuscleSegmentalAnalyzer.reference_arrays(muscle_seg, smm)
+        self._fat_refs = FatSegmentalAnalyzer.reference_arrays(
+            fat_seg, BatchAnalyzer.total_fat_array(weight, fat_rate)
+        )
+
+        # 축별 코드 캐시 (경계값 튜플 -> int8 카테고리 코드), Stage 3 캐시 (margin -> int8 코드), 각각 최대 MAX_CACHED개
+        self._axis_cache = {axis: OrderedDict() for axis in _AXES}
+        self._stage3_cache = OrderedDict()
+
+        self.baseline = baseline if baseline is not None else ThresholdSet()
+        self._base2, self._base3 = self._codes(self.baseline)
+
+    @staticmethod
+    def from_records(records, baseline=None):
+        """BodyCompositionData.from_dict()가 받는 형태의 딕셔너리 목록으로 생성"""
+        return ThresholdSweep(**BatchAnalyzer.records_to_columns(records), baseline=baseline)
+
+    def evaluate(self, thresholds):
+        """
+        [후보 1개 평가]
+
+        Returns:
+            dict: {
+                "name", "thresholds": {"<클래스>.<속성>": 값},
+                "stage2_counts", "stage3_counts": 라벨별 건수 배열 (STAGE2_LABELS / STAGE3_LABELS 순서),
+                "stage2_transitions", "stage3_transitions": 전이 행렬 (행: 기준 라벨, 열: 후보 라벨),
+                "stage2_changed", "stage3_changed": 기준과 라벨이 달라진 레코드 수
+            }
+        """
+        stage2, stage3 = self._codes(thresholds)
+        transitions2 = self._transitions(self._base2, stage2, len(self.STAGE2_LABELS))
+        transitions3 = self._transitions(self._base3, stage3, len(self.STAGE3_LABELS))
+        return {
+            "name": thresholds.name,
+            "thresholds": dict(thresholds.values),
+            "stage2_counts": transitions2.sum(axis=0),
+            "stage3_counts": transitions3.sum(axis=0),
+            "stage2_transitions": transitions2,
+            "stage3_transitions": transitions3,
+            "stage2_changed": self.size - int(np.trace(transitions2)),
+            "stage3_changed": self.size - int(np.trace(transitions3)),
+        }
+
+    def run(self, threshold_sets):
+        """
+        후보 목록 평가 -> 결과 딕셔너리 목록 (입력 순서)
+        같은 경계값의 코드 배열을 연속해서 재사용하도록 (BMI, 체지방률, 근육 비율, margin) 순으로 정렬해 평가합니다.
+        """
+        threshold_sets = list(threshold_sets)
+        order = sorted(range(len(threshold_sets)), key=lambda i: self._sort_key(threshold_sets[i]))
+        results = [None] * len(threshold_sets)
+        for i in order:
+            results[i] = self.evaluate(threshold_sets[i])
+        return results
+
+    @staticmethod
+    def _sort_key(thresholds):
+        return tuple(thresholds.edges(axis) for axis in _AXES) + (thresholds.margin,)
+
+    def labels(self, thresholds):
+        """후보 1개의 레코드별 라벨 {"stage2": N 라벨 배열, "stage3": N 라벨 배열} (BatchAnalyzer.analyze()와 같은 형태)"""
+        stage2, stage3 = self._codes(thresholds)
+        return {
+            "stage2": np.array(self.STAGE2_LABELS, dtype=object)[stage2],
+            "stage3": np.array(self.STAGE3_LABELS, dtype=object)[stage3],
+        }
+
+    @staticmethod
+    def distribution(counts, labels):
+        """건수 배열 -> {라벨: 건수} (0건 라벨 제외)"""
+        return {label: int(c) for label, c in zip(labels, counts) if c}
+
+    def _codes(self, thresholds):
+        """후보 1개의 (Stage 2 코드 배열, Stage 3 코드 배열)"""
+        _, stage2_table = Stage12DecisionTable.as_arrays()
+        # Stage12DecisionTable.index()와 같은 인덱스 ((bmi × FAT_SIZE + fat) × MUSCLE_SIZE + muscle)
+        index = self._axis_codes("bmi", thresholds.edges("bmi")).astype(np.intp)
+        index *= Stage12DecisionTable.FAT_SIZE
+        index += self._axis_codes("fat", thresholds.edges("fat"))
+        index *= Stage12DecisionTable.MUSCLE_SIZE
+        index += self._axis_codes("muscle", thresholds.edges("muscle"))
+        return stage2_table[index], self._stage3(thresholds.margin)
+
+    def _axis_codes(self, axis, edges):
+        """축의 카테고리 코드 배열 (int8)"""
+        return self._cached(
+            self._axis_cache[axis], edges,
+            lambda: _CLASSIFIERS[axis](self._values[axis], edges).astype(np.int8, copy=False),
+        )
+
+    def _stage3(self, margin):
+        def compute():
+            margins = np.full(self.size, margin)
+            muscle_grades = SegmentalAnalyzer.classify_level_array(*self._muscle_refs, margins)
+            fat_grades = SegmentalAnalyzer.classify_level_array(*self._fat_refs, margins)
+            return BatchAnalyzer.stage3_codes(muscle_grades, fat_grades).astype(np.int8)
+        return self._cached(self._stage3_cache, margin, compute)
+
+    def _cached(self, cache, key, compute):
+        """LRU 조회 (없으면 compute()로 계산해 저장하고, MAX_CACHED개를 넘으면 가장 오래된 항목 제거)"""
+        codes = cache.get(key)
+        if codes is None:
+            codes = cache[key] = compute()
+            if len(cache) > self.MAX_CACHED:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return codes
+
+    @staticmethod
+    def _transitions(base, codes, size):
+        flat = base.astype(np.intp) * size + codes
+        return np.bincount(flat, minlength=size * size).reshape(size, size)
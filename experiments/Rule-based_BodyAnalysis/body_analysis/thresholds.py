@@ -0,0 +1,197 @@
+"""
+[성별/연령대별 임계값 표 (Compiled Threshold Table)]
+
+체지방률 / 골격근 비율 분류 경계값을 층(Stratum = 성별 × 연령대)별로 미리 컴파일해 두는 조회 표입니다.
+BodyCompositionAnalyzer(thresholds=ThresholdTable.stratified())처럼 분석기 인스턴스마다 선택하며,
+지정하지 않은 분석기는 지금처럼 constants.BodyFatThreshold / MuscleRatioThreshold 단일 기준을 사용합니다.
+
+Layout:
+    - 층 번호 = 성별 번호 × 연령대 수 + 연령대 번호
+    - 마지막 층(unknown)은 성별이나 나이를 알 수 없는 레코드용이며, 컴파일 시점의 단일 기준 경계값을 사용합니다.
+    - 스칼라: lookup(sex, age) -> (체지방률 경계값, 근육 비율 경계값) 튜플 (사전 조회 + 연령대 경계 이진 탐색)
+    - 배치: stratum_array(sex, age) -> 층 번호 배열, fat_edges_array() / muscle_edges_array() -> 층 수 × K 경계값 표
+      (metrics.*.classify_array(edges=표, strata=층 번호)가 레코드별 층의 경계값으로 구간화합니다)
+"""
+
+import bisect
+import math
+from . import constants as Constants
+from .metrics import BodyFatClassifier, MuscleClassifier
+
+
+class ThresholdTable:
+    """
+    [컴파일된 층별 임계값 표]
+
+    Args:
+        body_fat (dict): {성별 키: [연령대별 (LOW, NORMAL, OVERWEIGHT)]}
+        muscle_ratio (dict): {성별 키: [연령대별 (NORMAL, SUFFICIENT, HIGH, VERY_HIGH)]}
+        age_bands (tuple): 연령대 경계 (오름차순, 연령대 수 = 경계 수 + 1)
+        sex_aliases (dict): 입력 성별 값 -> 성별 키 (None이면 성별 키 자체만 인식)
+
+    Raises:
+        ValueError: 연령대 수가 맞지 않거나 경계값이 오름차순이 아닌 경우
+
+    Usage:
+        table = ThresholdTable.stratified()
+        analyzer = BodyCompositionAnalyzer(thresholds=table)
+        fat_edges, muscle_edges = table.lookup("여성", 45)
+    """
+
+    def __init__(self, body_fat, muscle_ratio, age_bands=(), sex_aliases=None):
+        self.age_bands = tuple(float(x) for x in age_bands)
+        if any(b < a for a, b in zip(self.age_bands, self.age_bands[1:])):
+            raise ValueError(f"연령대 경계는 오름차순이어야 합니다. ({self.age_bands})")
+        self.sexes = tuple(body_fat)
+        if set(muscle_ratio) != set(self.sexes):
+            raise ValueError("body_fat과 muscle_ratio의 성별 키가 같아야 합니다.")
+
+        band_count = len(self.age_bands) + 1
+        strata = []
+        for sex in self.sexes:
+            for name, rows, size in (
+                ("body_fat", body_fat[sex], len(BodyFatClassifier.edges())),
+                ("muscle_ratio", muscle_ratio[sex], len(MuscleClassifier.edges())),
+            ):
+                if len(rows) != band_count:
+                    raise ValueError(f"{name}[{sex!r}]: 연령대 {band_count}개의 경계값이 필요합니다. (len={len(rows)})")
+                for edges in rows:
+                    if len(edges) != size or any(b < a for a, b in zip(edges, edges[1:])):
+                        raise ValueError(f"{name}[{sex!r}]: 오름차순 경계값 {size}개여야 합니다. ({edges})")
+            for band in range(band_count):
+                strata.append((
+                    tuple(float(x) for x in body_fat[sex][band]),
+                    tuple(float(x) for x in muscle_ratio[sex][band]),
+                ))
+        # 마지막 층: 성별/나이를 알 수 없는 레코드 (단일 기준)
+        strata.append((BodyFatClassifier.edges(), MuscleClassifier.edges()))
+
+        self.strata = tuple(strata)
+        self.unknown = len(strata) - 1
+        self._band_count = band_count
+        aliases = {sex: sex for sex in self.sexes}
+        aliases.update(sex_aliases or {})
+        self._sex_index = {
+            value: self.sexes.index(sex) for value, sex in aliases.items() if sex in self.sexes
+        }
+        self._arrays = None
+        self._memo = {}
+
+    # lookup() 메모에 보관할 최대 (성별, 나이) 조합 수 (NaN 등 매번 새 키가 되는 입력 대비)
+    MEMO_SIZE = 4096
+
+    @staticmethod
+    def stratified():
+        """constants.StratifiedThreshold 표를 컴파일 (성별/나이를 알 수 없으면 단일 기준)"""
+        t = Constants.StratifiedThreshold
+        return ThresholdTable(t.BODY_FAT, t.MUSCLE_RATIO, t.AGE_BANDS, t.SEX_ALIASES)
+
+    @staticmethod
+    def flat():
+        """현재 단일 기준만 담은 표 (모든 레코드가 unknown 층)"""
+        return ThresholdTable({}, {})
+
+    # ------------------------------------------------------------------
+    # 스칼라 조회
+    # ------------------------------------------------------------------
+
+    def sex_code(self, sex):
+        """성별 값 -> 성별 번호 (알 수 없으면 -1)"""
+        try:
+            return self._sex_index.get(sex, -1)
+        except TypeError:  # 해시할 수 없는 값
+            return -1
+
+    def stratum(self, sex, age):
+        """(성별, 나이) -> 층 번호"""
+        sex_code = self.sex_code(sex)
+        if sex_code < 0:
+            return self.unknown
+        try:
+            age = float(age)
+        except (TypeError, ValueError, OverflowError):
+            return self.unknown
+        if not math.isfinite(age):
+            return self.unknown
+        return sex_code * self._band_count + bisect.bisect_right(self.age_bands, age)
+
+    def lookup(self, sex, age):
+        """(성별, 나이) -> (체지방률 경계값, 근육 비율 경계값) (이미 나온 조합은 메모에서 바로 반환)"""
+        try:
+            return self._memo[sex, age]
+        except KeyError:
+            edges = self.strata[self.stratum(sex, age)]
+            if len(self._memo) < self.MEMO_SIZE:
+                self._memo[sex, age] = edges
+            return edges
+        except TypeError:  # 해시할 수 없는 값
+            return self.strata[self.stratum(sex, age)]
+
+    # ------------------------------------------------------------------
+    # 배치 조회
+    # ------------------------------------------------------------------
+
+    def sex_code_array(self, sex, dictionary=None):
+        """
+        성별 값 배열 -> int8 성별 번호 배열 (알 수 없으면 -1)
+
+        Args:
+            sex: 성별 값 배열, 또는 dictionary가 있으면 그 인덱스 배열 (-1은 결측, store.ColumnStore의 sex 컬럼)
+            dictionary: 성별 사전 (store.ColumnStore.sex_dictionary)
+        """
+        import numpy as np
+
+        if dictionary is not None:
+            codes = np.array([self.sex_code(value) for value in dictionary] + [-1], dtype=np.int8)
+            return codes[np.asarray(sex, dtype=np.intp)]
+        get = self._sex_index.get
+        try:
+            codes = [get(value, -1) for value in sex]
+        except TypeError:  # 해시할 수 없는 값이 섞인 경우
+            codes = [self.sex_code(value) for value in sex]
+        return np.array(codes, dtype=np.int8)
+
+    def stratum_array(self, sex, age):
+        """
+        [층 번호 배열]
+
+        Args:
+            sex: 성별 값 배열 또는 sex_code_array() 결과 (정수 배열이면 성별 번호로 간주)
+            age: 나이 배열 (비정상 값은 unknown 층)
+
+        Returns:
+            길이 N의 intp 층 번호 배열
+        """
+        import numpy as np
+
+        age = np.asarray(age, dtype=np.float64)
+        sex = np.asarray(sex)
+        if sex.dtype.kind not in "iu":
+            sex = self.sex_code_array(sex)
+        sex = sex.astype(np.intp)
+        bands = np.searchsorted(np.asarray(self.age_bands, dtype=np.float64), age, side="right")
+        strata = sex * self._band_count + bands
+        strata[(sex < 0) | (sex >= len(self.sexes)) | ~np.isfinite(age)] = self.unknown
+        return strata
+
+    def fat_edges_array(self):
+        """층 번호 -> 체지방률 경계값 행렬 (층 수 × 3)"""
+        return self._compiled()[0]
+
+    def muscle_edges_array(self):
+        """층 번호 -> 근육 비율 경계값 행렬 (층 수 × 4)"""
+        return self._compiled()[1]
+
+    def _compiled(self):
+        # 스칼라 경로만 사용하는 호출자가 NumPy에 의존하지 않도록 처음 배치 조회할 때 배열로 변환합니다.
+        if self._arrays is None:
+            import numpy as np
+
+            self._arrays = (
+                np.array([fat for fat, _ in self.strata], dtype=np.float64),
+                np.array([muscle for _, muscle in self.strata], dtype=np.float64),
+            )
+        return self._arrays
+
+    def __repr__(self):
+        return f"ThresholdTable(sexes={self.sexes}, age_bands={self.age_bands}, strata={len(self.strata)})"
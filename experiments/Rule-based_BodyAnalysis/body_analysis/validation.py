@@ -0,0 +1,235 @@
+"""
+[입력 유효성 검증 (Bulk Validation)]
+
+constants.ValidationLimits의 유효 범위와 필드 간 교차 조건을 레코드 묶음 전체에 배열 연산으로 한 번에 검사하는 모듈입니다.
+검사에 실패한 레코드는 사유 코드(비트 플래그)와 함께 격리(Quarantine)하여, 분석 엔진은 정상 레코드만 처리하게 합니다.
+
+Checks:
+    - 범위: 체중, BMI, 체지방률, 골격근량 (골격근량은 MIN_MUSCLE 이상, 체중 이하)
+    - 교차: 입력 BMI vs 체중/키로 계산한 BMI (키가 있는 경우)
+            부위별 근육량 합계 vs 골격근량, 부위별 체지방량 합계 vs 총 체지방량
+            (수치형 부위 데이터가 있고 segment_sums=True인 경우. 부위별 값의 산출 기준이 결과지마다 달라 기본값은 검사 안 함)
+    - 구조: 딕셔너리가 아닌 레코드, 수치로 해석할 수 없는 필수 값(누락/NaN/inf/문자열), 음수 부위 값
+
+Reason Code:
+    레코드별 uint16 값이며, 0이면 통과입니다. 여러 사유는 비트 OR로 합쳐지고 ValidationReason.names()로 이름을 얻습니다.
+"""
+
+import math
+import numpy as np
+from . import constants as Constants
+from .batch import SEGMENT_COUNT, BatchAnalyzer
+
+
+class ValidationReason:
+    """
+    [격리 사유 코드 (비트 플래그)]
+    """
+    MALFORMED = 1 << 0           # 딕셔너리가 아닌 레코드
+    MISSING_VALUE = 1 << 1       # 체중/BMI/체지방률/골격근량 중 수치가 아닌 값
+    WEIGHT_RANGE = 1 << 2
+    BMI_RANGE = 1 << 3
+    FAT_RATE_RANGE = 1 << 4
+    MUSCLE_RANGE = 1 << 5
+    BMI_MISMATCH = 1 << 6        # BMI ≠ 체중 / 키²
+    SEGMENT_RANGE = 1 << 7       # 음수 또는 비정상 부위 값
+    MUSCLE_SEGMENT_SUM = 1 << 8  # 부위별 근육량 합계가 골격근량과 맞지 않음
+    FAT_SEGMENT_SUM = 1 << 9     # 부위별 체지방량 합계가 총 체지방량과 맞지 않음
+
+    NAMES = {
+        MALFORMED: "malformed_record",
+        MISSING_VALUE: "missing_value",
+        WEIGHT_RANGE: "weight_range",
+        BMI_RANGE: "bmi_range",
+        FAT_RATE_RANGE: "fat_rate_range",
+        MUSCLE_RANGE: "muscle_range",
+        BMI_MISMATCH: "bmi_mismatch",
+        SEGMENT_RANGE: "segment_range",
+        MUSCLE_SEGMENT_SUM: "muscle_segment_sum",
+        FAT_SEGMENT_SUM: "fat_segment_sum",
+    }
+
+    @staticmethod
+    def names(code):
+        """사유 코드 -> 사유 이름 리스트 (비트 순서)"""
+        code = int(code)
+        return [name for bit, name in ValidationReason.NAMES.items() if code & bit]
+
+
+class RecordValidator:
+    """
+    [일괄 유효성 검증기]
+
+    Args:
+        limits: 유효 범위 상수 집합 (기본값: constants.ValidationLimits, 같은 속성을 가진 클래스로 대체 가능)
+        segment_sums (bool): True이면 부위별 합계 vs 골격근량/총 체지방량 교차 검사도 수행
+            (MUSCLE_SEGMENT_SUM / FAT_SEGMENT_SUM, 기본값: 검사 안 함)
+
+    Usage:
+        validator = RecordValidator()
+        clean, quarantined = validator.split(records)
+        # 컬럼 입력: codes = validator.validate_columns(**columns); clean = codes == 0
+    """
+
+    def __init__(self, limits=Constants.ValidationLimits, segment_sums=False):
+        self.limits = limits
+        self.segment_sums = segment_sums
+
+    def validate_columns(self, bmi, fat_rate, smm, weight, muscle_seg=None, fat_seg=None, height=None):
+        """
+        [컬럼 검증]
+        BatchAnalyzer.analyze()와 같은 컬럼(+ 선택적으로 키 height) 입력을 한 번에 검사합니다.
+
+        Returns:
+            길이 N의 uint16 사유 코드 배열 (0 = 통과)
+        """
+        limits = self.limits
+        bmi = BatchAnalyzer._as_column(bmi, "bmi")
+        n = bmi.shape[0]
+        fat_rate = BatchAnalyzer._as_column(fat_rate, "fat_rate", n)
+        smm = BatchAnalyzer._as_column(smm, "smm", n)
+        weight = BatchAnalyzer._as_column(weight, "weight", n)
+
+        codes = np.zeros(n, dtype=np.uint16)
+        finite = {}
+        for name, column in (("bmi", bmi), ("fat_rate", fat_rate), ("smm", smm), ("weight", weight)):
+            finite[name] = np.isfinite(column)
+            codes[~finite[name]] |= ValidationReason.MISSING_VALUE
+
+        with np.errstate(invalid="ignore", over="ignore", divide="ignore"):
+            # 1. 범위 (비정상 값은 MISSING_VALUE로 이미 처리되었으므로 NaN 비교는 False)
+            codes[(weight < limits.MIN_WEIGHT) | (weight > limits.MAX_WEIGHT)] |= ValidationReason.WEIGHT_RANGE
+            codes[(bmi < limits.MIN_BMI) | (bmi > limits.MAX_BMI)] |= ValidationReason.BMI_RANGE
+            codes[(fat_rate < limits.MIN_FAT_RATE) | (fat_rate > limits.MAX_FAT_RATE)] |= \
+                ValidationReason.FAT_RATE_RANGE
+            codes[(smm < limits.MIN_MUSCLE) | (smm > weight)] |= ValidationReason.MUSCLE_RANGE
+
+            # 2. BMI vs 체중 / 키² (키가 없거나 비정상 값이면 검사하지 않음)
+            if height is not None:
+                height = BatchAnalyzer._as_column(height, "height", n)
+                expected = weight / (height / 100.0) ** 2
+                checkable = finite["bmi"] & np.isfinite(expected) & (height > 0)
+                mismatch = checkable & (np.abs(bmi - expected) > limits.BMI_TOLERANCE * expected)
+                codes[mismatch] |= ValidationReason.BMI_MISMATCH
+
+            # 3. 부위 값 범위, (segment_sums=True) 부위별 합계 vs 총량 (부위 데이터가 없는 NaN 행은 검사하지 않음)
+            total_fat = weight * fat_rate / 100.0
+            for seg, total, bounds, reason in (
+                (muscle_seg, smm, limits.SEGMENT_MUSCLE_RATIO, ValidationReason.MUSCLE_SEGMENT_SUM),
+                (fat_seg, total_fat, limits.SEGMENT_FAT_RATIO, ValidationReason.FAT_SEGMENT_SUM),
+            ):
+                if seg is None:
+                    continue
+                seg = BatchAnalyzer._as_segment_matrix(seg, "segment", n)
+                present = ~np.isnan(seg).all(axis=1)
+                codes[present & ((seg < 0) | ~np.isfinite(seg)).any(axis=1)] |= ValidationReason.SEGMENT_RANGE
+                if not self.segment_sums:
+                    continue
+                ratio = seg.sum(axis=1) / total
+                checkable = present & np.isfinite(ratio) & (total > 0)
+                codes[checkable & ((ratio < bounds[0]) | (ratio > bounds[1]))] |= reason
+        return codes
+
+    def validate_records(self, records):
+        """
+        [레코드 검증]
+        BodyCompositionData.from_dict()가 받는 형태의 딕셔너리 목록을 검사합니다.
+
+        Returns:
+            길이 N의 uint16 사유 코드 배열 (0 = 통과)
+        """
+        columns = RecordValidator.records_to_columns(records)
+        malformed = columns.pop("malformed")
+        codes = self.validate_columns(**columns)
+        codes[malformed] = ValidationReason.MALFORMED
+        return codes
+
+    def split(self, records):
+        """
+        [정상 / 격리 분리]
+
+        Returns:
+            tuple: (정상 레코드 리스트, 격리 항목 리스트 [{"index", "reasons", "record"}])
+        """
+        codes = self.validate_records(records)
+        clean = []
+        quarantined = []
+        for i, (record, code) in enumerate(zip(records, codes.tolist())):
+            if code:
+                quarantined.append({"index": i, "reasons": ValidationReason.names(code), "record": record})
+            else:
+                clean.append(record)
+        return clean, quarantined
+
+    @staticmethod
+    def summary(codes):
+        """사유 코드 배열 -> {"records", "clean", "quarantined", "reasons": {사유 이름: 건수}}"""
+        codes = np.asarray(codes, dtype=np.uint16)
+        return {
+            "records": int(codes.shape[0]),
+            "clean": int((codes == 0).sum()),
+            "quarantined": int((codes != 0).sum()),
+            "reasons": {
+                name: int(((codes & bit) != 0).sum())
+                for bit, name in ValidationReason.NAMES.items() if ((codes & bit) != 0).any()
+            },
+        }
+
+    @staticmethod
+    def records_to_columns(records):
+        """
+        [레코드 → 검증용 컬럼 변환]
+        BatchAnalyzer.records_to_columns()와 같은 컬럼에 키(height)와 구조 오류 여부(malformed)를 더해 반환합니다.
+        딕셔너리가 아닌 레코드는 malformed=True, 등급(텍스트)으로 주어진 부위 데이터는 NaN 행(검사 생략)이 됩니다.
+        """
+        nan = math.nan
+        empty_row = (nan,) * SEGMENT_COUNT
+        to_float = BatchAnalyzer._to_float
+        rows = {key: [] for key in ("bmi", "fat_rate", "smm", "weight", "height", "muscle_seg", "fat_seg")}
+        malformed = []
+        for record in records:
+            is_dict = isinstance(record, dict)
+            malformed.append(not is_dict)
+            if not is_dict:
+                record = {}
+            if all(k in record for k in ("sex", "age", "height_cm", "weight_kg")):
+                rows["weight"].append(to_float(record["weight_kg"]))
+                rows["height"].append(to_float(record["height_cm"]))
+            else:
+                rows["weight"].append(nan)
+                rows["height"].append(nan)
+            if all(k in record for k in ("bmi", "fat_rate", "smm")):
+                rows["bmi"].append(to_float(record["bmi"]))
+                rows["fat_rate"].append(to_float(record["fat_rate"]))
+                rows["smm"].append(to_float(record["smm"]))
+            else:
+                rows["bmi"].append(nan)
+                rows["fat_rate"].append(nan)
+                rows["smm"].append(nan)
+            rows["muscle_seg"].append(RecordValidator._segment_row(record.get("muscle_seg"), empty_row))
+            rows["fat_seg"].append(RecordValidator._segment_row(record.get("fat_seg"), empty_row))
+
+        columns = {key: np.array(values, dtype=np.float64) for key, values in rows.items()}
+        for key in ("muscle_seg", "fat_seg"):
+            columns[key] = columns[key].reshape(len(records), SEGMENT_COUNT)
+        columns["malformed"] = np.array(malformed, dtype=bool)
+        return columns
+
+    @staticmethod
+    def _segment_row(seg_data, empty_row):
+        """수치형 부위 값 1행 (누락 부위는 0, 수치와 섞인 비수치 값은 NaN -> SEGMENT_RANGE, 등급/없음은 empty_row)"""
+        if not isinstance(seg_data, dict):
+            return empty_row
+        row = []
+        numeric = False
+        for key in Constants.BodyPartKeys.ORDER:
+            value = seg_data.get(key, 0)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                row.append(BatchAnalyzer._to_float(value))
+                numeric = numeric or key in seg_data
+            else:
+                row.append(math.nan)
+        if not numeric:
+            # 등급(텍스트)으로 주어진 부위 데이터는 검사하지 않습니다.
+            return empty_row
+        return row
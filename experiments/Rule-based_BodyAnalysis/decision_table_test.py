@@ -0,0 +1,36 @@
+# Stage 1/2 결정 테이블(Stage12DecisionTable)이 규칙 함수와 같은 결과를 내는지 확인하는 테스트 코드
+# 실행: python decision_table_test.py  (위치: experiments\Rule-based_BodyAnalysis\)
+
+import itertools
+
+from body_analysis.metrics import BMIClassifier, BodyFatClassifier, MuscleClassifier
+from body_analysis.stages import (
+    BODY_TYPE_LABELS, Stage12DecisionTable, Stage1BodyTypeClassifier, Stage2MuscleAdjuster,
+)
+
+
+def check_all_combinations():
+    """BMI × 체지방 × 근육 코드 전 조합(7×5×6)에서 테이블 조회 결과와 규칙 함수 결과 비교"""
+    combinations = list(itertools.product(
+        enumerate(BMIClassifier.LABELS),
+        enumerate(BodyFatClassifier.LABELS),
+        enumerate(MuscleClassifier.LABELS),
+    ))
+    assert len(combinations) == 7 * 5 * 6, len(combinations)
+
+    for (b, bmi_cat), (f, fat_cat), (m, muscle_level) in combinations:
+        stage1_type = Stage1BodyTypeClassifier.classify(bmi_cat, fat_cat, muscle_level)
+        stage2_type = Stage2MuscleAdjuster.adjust(stage1_type, muscle_level)
+        stage1_code, stage2_code = Stage12DecisionTable.lookup(b, f, m)
+        assert BODY_TYPE_LABELS[stage1_code] == stage1_type, (bmi_cat, fat_cat, muscle_level, "stage1")
+        assert BODY_TYPE_LABELS[stage2_code] == stage2_type, (bmi_cat, fat_cat, muscle_level, "stage2")
+    return len(combinations)
+
+
+def main():
+    count = check_all_combinations()
+    print(f"결정 테이블 검증 완료: {count}개 조합 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# 단일 패스 경로(fast_path=True)가 단계별 경로(fast_path=False)와 같은 결과를 내는지 확인하는 테스트 코드
+# 실행: python fast_path_test.py  (위치: experiments\Rule-based_BodyAnalysis\)
+
+import itertools
+from decimal import Decimal
+
+from body_analysis import constants as Constants
+from body_analysis.pipeline import BodyCompositionAnalyzer
+from body_analysis.thresholds import ThresholdTable
+from main_test import get_test_input_from_inbody
+
+PARTS = Constants.BodyPartKeys.ORDER
+MARGINS = (Constants.ValidationLimits.DEFAULT_MARGIN, 0.0, float("nan"), "x")
+
+
+def edge_records(base):
+    """분류 경계값(BMI / 체지방률 / 근육 비율 / 부위별 margin)의 바로 아래, 경계값, 바로 위 값을 가진 레코드"""
+    records = []
+    deltas = (-0.01, 0.0, 0.01)
+    bmi_edges = (
+        Constants.BMIThreshold.UNDERWEIGHT, Constants.BMIThreshold.NORMAL, Constants.BMIThreshold.OVERWEIGHT,
+        Constants.BMIThreshold.OBESE_1, Constants.BMIThreshold.OBESE_2,
+    )
+    fat_edges = (Constants.BodyFatThreshold.LOW, Constants.BodyFatThreshold.NORMAL, Constants.BodyFatThreshold.OVERWEIGHT)
+    ratio_edges = (
+        Constants.MuscleRatioThreshold.NORMAL, Constants.MuscleRatioThreshold.SUFFICIENT,
+        Constants.MuscleRatioThreshold.HIGH, Constants.MuscleRatioThreshold.VERY_HIGH,
+    )
+    for delta in deltas:
+        records += [dict(base, bmi=round(edge + delta, 2)) for edge in bmi_edges]
+        records += [dict(base, fat_rate=round(edge + delta, 2)) for edge in fat_edges]
+        records += [dict(base, smm=edge * base["weight_kg"] + delta) for edge in ratio_edges]
+    # 성별/연령대 경계 (연령대별 임계값 표 사용 시)
+    records += [dict(base, age=age) for age in (29, 30, 49, 50, 64, 65)]
+    records += [dict(base, sex=sex) for sex in ("여성", "F", "기타", None)]
+    # 부위별 값: 팔/다리 한쪽 또는 양쪽을 margin 경계 근처로 키움
+    for seg_name in ("muscle_seg", "fat_seg"):
+        seg = base[seg_name]
+        for scale in (0.85, 0.89, 0.9, 0.91, 1.09, 1.1, 1.11, 1.2):
+            for keys in (PARTS[:1], PARTS[:2], PARTS[3:], PARTS[:2] + PARTS[3:]):
+                records.append(dict(base, **{seg_name: dict(seg, **{k: round(seg[k] * scale, 3) for k in keys})}))
+        # 좌/우 값이 같으면 margin=0에서 비율이 '표준이상' 경계값과 정확히 같아짐 (팔만 / 다리만 / 전체)
+        records += [
+            dict(base, **{seg_name: dict(seg, **{PARTS[1]: seg[PARTS[0]]})}),
+            dict(base, **{seg_name: dict(seg, **{PARTS[4]: seg[PARTS[3]]})}),
+            dict(base, **{seg_name: {k: 1.0 for k in PARTS}}),
+        ]
+    return records
+
+
+def graded_records(base):
+    """부위별 데이터가 이미 등급(텍스트)으로 주어진 레코드"""
+    levels = (Constants.BodyPartLevel.BELOW, Constants.BodyPartLevel.NORMAL, Constants.BodyPartLevel.ABOVE)
+    records = []
+    for arm, leg in itertools.product(levels, repeat=2):
+        graded = {PARTS[0]: arm, PARTS[1]: arm, PARTS[2]: Constants.BodyPartLevel.NORMAL, PARTS[3]: leg, PARTS[4]: leg}
+        records.append(dict(base, muscle_seg=graded))
+        records.append(dict(base, muscle_seg=graded, fat_seg=graded))
+        records.append(dict(base, fat_seg=graded))
+    records.append(dict(base, muscle_seg={PARTS[0]: Constants.BodyPartLevel.ABOVE}))
+    return records
+
+
+def malformed_records(base):
+    """누락 / 변환 불가 / 범위 밖 값 등 비정상 입력"""
+    records = [None, "oops", 3, [], {}, {"muscle_seg": None}, dict(base, muscle_seg=None, fat_seg=None)]
+    for field in ("bmi", "fat_rate", "smm", "weight_kg", "age", "sex"):
+        records.append({k: v for k, v in base.items() if k != field})
+        for value in (None, "", "abc", "23.1", float("nan"), float("inf"), -1.0, 0, True, Decimal("23.1"), 10 ** 400, []):
+            records.append(dict(base, **{field: value}))
+    for seg_name in ("muscle_seg", "fat_seg"):
+        seg = base[seg_name]
+        for value in (None, "abc", float("nan"), float("inf"), -1.0, 0, True, Decimal("2.1"), 10 ** 400, [1]):
+            records.append(dict(base, **{seg_name: dict(seg, **{PARTS[0]: value})}))
+        records += [
+            dict(base, **{seg_name: [1.0, 2.0]}),
+            dict(base, **{seg_name: "abc"}),
+            dict(base, **{seg_name: {k: v for k, v in seg.items() if k != PARTS[0]}}),
+            dict(base, **{seg_name: dict(seg, note="x")}),
+            dict(base, **{seg_name: {k: 0 for k in seg}}),
+        ]
+    return records
+
+
+def check_records(records, thresholds=None):
+    """모든 margin에서 fast_path=True / False의 analyze_full_pipeline 결과 비교"""
+    for margin in MARGINS:
+        staged = BodyCompositionAnalyzer(margin=margin, thresholds=thresholds)
+        fused = BodyCompositionAnalyzer(margin=margin, thresholds=thresholds, fast_path=True)
+        for record in records:
+            expected = staged.analyze_full_pipeline(record)
+            got = fused.analyze_full_pipeline(record)
+            assert got == expected, (margin, record, expected, got)
+    return len(records) * len(MARGINS)
+
+
+def main():
+    base = get_test_input_from_inbody()
+    records = [base] + edge_records(base) + graded_records(base) + malformed_records(base)
+    count = check_records(records)
+    count += check_records(records, ThresholdTable.stratified())
+    print(f"단일 패스 경로 검증 완료: {count}건 일치")
+
+
+if __name__ == "__main__":
+    main()
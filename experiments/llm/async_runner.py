@@ -0,0 +1,336 @@
+"""
+[비동기 운동/식단 추천 실행기]
+
+여러 분석 결과 JSON(json/sample*.json 형태)을 하나의 AsyncAnthropic 클라이언트(연결 재사용)로
+동시에 요청하는 실행기입니다. 동시 요청 수는 Semaphore로 제한하며, 요청이 끝나는 순서대로
+결과 파일을 저장합니다. (test_claude.py와 같은 파일명 규칙: <입력명>_output.json / <입력명>_output_raw.txt)
+응답 캐시(plan_cache.py)를 사용하면 같은 분석 결과는 네트워크 요청 없이 캐시된 응답으로 저장합니다.
+프롬프트는 plan_prompt.PromptCompiler로 만들며(정적 부분 cache_control 표시), 요청별 입력 크기(bytes/추정 토큰)와
+응답 usage(입력 토큰, 캐시 생성/적중 토큰)를 결과 요약과 최종 통계에 기록합니다.
+
+Streaming (--stream):
+    응답을 스트리밍으로 받아 stream_parser.PlanStreamParser로 점진 파싱하며, weekly_schedule의 요일 항목이
+    완성되는 즉시 스키마 검증 후 on_day 콜백으로 전달합니다. (첫 요일까지의 시간: first_day_s)
+    응답이 중간에 끊기면 완성된 항목까지 복구한 부분 결과를 <입력명>_output_partial.json으로 함께 저장합니다.
+
+Dedupe (--dedupe):
+    profile_dedup.ProfileBucketer로 연속값을 구간 대표값으로 바꿔 같은 프롬프트끼리 묶고, 동치류마다 1회만 요청한 뒤
+    응답을 구성원 전체의 결과 파일로 저장합니다.
+
+Retry:
+    - 429(Rate Limit), 529(Overloaded), 5xx, 연결 오류/타임아웃은 지수 백오프(Jitter 포함)로 재시도합니다.
+    - 응답에 retry-after 헤더가 있으면 그 시간을 우선 사용합니다.
+    - SDK 자체 재시도(max_retries)는 끄고 이 모듈에서만 재시도하여 시도 횟수/대기 시간을 집계합니다.
+
+Usage:
+    # 위치: experiments\llm\
+    python async_runner.py json/*.json --concurrency 8
+    # 로컬 Stub 서버로 테스트 (API 키/비용 없이)
+    python stub_server.py --port 8765 --rate-limit-every 5 &
+    python async_runner.py json/*.json --base-url http://127.0.0.1:8765 --api-key test
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+import anthropic
+
+from plan_cache import DEFAULT_CACHE_DIR, PlanCache, make_key
+from plan_prompt import DEFAULT_COMPILER, MAX_TOKENS, MODEL, save_plan_output
+from profile_dedup import add_bucket_arguments, bucketer_from_args, compression_stats, format_stats, group_profiles
+from stream_parser import PlanStreamParser
+
+OUTPUT_DIR = Path(__file__).parent / "outputs"
+
+RETRYABLE_STATUS = (408, 409, 429, 500, 502, 503, 504, 529)
+
+
+class AsyncPlanRunner:
+    """
+    [비동기 추천 실행기]
+
+    Args:
+        client: anthropic.AsyncAnthropic (모든 요청이 같은 연결 풀을 공유)
+        concurrency (int): 동시 요청 최대 수
+        max_attempts (int): 요청당 최대 시도 횟수 (첫 시도 포함)
+        base_delay (float): 백오프 기준 대기 시간(초), 시도마다 2배
+        max_delay (float): 백오프 최대 대기 시간(초)
+        output_dir (Path): 결과 저장 디렉토리
+        cache: 응답 캐시 (plan_cache.PlanCache, None이면 캐시 미사용)
+        compiler: 프롬프트 컴파일러 (plan_prompt.PromptCompiler)
+        stream (bool): 스트리밍 응답 + 점진 파싱 사용 여부
+        on_day: 스트리밍 중 요일 항목 완성 시 호출 (input_path, event, elapsed_s), 기본값: 한 줄 출력
+    """
+
+    def __init__(self, client, concurrency=4, max_attempts=6, base_delay=1.0, max_delay=30.0,
+                 output_dir=OUTPUT_DIR, model=MODEL, max_tokens=MAX_TOKENS, cache=None,
+                 compiler=DEFAULT_COMPILER, stream=False, on_day=None):
+        self.client = client
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.output_dir = Path(output_dir)
+        self.model = model
+        self.max_tokens = max_tokens
+        self.cache = cache
+        self.compiler = compiler
+        self.stream = stream
+        self.on_day = on_day if on_day is not None else self._print_day
+        self.stats = {
+            "ok": 0, "partial": 0, "raw": 0, "failed": 0, "cached": 0, "retries": 0, "wait_s": 0.0,
+            "input_bytes": 0, "input_tokens_est": 0,
+            "input_tokens": 0, "cache_creation_input_tokens": 0, "cache_read_input_tokens": 0, "output_tokens": 0,
+        }
+
+    async def run(self, input_paths, bucketer=None):
+        """
+        입력 파일 전체를 동시에 요청하고, 완료되는 순서대로 결과를 저장합니다.
+
+        Args:
+            input_paths: 분석 결과 JSON 경로 목록
+            bucketer: profile_dedup.ProfileBucketer (주면 동치류마다 1회만 요청)
+
+        Returns:
+            list[dict]: 완료 순서대로의 결과 요약 {"input", "members", "status", "path", "attempts", "elapsed_s"}
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        records = []
+        for input_path in map(Path, input_paths):
+            with open(input_path, "r", encoding="utf-8") as f:
+                records.append((input_path, json.load(f)))
+
+        if bucketer is not None:
+            classes = group_profiles(records, bucketer)
+            self.stats["dedupe"] = compression_stats(classes)
+            print(format_stats(self.stats["dedupe"]))
+            groups = [(c["members"], c["representative"]) for c in classes]
+        else:
+            groups = [([input_path], analysis) for input_path, analysis in records]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.create_task(self._run_one(members, analysis, semaphore)) for members, analysis in groups]
+        summaries = []
+        for finished in asyncio.as_completed(tasks):
+            summary = await finished
+            summaries.append(summary)
+            source = "캐시" if summary["attempts"] == 0 and summary["path"] else f"{summary['attempts']}회 시도"
+            print(f"[{summary['status']}] {summary['input']} -> {summary['path']} "
+                  f"({source}, {summary['elapsed_s']:.2f}s)")
+        return summaries
+
+    async def _run_one(self, members, analysis, semaphore):
+        """
+        동치류(또는 입력 1건) 요청 1회 -> 구성원 전체 결과 저장
+        재시도 대상이 아닌 예외(빈 응답, SDK 응답 검증 오류, 결과 저장 실패 등)는 이 동치류의 failed 요약으로 기록하여,
+        한 요청의 오류가 run()의 다른 요청을 중단시키지 않도록 합니다.
+        """
+        start = time.perf_counter()
+        input_path = members[0]
+        label = str(input_path) if len(members) == 1 else f"{input_path} 외 {len(members) - 1}건"
+        summary = {"input": label, "members": len(members), "attempts": 0}
+        try:
+            return await self._request_group(members, analysis, semaphore, start, summary)
+        except Exception as e:
+            self.stats["failed"] += len(members)
+            summary.update(status="failed", path=None, elapsed_s=time.perf_counter() - start,
+                           error=f"{type(e).__name__}: {e}")
+            return summary
+
+    async def _request_group(self, members, analysis, semaphore, start, summary):
+        """_run_one()의 본문 (summary에 진행 중인 시도 횟수를 기록)"""
+        input_path = members[0]
+        key = None
+        if self.cache is not None:
+            key = make_key(analysis, self.model, template=self.compiler.template, max_tokens=self.max_tokens)
+            cached_text = self.cache.get(key)
+            if cached_text is not None:
+                self.stats["cached"] += 1
+                summary["elapsed_s"] = time.perf_counter() - start
+                summary.update(self._save(members, cached_text))
+                return summary
+
+        messages = self.compiler.build_messages(analysis)
+        size = self.compiler.measure(analysis)
+        self.stats["input_bytes"] += size["total_bytes"]
+        self.stats["input_tokens_est"] += size["total_tokens_est"]
+
+        # 대기(백오프) 중에는 슬롯을 반납하여 다른 요청이 진행되도록 시도 단위로 Semaphore를 잡습니다.
+        attempts = 0
+        output_text = None
+        error = None
+        timing = {"first_day_s": None}
+        while attempts < self.max_attempts:
+            attempts += 1
+            summary["attempts"] = attempts
+            async with semaphore:
+                try:
+                    if self.stream:
+                        output_text, response = await self._request_stream(messages, input_path, start, timing)
+                    else:
+                        response = await self.client.messages.create(
+                            model=self.model,
+                            max_tokens=self.max_tokens,
+                            messages=messages,
+                        )
+                        output_text = response.content[0].text
+                    usage = self._record_usage(response)
+                    break
+                except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+                    error = e
+                    if not self._is_retryable(e) or attempts >= self.max_attempts:
+                        break
+            delay = self._retry_delay(error, attempts)
+            self.stats["retries"] += 1
+            self.stats["wait_s"] += delay
+            await asyncio.sleep(delay)
+
+        summary.update({
+            "elapsed_s": time.perf_counter() - start,
+            "input_bytes": size["total_bytes"],
+            "input_tokens_est": size["total_tokens_est"],
+            "first_day_s": timing["first_day_s"],
+        })
+        if output_text is None:
+            self.stats["failed"] += len(members)
+            summary.update(status="failed", path=None, error=f"{type(error).__name__}: {error}")
+            return summary
+
+        summary["usage"] = usage
+        summary.update(self._save(members, output_text))
+        if key is not None and summary["status"] == "ok":
+            # JSON으로 해석되지 않는 응답은 재요청으로 개선될 수 있으므로 캐시하지 않습니다.
+            self.cache.put(key, output_text, model=self.model)
+        return summary
+
+    async def _request_stream(self, messages, input_path, start, timing):
+        """스트리밍 요청 1회 -> (응답 텍스트, 최종 메시지)"""
+        parser = PlanStreamParser()
+        chunks = []
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            messages=messages,
+        ) as stream:
+            async for text in stream.text_stream:
+                chunks.append(text)
+                for event in parser.feed(text):
+                    if event["type"] != "day":
+                        continue
+                    elapsed = time.perf_counter() - start
+                    if timing["first_day_s"] is None:
+                        timing["first_day_s"] = elapsed
+                    self.on_day(input_path, event, elapsed)
+            response = await stream.get_final_message()
+        return "".join(chunks), response
+
+    @staticmethod
+    def _print_day(input_path, event, elapsed):
+        day = event["day"] or {}
+        status = "OK" if not event["errors"] else f"스키마 오류 {len(event['errors'])}건"
+        print(f"  [day] {Path(input_path).name} #{event['index']} {day.get('day', '?')} - "
+              f"{day.get('focus', '?')} ({status}, {elapsed:.2f}s)")
+
+    def _record_usage(self, response):
+        """응답 usage 집계 (SDK/서버에 따라 없는 필드는 0)"""
+        usage = {}
+        response_usage = getattr(response, "usage", None)
+        for name in ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens", "output_tokens"):
+            usage[name] = getattr(response_usage, name, None) or 0
+            self.stats[name] += usage[name]
+        return usage
+
+    def _save(self, members, output_text):
+        """응답을 구성원별로 저장 (plan_prompt.save_plan_output) 후 상태별 집계, 첫 구성원의 저장 결과 반환"""
+        saved = None
+        for input_path in members:
+            member_saved = save_plan_output(self.output_dir, Path(input_path).stem, output_text)
+            self.stats[member_saved["status"]] += 1
+            saved = saved or member_saved
+        return saved
+
+    @staticmethod
+    def _is_retryable(error):
+        if isinstance(error, anthropic.APIStatusError):
+            return error.status_code in RETRYABLE_STATUS
+        # 연결 오류 / 타임아웃
+        return True
+
+    def _retry_delay(self, error, attempt):
+        """retry-after 헤더 우선, 없으면 지수 백오프 + Full Jitter"""
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after is not None:
+                try:
+                    return min(max(float(retry_after), 0.0), self.max_delay)
+                except ValueError:
+                    pass
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(backoff / 2, backoff)
+
+
+async def run_async(args):
+    client = anthropic.AsyncAnthropic(
+        api_key=args.api_key or os.getenv("ANTHROPIC_API_KEY"),
+        base_url=args.base_url,
+        timeout=args.timeout,
+        max_retries=0,
+    )
+    cache = None
+    if not args.no_cache:
+        cache = PlanCache(args.cache_dir, ttl=args.cache_ttl, max_entries=args.cache_max_entries)
+
+    async with client:
+        runner = AsyncPlanRunner(
+            client,
+            concurrency=args.concurrency,
+            max_attempts=args.max_attempts,
+            base_delay=args.base_delay,
+            output_dir=args.output_dir,
+            model=args.model,
+            cache=cache,
+            stream=args.stream,
+        )
+        start = time.perf_counter()
+        await runner.run(args.inputs, bucketer=bucketer_from_args(args))
+        elapsed = time.perf_counter() - start
+
+    stats = runner.stats
+    print(f"완료: {len(args.inputs)}건 / {elapsed:.2f}s - JSON {stats['ok']}, 부분 복구 {stats['partial']}, raw {stats['raw']}, "
+          f"실패 {stats['failed']}, 캐시 적중 {stats['cached']}, 재시도 {stats['retries']}회 (대기 {stats['wait_s']:.1f}s)")
+    print(f"입력: {stats['input_bytes']:,} bytes (추정 {stats['input_tokens_est']:,} tokens) / "
+          f"usage: 입력 {stats['input_tokens']:,}, 캐시 생성 {stats['cache_creation_input_tokens']:,}, "
+          f"캐시 적중 {stats['cache_read_input_tokens']:,}, 출력 {stats['output_tokens']:,} tokens")
+    return 1 if stats["failed"] else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="분석 결과 JSON -> 운동/식단 계획 (비동기 일괄 요청)")
+    parser.add_argument("inputs", nargs="+", help="분석 결과 JSON 파일 (json/sample*.json 형태)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 요청 최대 수")
+    parser.add_argument("--max-attempts", type=int, default=6, help="요청당 최대 시도 횟수")
+    parser.add_argument("--base-delay", type=float, default=1.0, help="백오프 기준 대기 시간(초)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청 타임아웃(초)")
+    parser.add_argument("--model", default=MODEL)
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("--base-url", default=None, help="API 주소 (로컬 stub_server.py 테스트용)")
+    parser.add_argument("--api-key", default=None, help="기본값: 환경변수 ANTHROPIC_API_KEY")
+    parser.add_argument("--stream", action="store_true", help="스트리밍 응답 + 요일 단위 점진 파싱")
+    add_bucket_arguments(parser)
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="응답 캐시 디렉토리")
+    parser.add_argument("--cache-ttl", type=float, default=7 * 24 * 3600, help="캐시 유효 시간(초)")
+    parser.add_argument("--cache-max-entries", type=int, default=10000, help="캐시 최대 항목 수")
+    parser.add_argument("--no-cache", action="store_true", help="응답 캐시 사용 안 함")
+    args = parser.parse_args(argv)
+    return asyncio.run(run_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""
+[운동/식단 계획 일괄(Batch) 생성]
+
+주간 재계획처럼 즉시 응답이 필요 없는 대량 요청을 Message Batches API용 요청 파일로 만들고,
+처리 결과 파일을 다시 읽어 사용자 ID별 계획으로 저장하는 도구입니다. (네트워크 없이 동작)
+Batch 처리는 요청 단가가 낮고 제공자 측에서 비동기로 처리되므로, 대화형 요청의 최대 요청률(Rate)에도 영향을 주지 않습니다.
+
+Flow:
+    1. build   : 분석 결과(디렉토리의 *.json 또는 JSONL) -> 요청 JSONL + manifest
+                 - 같은 프롬프트(plan_cache.make_key 기준)는 요청 1건으로 묶고, manifest에 사용자 ID 목록을 기록합니다.
+                 - custom_id는 내용 해시 기반("plan-<키 앞 24자리>")이라 재실행해도 같은 값입니다.
+                 - --cache-dir를 주면 이미 캐시된 응답은 요청에서 제외합니다.
+                 - --dedupe를 주면 나이/체중 등 연속값을 구간 대표값으로 바꾼 뒤 묶습니다. (profile_dedup.py)
+    2. (제출)  : 요청 JSONL을 Message Batches API로 제출하고 결과 JSONL을 내려받습니다.
+    3. ingest  : 결과 JSONL + manifest -> 사용자별 <user_id>_output.json (test_claude.py와 같은 저장/검증 규칙)
+                 과 batch_index.jsonl(사용자별 상태)
+
+    fake-results : 요청 JSONL로부터 가짜 결과 JSONL 생성 (오프라인 테스트용, 오류/누락 비율 지정 가능)
+
+Input JSONL:
+    한 줄에 {"user_id": "...", "analysis": {...}} 또는 user_id 키가 포함된 분석 결과 딕셔너리
+
+Usage:
+    # 위치: experiments\llm\
+    python batch_jobs.py build json --out batch/requests.jsonl
+    python batch_jobs.py fake-results batch/requests.jsonl --out batch/results.jsonl --errored-ratio 0.1
+    python batch_jobs.py ingest batch/requests.manifest.json batch/results.jsonl --output-dir batch/outputs
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+from plan_cache import PlanCache, make_key
+from plan_prompt import DEFAULT_COMPILER, MAX_TOKENS, MODEL, save_plan_output
+from profile_dedup import add_bucket_arguments, bucketer_from_args, compression_stats, format_stats
+from stub_server import STUB_PLAN
+
+# Message Batches 제한: 배치당 최대 요청 수
+MAX_REQUESTS_PER_BATCH = 100000
+
+_UNSAFE_FILENAME = re.compile(r"[^\w.-]")
+
+
+def load_records(path):
+    """
+    분석 결과 로드
+
+    Args:
+        path: *.json이 있는 디렉토리(사용자 ID = 파일명) 또는 JSONL 파일
+
+    Returns:
+        list[tuple]: (user_id, analysis)
+    """
+    path = Path(path)
+    if path.is_dir():
+        records = []
+        for file in sorted(path.glob("*.json")):
+            with open(file, "r", encoding="utf-8") as f:
+                records.append((file.stem, json.load(f)))
+        return records
+
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            user_id = record.get("user_id", record.get("id"))
+            if user_id is None:
+                raise ValueError(f"{path}:{line_no}: user_id가 없습니다.")
+            if "analysis" in record:
+                analysis = record["analysis"]
+            else:
+                analysis = {k: v for k, v in record.items() if k not in ("user_id", "id")}
+            records.append((str(user_id), analysis))
+    return records
+
+
+def custom_id_for(key):
+    """내용 키 -> Batch custom_id (영문/숫자/-/_ 64자 이내)"""
+    return f"plan-{key[:24]}"
+
+
+def build(records, out_path, model=MODEL, max_tokens=MAX_TOKENS, compiler=DEFAULT_COMPILER,
+          cache=None, max_requests=MAX_REQUESTS_PER_BATCH, bucketer=None):
+    """
+    요청 JSONL + manifest 생성 (bucketer: profile_dedup.ProfileBucketer, 주면 구간 대표값으로 요청)
+
+    Returns:
+        dict: manifest ({"model", "max_tokens", "created", "files", "requests": {custom_id: {"key", "users", "cached"}}})
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    entries = {}
+    params = {}
+    for user_id, analysis in records:
+        if bucketer is not None:
+            analysis = bucketer.representative(analysis)
+        key = make_key(analysis, model, template=compiler.template, max_tokens=max_tokens)
+        custom_id = custom_id_for(key)
+        entry = entries.get(custom_id)
+        if entry is None:
+            cached = cache is not None and cache.get(key) is not None
+            entry = entries[custom_id] = {"key": key, "users": [], "cached": cached}
+            if not cached:
+                params[custom_id] = {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "messages": compiler.build_messages(analysis),
+                }
+        entry["users"].append(user_id)
+
+    # 배치당 요청 수 제한을 넘으면 파일을 나눕니다. (requests.jsonl, requests-001.jsonl, ...)
+    files = []
+    items = list(params.items())
+    for part, begin in enumerate(range(0, max(len(items), 1), max_requests)):
+        path = out_path if part == 0 else out_path.with_name(f"{out_path.stem}-{part:03d}{out_path.suffix}")
+        with open(path, "w", encoding="utf-8") as f:
+            for custom_id, request_params in items[begin:begin + max_requests]:
+                f.write(json.dumps({"custom_id": custom_id, "params": request_params}, ensure_ascii=False) + "\n")
+        files.append(path.name)
+
+    manifest = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "created": time.time(),
+        "files": files,
+        "requests": entries,
+    }
+    with open(manifest_path_for(out_path), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def manifest_path_for(requests_path):
+    requests_path = Path(requests_path)
+    return requests_path.with_name(f"{requests_path.stem}.manifest.json")
+
+
+def fake_results(requests_paths, out_path, errored_ratio=0.0, missing_ratio=0.0, seed=0):
+    """
+    요청 JSONL -> 가짜 결과 JSONL (Message Batches 결과 형식, 순서는 섞임)
+
+    Returns:
+        int: 기록한 결과 수
+    """
+    rng = random.Random(seed)
+    text = json.dumps(STUB_PLAN, ensure_ascii=False, indent=2)
+    results = []
+    for requests_path in requests_paths:
+        with open(requests_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                request = json.loads(line)
+                if rng.random() < missing_ratio:
+                    continue
+                if rng.random() < errored_ratio:
+                    result = {"type": "errored", "error": {"type": "error", "error": {
+                        "type": "overloaded_error", "message": "fake error"}}}
+                else:
+                    result = {"type": "succeeded", "message": {
+                        "id": f"msg_fake_{len(results):06d}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": request["params"]["model"],
+                        "content": [{"type": "text", "text": text}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": 0, "output_tokens": len(text) // 4},
+                    }}
+                results.append({"custom_id": request["custom_id"], "result": result})
+    rng.shuffle(results)
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        for result in results:
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+    return len(results)
+
+
+def ingest(manifest, results_paths, output_dir, cache=None):
+    """
+    결과 JSONL -> 사용자별 계획 저장
+
+    Returns:
+        list[dict]: 사용자별 {"user_id", "custom_id", "status", "path", "schema_errors" | "error"}
+            status: ok / partial / raw / errored / canceled / expired / missing
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    results = {}
+    for results_path in results_paths:
+        with open(results_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    item = json.loads(line)
+                    results[item["custom_id"]] = item["result"]
+
+    index = []
+    for custom_id, entry in manifest["requests"].items():
+        text = None
+        error = None
+        result = results.get(custom_id)
+        if entry.get("cached") and cache is not None:
+            text = cache.get(entry["key"])
+            status = "ok" if text is not None else "missing"
+        elif result is None:
+            status = "missing"
+        elif result["type"] == "succeeded":
+            text = "".join(block.get("text", "") for block in result["message"]["content"]
+                           if block.get("type") == "text")
+            status = "ok"
+        else:
+            status = result["type"]
+            error = result.get("error")
+
+        saved = None
+        for user_id in entry["users"]:
+            row = {"user_id": user_id, "custom_id": custom_id}
+            if text is None:
+                row.update(status=status, path=None, error=error)
+            else:
+                saved = save_plan_output(output_dir, _UNSAFE_FILENAME.sub("_", user_id), text)
+                row.update(saved)
+            index.append(row)
+
+        if saved is not None and saved["status"] == "ok" and cache is not None and not entry.get("cached"):
+            cache.put(entry["key"], text, model=manifest.get("model"))
+
+    with open(output_dir / "batch_index.jsonl", "w", encoding="utf-8") as f:
+        for row in index:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    return index
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="운동/식단 계획 Batch 요청 생성/결과 반영")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="분석 결과 -> Batch 요청 JSONL + manifest")
+    p_build.add_argument("input", help="분석 결과 디렉토리(*.json) 또는 JSONL")
+    p_build.add_argument("--out", type=Path, required=True, help="요청 JSONL 경로")
+    p_build.add_argument("--model", default=MODEL)
+    p_build.add_argument("--max-tokens", type=int, default=MAX_TOKENS)
+    p_build.add_argument("--max-requests", type=int, default=MAX_REQUESTS_PER_BATCH, help="파일당 최대 요청 수")
+    p_build.add_argument("--cache-dir", type=Path, default=None, help="응답 캐시 (캐시된 항목은 요청 제외)")
+    add_bucket_arguments(p_build)
+
+    p_fake = sub.add_parser("fake-results", help="요청 JSONL -> 가짜 결과 JSONL (오프라인 테스트)")
+    p_fake.add_argument("requests", nargs="+", type=Path)
+    p_fake.add_argument("--out", type=Path, required=True)
+    p_fake.add_argument("--errored-ratio", type=float, default=0.0)
+    p_fake.add_argument("--missing-ratio", type=float, default=0.0)
+    p_fake.add_argument("--seed", type=int, default=0)
+
+    p_ingest = sub.add_parser("ingest", help="결과 JSONL -> 사용자별 계획 저장")
+    p_ingest.add_argument("manifest", type=Path)
+    p_ingest.add_argument("results", nargs="+", type=Path)
+    p_ingest.add_argument("--output-dir", type=Path, required=True)
+    p_ingest.add_argument("--cache-dir", type=Path, default=None, help="응답 캐시 (성공 결과 저장 / 캐시된 항목 조회)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        cache = PlanCache(args.cache_dir) if args.cache_dir else None
+        records = load_records(args.input)
+        manifest = build(records, args.out, model=args.model, max_tokens=args.max_tokens,
+                         cache=cache, max_requests=args.max_requests, bucketer=bucketer_from_args(args))
+        entries = manifest["requests"].values()
+        pending = sum(1 for e in entries if not e["cached"])
+        print(format_stats(compression_stats([{"members": e["users"]} for e in entries])))
+        print(f"캐시 {len(manifest['requests']) - pending}건 제외, 요청 {pending}건 -> {', '.join(manifest['files'])}")
+        return 0
+
+    if args.command == "fake-results":
+        count = fake_results(args.requests, args.out, args.errored_ratio, args.missing_ratio, args.seed)
+        print(f"가짜 결과 {count}건 -> {args.out}")
+        return 0
+
+    with open(args.manifest, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    cache = PlanCache(args.cache_dir) if args.cache_dir else None
+    index = ingest(manifest, args.results, args.output_dir, cache=cache)
+    counts = {}
+    for row in index:
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+    print(f"사용자 {len(index)}명: " + ", ".join(f"{k} {v}" for k, v in sorted(counts.items())))
+    failed = sum(v for k, v in counts.items() if k not in ("ok", "partial"))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+[운동/식단 계획 응답 캐시 (Content-addressed)]
+
+프롬프트는 규칙기반 분석 결과로 완전히 결정되므로, 같은 분석 결과에 대한 LLM 응답을 디스크에 저장해
+재사용합니다. 키는 (정규화된 입력 JSON, 프롬프트 템플릿, 모델명, max_tokens)의 SHA-256 해시이며,
+템플릿이나 모델이 바뀌면 키가 달라져 기존 항목은 자연스럽게 사용되지 않습니다.
+
+Eviction:
+    - TTL: 저장 후 ttl초가 지난 항목은 조회 시 삭제합니다. (ttl=None이면 만료 없음)
+    - 크기: 항목 수(max_entries) 또는 총 용량(max_bytes)을 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+      (조회 적중 시 파일 수정 시각을 갱신하여 LRU 순서로 사용)
+
+Storage:
+    cache_dir/<키 앞 2자리>/<키>.json - {"created", "model", "output_text"}
+    임시 파일에 쓴 뒤 os.replace()로 교체하므로 여러 프로세스가 같은 디렉토리를 써도 깨진 항목이 남지 않습니다.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from plan_prompt import MAX_TOKENS, PLAN_PROMPT_TEMPLATE, canonical_json
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".plan_cache"
+
+
+def make_key(analysis, model, template=PLAN_PROMPT_TEMPLATE, max_tokens=MAX_TOKENS):
+    """캐시 키 (SHA-256 hex)"""
+    h = hashlib.sha256()
+    for part in (canonical_json(analysis), template, model, str(max_tokens)):
+        data = part.encode("utf-8")
+        # 구분자 충돌을 막기 위해 각 부분의 길이를 함께 해시합니다.
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+class PlanCache:
+    """
+    [디스크 응답 캐시]
+
+    Args:
+        cache_dir (Path): 저장 디렉토리
+        ttl (float): 항목 유효 시간(초), None이면 만료 없음
+        max_entries (int): 최대 항목 수 (None이면 제한 없음)
+        max_bytes (int): 최대 총 용량 (None이면 제한 없음)
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl=7 * 24 * 3600, max_entries=10000, max_bytes=None):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 키 -> (마지막 사용 시각, 파일 크기). 시작 시 한 번만 디렉토리를 읽습니다.
+        self._index = {}
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            self._index[path.stem] = (st.st_mtime, st.st_size)
+        self._total_bytes = sum(size for _, size in self._index.values())
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """캐시된 응답 텍스트 (없거나 만료되었으면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+            self.misses += 1
+            return None
+
+        now = time.time()
+        if self.ttl is not None and now - entry.get("created", 0) > self.ttl:
+            self._remove(key)
+            self.expired += 1
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path, (now, now))
+        except FileNotFoundError:
+            pass
+        if key in self._index:
+            self._index[key] = (now, self._index[key][1])
+        self.hits += 1
+        return entry["output_text"]
+
+    def put(self, key, output_text, model=None):
+        """응답 텍스트 저장 후 크기 제한 초과분 정리"""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        data = json.dumps(
+            {"created": time.time(), "model": model, "output_text": output_text}, ensure_ascii=False
+        ).encode("utf-8")
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        old = self._index.get(key)
+        if old is not None:
+            self._total_bytes -= old[1]
+        self._index[key] = (time.time(), len(data))
+        self._total_bytes += len(data)
+        self._evict()
+
+    def _evict(self):
+        over_entries = self.max_entries is not None and len(self._index) > self.max_entries
+        over_bytes = self.max_bytes is not None and self._total_bytes > self.max_bytes
+        if not (over_entries or over_bytes):
+            return
+        for key, _ in sorted(self._index.items(), key=lambda item: item[1][0]):
+            if (self.max_entries is None or len(self._index) <= self.max_entries) and \
+                    (self.max_bytes is None or self._total_bytes <= self.max_bytes):
+                break
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key):
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "entries": len(self._index),
+            "bytes": self._total_bytes,
+        }
@@ -0,0 +1,229 @@
+"""
+[운동/식단 계획 프롬프트]
+
+규칙기반 체형 분석 결과(json/sample*.json, BodyCompositionAnalyzer.analyze_report() 형태)를
+LLM 요청 프롬프트로 만들고, 응답 텍스트를 JSON으로 해석하는 공용 모듈입니다.
+(test_claude.py / async_runner.py / batch_jobs.py 공용)
+
+Prompt Compiler:
+    템플릿은 입력 자리표시자({input_json_str}) 앞의 정적 부분(역할/규칙/출력 스키마)과 입력 부분으로 나뉩니다.
+    PromptCompiler는 정적 부분을 한 번만 만들어 두고, 요청마다 분석 결과의 압축 정규화 JSON만 붙입니다.
+    정적 부분은 별도 content block으로 보내며 cache_control을 표시해 API의 Prompt Caching 대상이 되도록 합니다.
+    (모델별 최소 캐시 길이보다 짧으면 API가 캐시하지 않고 일반 요청으로 처리합니다.)
+"""
+
+import json
+import re
+from pathlib import Path
+
+from stream_parser import parse_text
+
+MODEL = "claude-sonnet-4-20250514"
+MAX_TOKENS = 1020
+
+INPUT_PLACEHOLDER = "{input_json_str}"
+
+PLAN_PROMPT_TEMPLATE = """
+역할:
+너는 규칙기반 체형 분석 결과를 입력으로 받아
+운동 계획과 식단을 생성하는 생성 전용 모듈이다.
+
+입력 설명:
+아래 입력 JSON은 규칙기반 알고리즘을 통해 생성된 결과이다.
+stage1_type, stage2_type, stage3는 이미 확정된 값이며,
+이를 수정하거나 재해석해서는 안 된다.
+
+금지 규칙:
+- 체형 재분류 금지
+- 입력 값 수정 금지
+- 의학적 진단 또는 치료 표현 금지
+- 자연어 설명을 JSON 외부에 출력 금지
+
+출력 규칙:
+- 반드시 JSON만 출력
+- 아래 출력 스키마를 정확히 따를 것
+
+출력 스키마:
+{
+  "exercise_plan": {
+    "weekly_goal": string,
+    "weekly_schedule": [
+      {
+        "day": string,
+        "focus": string,
+        "exercises": [
+          {
+            "name": string,
+            "sets": number,
+            "reps": number,
+            "note": string
+          }
+        ]
+      }
+    ]
+  },
+  "diet_plan": {
+    "daily_calorie_target": number,
+    "macros": {
+      "carbs": string,
+      "protein": string,
+      "fat": string
+    },
+    "guidelines": [string]
+  },
+  "explanation": string
+}
+
+
+입력:
+{input_json_str}
+"""
+
+# 토큰 수 추정 (오프라인 근사치: ASCII 4자당 1토큰, 한글 등 비 ASCII 문자는 1자당 1토큰)
+ASCII_CHARS_PER_TOKEN = 4
+
+# 응답이 ```json ... ``` 코드 블록으로 감싸진 경우
+_CODE_FENCE = re.compile(r"^\s*```[a-zA-Z]*\s*\n(.*?)\n?```\s*$", re.DOTALL)
+
+
+def canonical_json(analysis):
+    """압축 정규화 JSON (키 정렬, 공백 제거, 정수값 float은 정수로 통일)"""
+    return json.dumps(_normalize(analysis), ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def _normalize(value):
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        # 68과 68.0은 같은 의미이므로 같은 텍스트로 표현합니다.
+        return int(value)
+    return value
+
+
+def estimate_tokens(text):
+    """입력 토큰 수 근사치 (정확한 값은 응답의 usage 또는 count_tokens API 사용)"""
+    ascii_chars = sum(1 for ch in text if ch < "\x80")
+    return -(-ascii_chars // ASCII_CHARS_PER_TOKEN) + (len(text) - ascii_chars)
+
+
+class PromptCompiler:
+    """
+    [프롬프트 컴파일러]
+    템플릿의 정적 부분을 미리 만들어 두고 요청별 입력만 붙여 메시지를 구성합니다.
+
+    Args:
+        template (str): INPUT_PLACEHOLDER를 정확히 한 번 포함하는 템플릿
+        cache_static (bool): 정적 부분에 cache_control 표시 여부
+    """
+
+    def __init__(self, template=PLAN_PROMPT_TEMPLATE, cache_static=True):
+        if template.count(INPUT_PLACEHOLDER) != 1:
+            raise ValueError(f"템플릿에 {INPUT_PLACEHOLDER}가 정확히 한 번 있어야 합니다.")
+        self.template = template
+        self.static_prefix, self.suffix = template.split(INPUT_PLACEHOLDER)
+        self.static_block = {"type": "text", "text": self.static_prefix}
+        if cache_static:
+            self.static_block["cache_control"] = {"type": "ephemeral"}
+        self.static_bytes = len(self.static_prefix.encode("utf-8"))
+        self.static_tokens = estimate_tokens(self.static_prefix)
+
+    def render(self, analysis):
+        """요청별 입력 부분 텍스트 (압축 정규화 JSON)"""
+        return canonical_json(analysis) + self.suffix
+
+    def build_text(self, analysis):
+        """정적 부분 + 입력 부분 전체 프롬프트 문자열"""
+        return self.static_prefix + self.render(analysis)
+
+    def build_messages(self, analysis):
+        """
+        messages.create()에 전달할 messages
+
+        Returns:
+            list[dict]: 사용자 메시지 1개 (정적 부분 block(캐시 표시) + 입력 block)
+        """
+        return [{
+            "role": "user",
+            "content": [self.static_block, {"type": "text", "text": self.render(analysis)}],
+        }]
+
+    def measure(self, analysis):
+        """
+        요청별 입력 크기
+
+        Returns:
+            dict: {"static_bytes", "dynamic_bytes", "total_bytes", "static_tokens_est", "dynamic_tokens_est", "total_tokens_est"}
+        """
+        dynamic = self.render(analysis)
+        dynamic_bytes = len(dynamic.encode("utf-8"))
+        dynamic_tokens = estimate_tokens(dynamic)
+        return {
+            "static_bytes": self.static_bytes,
+            "dynamic_bytes": dynamic_bytes,
+            "total_bytes": self.static_bytes + dynamic_bytes,
+            "static_tokens_est": self.static_tokens,
+            "dynamic_tokens_est": dynamic_tokens,
+            "total_tokens_est": self.static_tokens + dynamic_tokens,
+        }
+
+
+DEFAULT_COMPILER = PromptCompiler()
+
+
+def build_prompt(analysis):
+    """분석 결과 딕셔너리 -> 전체 프롬프트 문자열 (기본 템플릿)"""
+    return DEFAULT_COMPILER.build_text(analysis)
+
+
+def parse_plan_output(text):
+    """
+    응답 텍스트 -> 계획 딕셔너리 (완성된 JSON 객체가 없으면 None)
+
+    모델이 지시와 달리 코드 블록이나 앞말을 붙여 출력한 경우에도 내부 JSON을 해석합니다.
+    (중간에 끊긴 응답의 부분 복구는 stream_parser.parse_text() 사용)
+    """
+    match = _CODE_FENCE.match(text)
+    if match:
+        text = match.group(1)
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    result = parse_text(text)
+    if result is None or result["truncated"]:
+        return None
+    return result["plan"]
+
+
+def save_plan_output(output_dir, stem, output_text):
+    """
+    응답 텍스트 저장 (plan_schema 검증 결과 포함)
+        - 완성된 JSON: <stem>_output.json (status "ok")
+        - 중간에 끊긴 JSON: 복구한 부분 결과 <stem>_output_partial.json + 원문 <stem>_output_raw.txt (status "partial")
+        - 그 외: 원문 <stem>_output_raw.txt (status "raw")
+
+    Returns:
+        dict: {"status", "path", "schema_errors"}
+    """
+    output_dir = Path(output_dir)
+    result = parse_text(output_text)
+    if result is not None and result["plan"] is not None and not result["truncated"]:
+        path = output_dir / f"{stem}_output.json"
+        _write_json(path, result["plan"])
+        return {"status": "ok", "path": str(path), "schema_errors": len(result["errors"])}
+
+    raw_path = output_dir / f"{stem}_output_raw.txt"
+    with open(raw_path, "w", encoding="utf-8") as f:
+        f.write(output_text)
+    if result is not None and result["plan"] is not None:
+        path = output_dir / f"{stem}_output_partial.json"
+        _write_json(path, result["plan"])
+        return {"status": "partial", "path": str(path), "schema_errors": len(result["errors"])}
+    return {"status": "raw", "path": str(raw_path), "schema_errors": None}
+
+
+def _write_json(path, obj):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
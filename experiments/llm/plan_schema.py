@@ -0,0 +1,73 @@
+"""
+[운동/식단 계획 출력 스키마 검증]
+
+plan_prompt.PLAN_PROMPT_TEMPLATE의 '출력 스키마'를 코드로 표현하고, LLM 응답(또는 스트리밍 중 완성된 일부)을
+검증하는 모듈입니다. 검증 결과는 예외 대신 오류 메시지 리스트로 반환합니다. (빈 리스트 = 통과)
+"""
+
+STRING = "string"
+NUMBER = "number"
+
+EXERCISE_SCHEMA = {"name": STRING, "sets": NUMBER, "reps": NUMBER, "note": STRING}
+
+DAY_SCHEMA = {"day": STRING, "focus": STRING, "exercises": [EXERCISE_SCHEMA]}
+
+PLAN_SCHEMA = {
+    "exercise_plan": {
+        "weekly_goal": STRING,
+        "weekly_schedule": [DAY_SCHEMA],
+    },
+    "diet_plan": {
+        "daily_calorie_target": NUMBER,
+        "macros": {"carbs": STRING, "protein": STRING, "fat": STRING},
+        "guidelines": [STRING],
+    },
+    "explanation": STRING,
+}
+
+
+def validate(value, schema, path="$"):
+    """
+    값을 스키마로 검증
+
+    Args:
+        value: 검증할 값
+        schema: STRING / NUMBER / [항목 스키마] / {키: 스키마}
+        path (str): 오류 메시지에 표시할 위치
+
+    Returns:
+        list[str]: 오류 메시지 ("<위치>: <내용>")
+    """
+    if schema == STRING:
+        return [] if isinstance(value, str) else [f"{path}: 문자열이 아님 ({type(value).__name__})"]
+    if schema == NUMBER:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return []
+        return [f"{path}: 숫자가 아님 ({type(value).__name__})"]
+    if isinstance(schema, list):
+        if not isinstance(value, list):
+            return [f"{path}: 리스트가 아님 ({type(value).__name__})"]
+        errors = []
+        for i, item in enumerate(value):
+            errors.extend(validate(item, schema[0], f"{path}[{i}]"))
+        return errors
+
+    if not isinstance(value, dict):
+        return [f"{path}: 객체가 아님 ({type(value).__name__})"]
+    errors = []
+    for key, sub_schema in schema.items():
+        if key not in value:
+            errors.append(f"{path}.{key}: 누락")
+        else:
+            errors.extend(validate(value[key], sub_schema, f"{path}.{key}"))
+    return errors
+
+
+def validate_day(day, index=0):
+    """weekly_schedule 항목 1개 검증"""
+    return validate(day, DAY_SCHEMA, f"$.exercise_plan.weekly_schedule[{index}]")
+
+
+def validate_plan(plan):
+    """계획 전체 검증"""
+    return validate(plan, PLAN_SCHEMA)
@@ -0,0 +1,166 @@
+"""
+[분석 결과 동치류(Equivalence Class) 묶기]
+
+LLM 입력은 대부분 범주형 값(stage1_type, stage2_type, 부위별 등급, stage3)이며, 연속값은
+나이/체중(basic_info)과 BMI/골격근 비율(stage1_2) 정도입니다. 연속값을 구간(bucket)의 대표값으로 바꾸면
+같은 프롬프트가 되는 분석 결과끼리 묶을 수 있고, 동치류마다 LLM 요청 1건만 보낸 뒤 결과를 구성원 전체에 나눠 줍니다.
+
+Bucketing:
+    - 필드별 구간 너비는 ProfileBucketer(widths={...})로 지정합니다. (DEFAULT_WIDTHS 참고)
+    - 구간 대표값은 구간 중앙값입니다. (예: 나이 너비 10 -> 63세는 [60, 70) 구간, 대표값 65)
+    - 너비가 0 또는 None이면 원래 값을 그대로 사용하고, 숫자가 아닌 값(None 등)도 그대로 둡니다.
+
+Usage:
+    # 위치: experiments\llm\
+    python profile_dedup.py json --age-bucket 10 --weight-bucket 5
+    # Batch / 비동기 실행기에서 사용
+    python batch_jobs.py build users.jsonl --out batch/requests.jsonl --dedupe --age-bucket 10
+    python async_runner.py json/*.json --dedupe --age-bucket 10
+"""
+
+import argparse
+import copy
+import json
+import math
+import sys
+
+from plan_prompt import canonical_json
+
+# (섹션, 필드) -> 구간 너비
+DEFAULT_WIDTHS = {
+    ("basic_info", "age"): 10,
+    ("basic_info", "weight_kg"): 5.0,
+    ("stage1_2", "bmi"): 1.0,
+    ("stage1_2", "smm_ratio"): 0.02,
+}
+
+
+class ProfileBucketer:
+    """
+    [연속값 구간화]
+
+    Args:
+        widths (dict): {(섹션, 필드): 구간 너비} (기본값: DEFAULT_WIDTHS, 일부만 주면 나머지는 기본값)
+    """
+
+    def __init__(self, widths=None):
+        self.widths = dict(DEFAULT_WIDTHS)
+        if widths:
+            self.widths.update(widths)
+
+    def representative(self, analysis):
+        """구간 대표값으로 바꾼 분석 결과 (원본은 수정하지 않음)"""
+        result = copy.deepcopy(analysis)
+        for (section, field), width in self.widths.items():
+            block = result.get(section)
+            if isinstance(block, dict) and field in block:
+                block[field] = self.bucket_value(block[field], width)
+        return result
+
+    @staticmethod
+    def bucket_value(value, width):
+        """값 -> 구간 중앙값 (너비가 없거나 숫자가 아니면 그대로)"""
+        if not width or isinstance(value, bool) or not isinstance(value, (int, float)):
+            return value
+        if not math.isfinite(value):
+            return value
+        center = (math.floor(value / width) + 0.5) * width
+        # 부동소수점 오차로 키가 달라지지 않도록 너비의 소수 자릿수 + 1자리로 반올림합니다.
+        digits = max(0, -math.floor(math.log10(width))) + 1
+        center = round(center, digits)
+        return int(center) if float(center).is_integer() else center
+
+    def class_key(self, analysis):
+        """동치류 키 (대표 분석 결과의 정규화 JSON)"""
+        return canonical_json(self.representative(analysis))
+
+
+def group_profiles(records, bucketer):
+    """
+    (사용자 ID, 분석 결과) 목록 -> 동치류 목록
+
+    Returns:
+        list[dict]: 처음 등장한 순서대로 {"key", "representative", "members": [사용자 ID]}
+    """
+    classes = {}
+    for user_id, analysis in records:
+        representative = bucketer.representative(analysis)
+        key = canonical_json(representative)
+        profile_class = classes.get(key)
+        if profile_class is None:
+            profile_class = classes[key] = {"key": key, "representative": representative, "members": []}
+        profile_class["members"].append(user_id)
+    return list(classes.values())
+
+
+def compression_stats(classes):
+    """
+    묶음 통계
+
+    Returns:
+        dict: {"records", "classes", "compression_ratio", "calls_saved", "largest_class", "singletons"}
+    """
+    records = sum(len(c["members"]) for c in classes)
+    sizes = [len(c["members"]) for c in classes]
+    return {
+        "records": records,
+        "classes": len(classes),
+        "compression_ratio": records / len(classes) if classes else 1.0,
+        "calls_saved": records - len(classes),
+        "largest_class": max(sizes, default=0),
+        "singletons": sum(1 for s in sizes if s == 1),
+    }
+
+
+def format_stats(stats):
+    return (f"분석 {stats['records']}건 -> 동치류 {stats['classes']}개 "
+            f"(압축률 {stats['compression_ratio']:.2f}x, 요청 {stats['calls_saved']}건 절감, "
+            f"최대 {stats['largest_class']}명, 단독 {stats['singletons']}개)")
+
+
+def add_bucket_arguments(parser):
+    """구간 너비 CLI 옵션 추가 (batch_jobs.py / async_runner.py 공용)"""
+    parser.add_argument("--dedupe", action="store_true", help="연속값 구간화 후 같은 프롬프트끼리 묶어 1회만 요청")
+    parser.add_argument("--age-bucket", type=float, default=DEFAULT_WIDTHS[("basic_info", "age")],
+                        help="나이 구간 너비 (0이면 원래 값)")
+    parser.add_argument("--weight-bucket", type=float, default=DEFAULT_WIDTHS[("basic_info", "weight_kg")],
+                        help="체중 구간 너비(kg)")
+    parser.add_argument("--bmi-bucket", type=float, default=DEFAULT_WIDTHS[("stage1_2", "bmi")],
+                        help="BMI 구간 너비")
+    parser.add_argument("--smm-ratio-bucket", type=float, default=DEFAULT_WIDTHS[("stage1_2", "smm_ratio")],
+                        help="골격근 비율 구간 너비")
+
+
+def bucketer_from_args(args):
+    """CLI 옵션 -> ProfileBucketer (--dedupe가 없으면 None)"""
+    if not args.dedupe:
+        return None
+    return ProfileBucketer({
+        ("basic_info", "age"): args.age_bucket,
+        ("basic_info", "weight_kg"): args.weight_bucket,
+        ("stage1_2", "bmi"): args.bmi_bucket,
+        ("stage1_2", "smm_ratio"): args.smm_ratio_bucket,
+    })
+
+
+def main(argv=None):
+    from batch_jobs import load_records
+
+    parser = argparse.ArgumentParser(description="분석 결과 동치류 묶기 통계")
+    parser.add_argument("input", help="분석 결과 디렉토리(*.json) 또는 JSONL")
+    parser.add_argument("--out", default=None, help="동치류 JSONL 저장 경로 ({key, representative, members})")
+    add_bucket_arguments(parser)
+    args = parser.parse_args(argv)
+    args.dedupe = True
+
+    classes = group_profiles(load_records(args.input), bucketer_from_args(args))
+    print(format_stats(compression_stats(classes)))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            for profile_class in classes:
+                f.write(json.dumps(profile_class, ensure_ascii=False) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+[스트리밍 계획 응답 파서 (Incremental JSON)]
+
+LLM 응답 텍스트를 조각(chunk) 단위로 받아 JSON 구조를 점진적으로 추적하는 파서입니다.
+응답 전체를 기다리지 않고 exercise_plan.weekly_schedule의 요일 항목이 완성되는 즉시 검증하여 전달합니다.
+
+Recovery:
+    - 첫 '{' 이전의 텍스트(```json 코드 블록 시작, 앞말 등)와 최상위 객체가 끝난 뒤의 텍스트는 무시합니다.
+    - 응답이 중간에 끊긴 경우(max_tokens 도달 등) 마지막으로 완성된 항목까지만 남기고 열린 괄호를 닫아
+      부분 결과를 만듭니다. (truncated=True, 스키마 검증 오류에 누락 항목이 표시됨)
+      배열 항목인 객체/배열(요일, 운동 항목 등)은 닫는 괄호까지 완성된 경우에만 남기며, 끊긴 항목은 통째로 버립니다.
+      (이름/세트 수가 빠진 운동 항목처럼 일부만 있는 항목이 UI로 전달되지 않도록)
+
+Events (feed()/close() 반환값):
+    {"type": "day", "index", "day", "errors"}                    - 요일 항목 완성
+    {"type": "plan", "plan", "errors", "truncated"}             - 최상위 객체 완성 (또는 close() 시 복구된 부분 결과)
+"""
+
+import json
+import re
+
+from plan_schema import validate_day, validate_plan
+
+# 문자열 밖에서 구조를 바꾸는 문자 / 문자열 안에서 멈춰야 하는 문자
+_STRUCTURAL = re.compile(r'[{}\[\]",]')
+_STRING_STOP = re.compile(r'["\\]')
+
+_CLOSER = {"{": "}", "[": "]"}
+
+# 요일 항목 위치: $ -> exercise_plan -> weekly_schedule -> [i]
+_DAY_PATH = ("exercise_plan", "weekly_schedule")
+
+
+class _Frame:
+    """
+    열린 객체/배열 1개
+    (kind: '{' 또는 '[', key: 객체에서 현재 값의 키, in_array: 배열의 항목인지 여부)
+    """
+    __slots__ = ("kind", "key", "expect_key", "start", "is_day", "in_array")
+
+    def __init__(self, kind, start, is_day=False, in_array=False):
+        self.kind = kind
+        self.key = None
+        self.expect_key = kind == "{"
+        self.start = start
+        self.is_day = is_day
+        self.in_array = in_array
+
+
+class PlanStreamParser:
+    """
+    [점진적 계획 파서]
+
+    Usage:
+        parser = PlanStreamParser()
+        for chunk in stream:
+            for event in parser.feed(chunk):
+                ...
+        final = parser.close()
+    """
+
+    def __init__(self):
+        self._buf = ""           # 최상위 '{'부터 누적된 텍스트
+        self._pos = 0            # 다음에 검사할 위치
+        self._stack = []
+        self._in_string = False
+        self._string_start = 0
+        self._started = False
+        self._result = None      # 완성된 최상위 객체 이벤트
+        self._cut = 0            # 부분 결과로 잘라낼 수 있는 마지막 위치
+        self._cut_closers = ""   # 그 위치에서 열려 있는 괄호를 닫는 문자열
+        self._open_items = 0     # 스택에서 아직 닫히지 않은 배열 항목(객체/배열) 수 (0일 때만 자를 수 있음)
+        self.days = 0
+
+    @property
+    def done(self):
+        return self._result is not None
+
+    def feed(self, chunk):
+        """응답 조각 추가 -> 새로 완성된 이벤트 리스트"""
+        if self._result is not None or not chunk:
+            return []
+        if not self._started:
+            start = chunk.find("{")
+            if start < 0:
+                return []
+            chunk = chunk[start:]
+            self._started = True
+        self._buf += chunk
+        return self._scan()
+
+    def close(self):
+        """
+        스트림 종료
+
+        Returns:
+            dict | None: 최종 "plan" 이벤트 (JSON 객체가 시작되지 않았거나 복구할 수 없으면 None)
+        """
+        if self._result is not None:
+            return self._result
+        if not self._started or self._cut == 0:
+            return None
+        try:
+            plan = json.loads(self._buf[:self._cut] + self._cut_closers)
+        except json.JSONDecodeError:
+            return None
+        return {"type": "plan", "plan": plan, "errors": validate_plan(plan), "truncated": True}
+
+    def _mark_cut(self, index):
+        """값 하나가 완성된 위치를 부분 결과의 끝으로 기록 (열린 배열 항목 안에서는 기록하지 않음)"""
+        if self._open_items:
+            return
+        self._cut = index
+        self._cut_closers = "".join(_CLOSER[f.kind] for f in reversed(self._stack))
+
+    def _scan(self):
+        events = []
+        buf = self._buf
+        n = len(buf)
+        pos = self._pos
+        stack = self._stack
+
+        while pos < n:
+            if self._in_string:
+                m = _STRING_STOP.search(buf, pos)
+                if m is None:
+                    pos = n
+                    break
+                if m.group() == "\\":
+                    # 이스케이프된 다음 문자는 건너뜁니다. (조각 경계에 걸쳐도 위치는 유효)
+                    pos = m.end() + 1
+                    continue
+                pos = m.end()
+                self._in_string = False
+                frame = stack[-1] if stack else None
+                if frame is not None and frame.kind == "{" and frame.expect_key:
+                    try:
+                        frame.key = json.loads(buf[self._string_start:pos])
+                    except json.JSONDecodeError:
+                        frame.key = None
+                    frame.expect_key = False
+                continue
+
+            m = _STRUCTURAL.search(buf, pos)
+            if m is None:
+                pos = n
+                break
+            ch = m.group()
+            i = m.start()
+            pos = i + 1
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch == "{" or ch == "[":
+                is_day = (
+                    ch == "{" and len(stack) == 3 and stack[2].kind == "["
+                    and (stack[0].key, stack[1].key) == _DAY_PATH
+                )
+                in_array = bool(stack) and stack[-1].kind == "["
+                stack.append(_Frame(ch, i, is_day, in_array))
+                self._open_items += in_array
+            elif ch == "}" or ch == "]":
+                if not stack:
+                    break
+                frame = stack.pop()
+                self._open_items -= frame.in_array
+                if frame.is_day:
+                    events.append(self._day_event(buf[frame.start:pos]))
+                if not stack:
+                    self._result = self._plan_event(buf[:pos])
+                    events.append(self._result)
+                    break
+                self._mark_cut(pos)
+            else:  # ","
+                if stack:
+                    if stack[-1].kind == "{":
+                        stack[-1].expect_key = True
+                    self._mark_cut(i)
+
+        self._pos = pos
+        return events
+
+    def _day_event(self, text):
+        index = self.days
+        self.days += 1
+        try:
+            day = json.loads(text)
+        except json.JSONDecodeError as e:
+            return {"type": "day", "index": index, "day": None, "errors": [f"JSON 파싱 실패: {e}"]}
+        return {"type": "day", "index": index, "day": day, "errors": validate_day(day, index)}
+
+    @staticmethod
+    def _plan_event(text):
+        try:
+            plan = json.loads(text)
+        except json.JSONDecodeError as e:
+            return {"type": "plan", "plan": None, "errors": [f"JSON 파싱 실패: {e}"], "truncated": False}
+        return {"type": "plan", "plan": plan, "errors": validate_plan(plan), "truncated": False}
+
+
+def parse_text(text):
+    """응답 전체 텍스트를 한 번에 파싱 (PlanStreamParser.close() 결과와 동일)"""
+    parser = PlanStreamParser()
+    parser.feed(text)
+    return parser.close()
@@ -0,0 +1,240 @@
+"""
+[Messages API 로컬 Stub 서버]
+
+async_runner.py 등을 API 키/비용 없이 테스트하기 위한 로컬 서버입니다. (표준 라이브러리만 사용)
+POST /v1/messages에 출력 스키마를 따르는 고정 계획 JSON을 응답하며,
+429(Rate Limit) / 529(Overloaded) 응답과 응답 지연을 설정으로 재현할 수 있습니다.
+GET /stats는 요청 수, 오류 응답 수, 최대 동시 처리 수를 반환합니다. (동시성 제한 확인용)
+요청에 "stream": true가 있으면 Messages API와 같은 SSE 이벤트(message_start ~ message_stop)로
+응답 텍스트를 chunk_size 글자씩 나누어 보냅니다. --truncate-at으로 max_tokens 도달(중간 끊김)을 재현할 수 있습니다.
+
+Usage:
+    # 위치: experiments\llm\
+    python stub_server.py --port 8765 --latency 0.2 --rate-limit-every 5 --retry-after 0.5
+    python stub_server.py --port 8765 --fenced --chunk-delay 0.02 --truncate-at 900
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_PLAN = {
+    "exercise_plan": {
+        "weekly_goal": "주 3회 전신 근력운동과 유산소 운동 병행",
+        "weekly_schedule": [
+            {
+                "day": day,
+                "focus": focus,
+                "exercises": [
+                    {"name": "스쿼트", "sets": 3, "reps": 12, "note": "무릎이 발끝을 넘지 않도록"},
+                    {"name": "푸시업", "sets": 3, "reps": 10, "note": "무릎 대고 시작 가능"},
+                ],
+            }
+            for day, focus in (("월요일", "하체"), ("수요일", "상체"), ("금요일", "전신"))
+        ],
+    },
+    "diet_plan": {
+        "daily_calorie_target": 2000,
+        "macros": {"carbs": "50%", "protein": "30%", "fat": "20%"},
+        "guidelines": ["단백질을 매 끼니 포함", "가공식품 섭취 줄이기"],
+    },
+    "explanation": "로컬 Stub 서버 응답입니다.",
+}
+
+
+class StubState:
+    """요청 집계 및 오류 주입 설정 (핸들러 스레드 간 공유)"""
+
+    def __init__(self, latency=0.0, rate_limit_every=0, overload_ratio=0.0, retry_after=None, fenced=False,
+                 chunk_size=16, chunk_delay=0.0, truncate_at=0):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.overload_ratio = overload_ratio
+        self.retry_after = retry_after
+        self.fenced = fenced
+        self.chunk_size = chunk_size
+        self.chunk_delay = chunk_delay
+        self.truncate_at = truncate_at
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.rate_limited = 0
+        self.overloaded = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "rate_limited": self.rate_limited,
+                "overloaded": self.overloaded,
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+            }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-Alive (클라이언트 연결 재사용 확인)
+    state = None
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            self._send_json(200, self.state.snapshot())
+        else:
+            self._send_json(404, _error_body("not_found_error", "unknown path"))
+
+    def do_POST(self):
+        length = int(self.headers.get("content-length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if self.path.split("?")[0].rstrip("/") != "/v1/messages":
+            self._send_json(404, _error_body("not_found_error", "unknown path"))
+            return
+
+        state = self.state
+        with state.lock:
+            state.requests += 1
+            number = state.requests
+            state.in_flight += 1
+            state.max_in_flight = max(state.max_in_flight, state.in_flight)
+        try:
+            if state.latency:
+                time.sleep(state.latency)
+            if state.rate_limit_every and number % state.rate_limit_every == 0:
+                with state.lock:
+                    state.rate_limited += 1
+                self._send_json(429, _error_body("rate_limit_error", "stub rate limit"), retry=True)
+                return
+            if state.overload_ratio and random.random() < state.overload_ratio:
+                with state.lock:
+                    state.overloaded += 1
+                self._send_json(529, _error_body("overloaded_error", "stub overloaded"), retry=True)
+                return
+            message = self._message(body, number)
+            if body.get("stream"):
+                self._send_stream(message)
+            else:
+                self._send_json(200, message)
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+    def _message(self, request, number):
+        text = json.dumps(STUB_PLAN, ensure_ascii=False, indent=2)
+        if self.state.fenced:
+            text = f"```json\n{text}\n```"
+        stop_reason = "end_turn"
+        if self.state.truncate_at and len(text) > self.state.truncate_at:
+            text = text[:self.state.truncate_at]
+            stop_reason = "max_tokens"
+        return {
+            "id": f"msg_stub_{number:06d}",
+            "type": "message",
+            "role": "assistant",
+            "model": request.get("model", "stub"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": stop_reason,
+            "stop_sequence": None,
+            "usage": {"input_tokens": len(json.dumps(request.get("messages", []))) // 4,
+                      "output_tokens": len(text) // 4},
+        }
+
+    def _send_stream(self, message):
+        """SSE 스트리밍 응답 (Transfer-Encoding: chunked)"""
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("transfer-encoding", "chunked")
+        self.end_headers()
+
+        text = message["content"][0]["text"]
+        usage = message["usage"]
+        start = dict(message, content=[], stop_reason=None, usage=dict(usage, output_tokens=0))
+        self._send_event("message_start", {"type": "message_start", "message": start})
+        self._send_event("content_block_start", {
+            "type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""},
+        })
+        size = max(1, self.state.chunk_size)
+        for i in range(0, len(text), size):
+            if self.state.chunk_delay:
+                time.sleep(self.state.chunk_delay)
+            self._send_event("content_block_delta", {
+                "type": "content_block_delta", "index": 0,
+                "delta": {"type": "text_delta", "text": text[i:i + size]},
+            })
+        self._send_event("content_block_stop", {"type": "content_block_stop", "index": 0})
+        self._send_event("message_delta", {
+            "type": "message_delta",
+            "delta": {"stop_reason": message["stop_reason"], "stop_sequence": None},
+            "usage": {"output_tokens": usage["output_tokens"]},
+        })
+        self._send_event("message_stop", {"type": "message_stop"})
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_event(self, event, data):
+        payload = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+        self.wfile.write(f"{len(payload):x}\r\n".encode("ascii") + payload + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, status, payload, retry=False):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        if retry and self.state.retry_after is not None:
+            self.send_header("retry-after", str(self.state.retry_after))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _error_body(error_type, message):
+    return {"type": "error", "error": {"type": error_type, "message": message}}
+
+
+def make_server(host="127.0.0.1", port=8765, **options):
+    """Stub 서버 생성 (port=0이면 임의 포트, server.server_address로 확인)"""
+    handler = type("BoundStubHandler", (StubHandler,), {"state": StubState(**options)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Messages API 로컬 Stub 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="N번째 요청마다 429 응답 (0이면 사용 안 함)")
+    parser.add_argument("--overload-ratio", type=float, default=0.0, help="529 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=None, help="오류 응답의 retry-after 헤더(초)")
+    parser.add_argument("--fenced", action="store_true", help="응답 JSON을 ```json 코드 블록으로 감싸기")
+    parser.add_argument("--chunk-size", type=int, default=16, help="스트리밍 조각 크기(글자)")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="스트리밍 조각 사이 지연(초)")
+    parser.add_argument("--truncate-at", type=int, default=0, help="응답 텍스트를 N글자에서 자르기 (max_tokens 재현)")
+    args = parser.parse_args(argv)
+
+    server = make_server(
+        args.host, args.port,
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every,
+        overload_ratio=args.overload_ratio,
+        retry_after=args.retry_after,
+        fenced=args.fenced,
+        chunk_size=args.chunk_size,
+        chunk_delay=args.chunk_delay,
+        truncate_at=args.truncate_at,
+    )
+    print(f"Stub 서버 실행: http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.RequestHandlerClass.state.snapshot()))
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()